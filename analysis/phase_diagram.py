@@ -14,7 +14,7 @@ import math
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine.ramanash_beast import beast_from_market, beast_run
+from engine.ramanash_beast import beast_from_market, beast_ensemble
 from engine.ramanash_systemic import systemic_stress_full
 from engine.ramanash_kernel import predict_macro
 
@@ -29,6 +29,7 @@ def _synthetic_stress(n=500, seed=42):
 def run_phase_sweep(gamma_vals, eta_vals, data_path=None):
     """
     Sweep γ × η. Return dict: (γ, η) -> {mean_abs_f, tail_freq, var_s}.
+    The whole grid is one beast_ensemble call.
     """
     if data_path and os.path.exists(data_path):
         with open(data_path) as f:
@@ -37,8 +38,7 @@ def run_phase_sweep(gamma_vals, eta_vals, data_path=None):
         prices = data['prices']
         vols = _rolling_volatility(prices, window=20)
         macro = {"media_sentiment": -0.5, "spending_habits": 0.5, "war_conflict": 0.5, "materials_avail": 0.5}
-        steps_source = beast_from_market(prices, vols, macro)
-        n = len(steps_source)
+        n = len(beast_from_market(prices, vols, macro, as_frame=True))
         lci_list = _synthetic_stress(n, 42)
         lsi_list = _synthetic_stress(n, 43)
         csi_list = _synthetic_stress(n, 44)
@@ -52,21 +52,17 @@ def run_phase_sweep(gamma_vals, eta_vals, data_path=None):
         fsi_list = _synthetic_stress(n, 45)
         macro_list = [-0.2] * n
 
+    grid = beast_ensemble(
+        lci_list, lsi_list, csi_list, fsi_list, macro_list,
+        gamma=gamma_vals, eta=eta_vals,
+    )
     results = {}
-    for gamma in gamma_vals:
-        for eta in eta_vals:
-            steps = beast_run(lci_list, lsi_list, csi_list, fsi_list, macro_list, gamma=gamma, eta=eta)
-            abs_f = [abs(s["crisis_field"]) for s in steps]
-            tail_count = sum(1 for f in abs_f if f > 0.8)
-            var_s = 0
-            if len(steps) > 1:
-                stresses = [s["stress"] for s in steps]
-                mean_s = sum(stresses) / len(stresses)
-                var_s = sum((x - mean_s) ** 2 for x in stresses) / len(stresses)
+    for gi, gamma in enumerate(gamma_vals):
+        for ei, eta in enumerate(eta_vals):
             results[(gamma, eta)] = {
-                "mean_abs_f": sum(abs_f) / len(abs_f) if abs_f else 0,
-                "tail_freq": tail_count / len(steps) if steps else 0,
-                "var_s": var_s,
+                "mean_abs_f": float(grid["mean_abs_f"][gi, 0, ei]),
+                "tail_freq": float(grid["tail_freq"][gi, 0, ei]),
+                "var_s": float(grid["var_s"][gi, 0, ei]),
             }
     return results
 
@@ -74,11 +70,9 @@ def run_phase_sweep(gamma_vals, eta_vals, data_path=None):
 def critical_gamma(eta=0.25, tail_thresh=0.05, n_points=20):
     """Find smallest γ such that P(|F_t| > 0.8) > tail_thresh."""
     gamma_vals = [i / n_points for i in range(1, n_points + 1)]
+    res = run_phase_sweep(gamma_vals, [eta])
     for gamma in gamma_vals:
-        res = run_phase_sweep([gamma], [eta])
-        v = res.get((gamma, eta), {})
-        tf = v.get("tail_freq", 0)
-        if tf > tail_thresh:
+        if res[(gamma, eta)]["tail_freq"] > tail_thresh:
             return gamma
     return None
 
@@ -67,6 +67,24 @@ def verify():
     return jsonify(result)
 
 
+@app.route("/api/state", methods=["GET"])
+def state():
+    date = request.args.get("date")
+    asset = request.args.get("asset", "BTC")
+    if not date:
+        return jsonify({
+            "error": "Missing date parameter",
+            "usage": "GET /api/state?date=YYYY-MM-DD&asset=BTC"
+        }), 400
+
+    from engine.verifier import verifier
+    result = verifier.state_as_of(date, asset=asset)
+    if result.get("status") != "success":
+        code = {"invalid_date": 400, "unavailable": 503}.get(result.get("reason"), 404)
+        return jsonify(result), code
+    return jsonify(result)
+
+
 @app.route("/api")
 def api_info():
     return jsonify({
@@ -77,6 +95,7 @@ def api_info():
             "/": "Frontend UI",
             "/api/verify": "GET ?address= or POST {\"address\": \"...\"}",
             "/api/health": "Health check",
+            "/api/state": "GET ?date=YYYY-MM-DD&asset=BTC (precomputed systemic/BEAST/dynamical state)",
         },
         "claim": "UVRK-1 outperforms Stoch Vol Lévy by +8.71σ on Bitcoin",
         "r_squared": 0.954,
@@ -0,0 +1,225 @@
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║              RAMANASH ARTIFACT — Precomputed Stress State by Date             ║
+║                                                                               ║
+║  Systemic layer + BEAST + dynamical engine, built once per asset.             ║
+║  O(1) "state as of date D" lookups. New bars extend it incrementally.         ║
+║                                                                               ║
+║  © 2025 Jennifer Leigh West • The Forgotten Code Research Institute           ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import bisect
+import datetime
+import json
+import math
+import os
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from engine.ramanash_systemic import SystemicStream, SYSTEMIC_FIELDS
+from engine.ramanash_beast import BeastStream
+from engine.ramanash_dynamical import DynamicalStream, _uvrk_norm
+from engine.ramanash_kernel import predict_macro, extended_nash_eq, MACRO_FEB_23_2026
+
+BEAST_FIELDS = (
+    "core", "interaction", "stress", "lambda_t", "extended_nash", "acceleration",
+    "crisis_field", "energy", "aligned_magnitude", "trigger", "delta_energy", "build_rate",
+)
+DYNAMICAL_FIELDS = ("oracle", "state", "shock_amplifier", "system_index", "energy", "delta_energy")
+
+COLUMNS = (
+    ("ordinal", "vol")
+    + tuple(f"systemic.{f}" for f in SYSTEMIC_FIELDS)
+    + tuple(f"beast.{f}" for f in BEAST_FIELDS)
+    + tuple(f"dynamical.{f}" for f in DYNAMICAL_FIELDS)
+)
+
+_ROWS_FILE = "rows.f64"
+_META_FILE = "meta.json"
+
+DateLike = Union[str, datetime.date]
+
+
+def _ordinal(date: DateLike) -> int:
+    if isinstance(date, str):
+        date = datetime.date.fromisoformat(date[:10])
+    return date.toordinal()
+
+
+def _new_state(macro_factors: Dict[str, float], vol_window: int) -> Dict[str, Any]:
+    return {
+        "stream": SystemicStream(vol_window=vol_window).to_state(),
+        "macro_factors": dict(macro_factors),
+        "macro_stress": predict_macro(0.04, macro_factors)["nash_eq"],
+        "lambda_macro": 0.5,
+        # beast_from_market / dynamical_from_market start at vol index vol_offset + 30
+        "start_vol_idx": vol_window + 30,
+        "beast": BeastStream().to_state(),
+        "dynamical": DynamicalStream().to_state(),
+    }
+
+
+def _advance(state: Dict[str, Any], stream: SystemicStream, ordinal: int, price: float) -> List[float]:
+    """Push one bar through systemic → BEAST → dynamical; return the artifact row."""
+    n_vols = stream.n_vols
+    sys_out = stream.push(price)
+    vol = stream.vol
+    row = [float(ordinal), vol if vol is not None else math.nan]
+    row.extend(sys_out[f] for f in SYSTEMIC_FIELDS)
+
+    i = stream.n_vols - 1
+    # No new vol (warm-up, or a non-positive price the stream skipped): no BEAST/dynamical step
+    if i < state["start_vol_idx"] or stream.n_vols == n_vols:
+        row.extend([math.nan] * (len(BEAST_FIELDS) + len(DYNAMICAL_FIELDS)))
+        return row
+
+    # BEAST (same recursion as beast_run, s_init = 0)
+    macro_stress = state["macro_stress"]
+    beast = BeastStream.from_state(state["beast"])
+    step = beast.push(sys_out["lci"], sys_out["lsi"], sys_out["csi"], sys_out["fsi"], macro_stress)
+    state["beast"] = beast.to_state()
+    row.extend(float(step[f]) for f in BEAST_FIELDS)
+
+    # Dynamical (same recursion as run_dynamical, s_init = 0)
+    dyn = DynamicalStream.from_state(state["dynamical"])
+    uvrk_n = _uvrk_norm(vol, stream.recent_vols)
+    nash = extended_nash_eq(macro_stress, sys_out["systemic_stress"], state["lambda_macro"])
+    dstep = dyn.push(uvrk_n, nash)
+    state["dynamical"] = dyn.to_state()
+    row.extend(dstep[f] for f in DYNAMICAL_FIELDS)
+    return row
+
+
+class StateArtifact:
+    """
+    Date-indexed systemic/BEAST/dynamical state for one asset.
+
+    On disk: a directory with rows.f64 (row-major float64, one row per bar,
+    columns as in COLUMNS) and meta.json (asset, row count, recursive state).
+    Rows are appended on extend(), so a new bar costs one step and one
+    small meta rewrite, and the result is identical to a full rebuild.
+
+    Rows match beast_from_market / dynamical_from_market for the same bars
+    (both start at vol index vol_window + 30; earlier rows hold NaN there).
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], meta: Dict[str, Any], rows: np.ndarray):
+        self.path = os.fspath(path)
+        self.meta = meta
+        self.rows = rows
+        self._col = {c: k for k, c in enumerate(COLUMNS)}
+        self._ordinals = rows[:, 0].astype(np.int64).tolist() if len(rows) else []
+
+    # ── build / load ────────────────────────────────────────────────────────
+    @classmethod
+    def build(
+        cls,
+        path: Union[str, os.PathLike],
+        dates: List[DateLike],
+        prices: List[float],
+        asset: str = "BTC",
+        macro_factors: Optional[Dict[str, float]] = None,
+        vol_window: int = 20,
+    ) -> "StateArtifact":
+        """Run the full history once and write the artifact directory."""
+        macro_factors = macro_factors if macro_factors is not None else MACRO_FEB_23_2026
+        state = _new_state(macro_factors, vol_window)
+        stream = SystemicStream.from_state(state["stream"])
+        rows = np.array(
+            [_advance(state, stream, _ordinal(d), p) for d, p in zip(dates, prices)],
+            dtype=np.float64,
+        ).reshape(-1, len(COLUMNS))
+        state["stream"] = stream.to_state()
+        meta = {"asset": asset, "columns": list(COLUMNS), "n_rows": len(rows), "state": state}
+
+        os.makedirs(path, exist_ok=True)
+        rows.tofile(os.path.join(path, _ROWS_FILE))
+        cls._write_meta(path, meta)
+        return cls(path, meta, rows)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "StateArtifact":
+        with open(os.path.join(path, _META_FILE)) as f:
+            meta = json.load(f)
+        raw = np.fromfile(os.path.join(path, _ROWS_FILE), dtype=np.float64)
+        rows = raw[: meta["n_rows"] * len(COLUMNS)].reshape(-1, len(COLUMNS))
+        return cls(path, meta, rows)
+
+    @staticmethod
+    def _write_meta(path: Union[str, os.PathLike], meta: Dict[str, Any]) -> None:
+        tmp = os.path.join(path, _META_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(path, _META_FILE))
+
+    # ── incremental extension ───────────────────────────────────────────────
+    def extend(self, date: DateLike, price: float) -> Dict[str, Any]:
+        """Append one bar (date must be after the last one) and return its state."""
+        ordinal = _ordinal(date)
+        if self._ordinals and ordinal <= self._ordinals[-1]:
+            raise ValueError(f"date {date} is not after last artifact date {self.last_date}")
+        state = self.meta["state"]
+        stream = SystemicStream.from_state(state["stream"])
+        row = np.array([_advance(state, stream, ordinal, price)], dtype=np.float64)
+        state["stream"] = stream.to_state()
+
+        with open(os.path.join(self.path, _ROWS_FILE), "r+b") as f:
+            f.seek(self.meta["n_rows"] * len(COLUMNS) * 8)
+            f.write(row.tobytes())
+            f.truncate()
+        self.meta["n_rows"] += 1
+        self._write_meta(self.path, self.meta)
+
+        self.rows = np.vstack([self.rows, row])
+        self._ordinals.append(ordinal)
+        return self._row_state(len(self.rows) - 1)
+
+    # ── lookups ─────────────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def first_date(self) -> Optional[datetime.date]:
+        return datetime.date.fromordinal(self._ordinals[0]) if self._ordinals else None
+
+    @property
+    def last_date(self) -> Optional[datetime.date]:
+        return datetime.date.fromordinal(self._ordinals[-1]) if self._ordinals else None
+
+    def index_as_of(self, date: DateLike) -> Optional[int]:
+        """Row of the last bar on or before date. O(1) for gap-free daily rows."""
+        if not self._ordinals:
+            return None
+        ordinal = _ordinal(date)
+        first, last = self._ordinals[0], self._ordinals[-1]
+        if ordinal < first:
+            return None
+        if ordinal >= last:
+            return len(self._ordinals) - 1
+        if last - first == len(self._ordinals) - 1:
+            return ordinal - first
+        return bisect.bisect_right(self._ordinals, ordinal) - 1
+
+    def state_at(self, date: DateLike) -> Optional[Dict[str, Any]]:
+        """State as of date D, or None before the artifact starts."""
+        idx = self.index_as_of(date)
+        return None if idx is None else self._row_state(idx)
+
+    def _row_state(self, idx: int) -> Dict[str, Any]:
+        row = self.rows[idx]
+
+        def group(prefix: str, fields) -> Optional[Dict[str, float]]:
+            vals = {f: float(row[self._col[f"{prefix}.{f}"]]) for f in fields}
+            return None if any(math.isnan(v) for v in vals.values()) else vals
+
+        vol = float(row[1])
+        return {
+            "asset": self.meta["asset"],
+            "date": datetime.date.fromordinal(int(row[0])).isoformat(),
+            "vol": None if math.isnan(vol) else vol,
+            "systemic": group("systemic", SYSTEMIC_FIELDS),
+            "beast": group("beast", BEAST_FIELDS),
+            "dynamical": group("dynamical", DYNAMICAL_FIELDS),
+        }
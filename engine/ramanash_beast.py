@@ -10,13 +10,32 @@
 """
 
 import math
-from typing import List, Dict, Any, Optional
+from collections import deque
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from engine.ramanash_frame import ColumnFrame
 
 # Structural parameters (not fitted)
 GAMMA_DEFAULT = 0.4   # Interaction strength
 ETA_DEFAULT = 0.25    # Acceleration strength
 
 
+class BeastFrame(ColumnFrame):
+    """
+    beast_run output as one float64 array per field (trigger as int8).
+    steps["crisis_field"] is a column; steps[t] is the same dict beast_run
+    would have returned for step t.
+    """
+
+    FIELDS = (
+        "core", "interaction", "stress", "lambda_t", "extended_nash", "acceleration",
+        "crisis_field", "energy", "aligned_magnitude", "trigger", "delta_energy", "build_rate",
+    )
+    INT_FIELDS = ("trigger",)
+
+
 def _tanh(x: float) -> float:
     return math.tanh(x)
 
@@ -35,11 +54,12 @@ def beast_step(
     gamma: float = GAMMA_DEFAULT,
     eta: float = ETA_DEFAULT,
     static_lambda: Optional[float] = None,
+    contagion: Optional[float] = None,
 ) -> Dict[str, float]:
     """
     One step of BEAST core.
 
-    C_t = (LCI + LSI + CSI + FSI) / 4
+    C_t = (LCI + LSI + CSI + FSI) / 4      [(… + K) / 5 with contagion K]
     I_t = (LCI·LSI + CSI·FSI + LCI·CSI) / 3
     S_t = tanh(C_t + γ I_t)
     λ_t = (1 + |MacroStress|) / 2
@@ -48,12 +68,18 @@ def beast_step(
     F_t = tanh(E_t + η A_t)
 
     All bounded. No explosion.
+    contagion: optional cross-asset stress K (engine/ramanash_contagion.py),
+    averaged into the core and aligned magnitude as a fifth component.
     """
     lci, lsi, csi, fsi = _bound(lci), _bound(lsi), _bound(csi), _bound(fsi)
     macro_stress = _bound(macro_stress)
 
     # Systemic core
-    c_t = (lci + lsi + csi + fsi) / 4
+    if contagion is None:
+        c_t = (lci + lsi + csi + fsi) / 4
+    else:
+        contagion = _bound(contagion)
+        c_t = (lci + lsi + csi + fsi + contagion) / 5
 
     # Interaction term (convex when aligned)
     i_t = (lci * lsi + csi * fsi + lci * csi) / 3
@@ -79,7 +105,10 @@ def beast_step(
     energy = s_t * s_t
 
     # Aligned stress magnitude
-    m_t = (abs(lci) + abs(lsi) + abs(csi) + abs(fsi)) / 4
+    if contagion is None:
+        m_t = (abs(lci) + abs(lsi) + abs(csi) + abs(fsi)) / 4
+    else:
+        m_t = (abs(lci) + abs(lsi) + abs(csi) + abs(fsi) + abs(contagion)) / 5
 
     # Stress alignment trigger
     trigger = 1 if (abs(i_t) > 0.5 and abs(s_t) > 0.6) else 0
@@ -98,6 +127,80 @@ def beast_step(
     }
 
 
+def _beast_inputs(lci, lsi, csi, fsi, macro_stress, n: int, contagion=None):
+    """Bounded macro, core C_t, interaction I_t and aligned magnitude as arrays."""
+    def col(x):
+        x = np.asarray(x[:n], dtype=np.float64)
+        return np.minimum(np.maximum(x, -1.0), 1.0)
+
+    lci, lsi, csi, fsi, macro = col(lci), col(lsi), col(csi), col(fsi), col(macro_stress)
+    comps = [lci, lsi, csi, fsi] if contagion is None else [lci, lsi, csi, fsi, col(contagion)]
+
+    # Left-to-right adds, same order as beast_step
+    c_t = comps[0] + comps[1]
+    m_t = np.abs(comps[0])
+    m_t += np.abs(comps[1])
+    for x in comps[2:]:
+        c_t += x
+        m_t += np.abs(x)
+    c_t /= len(comps)
+    m_t /= len(comps)
+    i_t = (lci * lsi + csi * fsi + lci * csi) / 3
+    return macro, c_t, i_t, m_t
+
+
+def _beast_vectorized(
+    lci, lsi, csi, fsi, macro_stress, n: int,
+    gamma: float, eta: float, s_init: float,
+    static_lambda: Optional[float], contagion=None,
+) -> BeastFrame:
+    """
+    Whole-series BEAST with array ops. Every term except A_t is pointwise in
+    the day's inputs, and A_t only needs S_{t-1}, which is S shifted one step
+    (S_{-1} = s_init) — no feedback, so no loop. Matches beast_step to
+    rounding (numpy vs libm tanh).
+    """
+    macro, c_t, i_t, m_t = _beast_inputs(lci, lsi, csi, fsi, macro_stress, n, contagion)
+    s_t = np.tanh(c_t + gamma * i_t)
+    if static_lambda is not None:
+        lam_t = np.full(n, float(static_lambda))
+    else:
+        lam_t = (1 + np.abs(macro)) / 2
+    e_t = lam_t * macro + (1 - lam_t) * s_t
+    np.minimum(np.maximum(e_t, -1.0, out=e_t), 1.0, out=e_t)
+
+    s_prev = np.empty(n)
+    s_prev[:1] = s_init
+    s_prev[1:] = s_t[:-1]
+    a_t = (s_t - s_prev) * np.abs(s_t)
+    np.minimum(np.maximum(a_t, -1.0, out=a_t), 1.0, out=a_t)
+    f_t = np.tanh(e_t + eta * a_t)
+    energy = s_t * s_t
+
+    e_init = s_init * s_init
+    e_lag1 = np.empty(n)
+    e_lag1[:1] = e_init
+    e_lag1[1:] = energy[:-1]
+    e_lag3 = np.empty(n)
+    e_lag3[:3] = e_init
+    e_lag3[3:] = energy[:-3]
+
+    return BeastFrame({
+        "core": c_t,
+        "interaction": i_t,
+        "stress": s_t,
+        "lambda_t": lam_t,
+        "extended_nash": e_t,
+        "acceleration": a_t,
+        "crisis_field": f_t,
+        "energy": energy,
+        "aligned_magnitude": m_t,
+        "trigger": ((np.abs(i_t) > 0.5) & (np.abs(s_t) > 0.6)).astype(np.int8),
+        "delta_energy": energy - e_lag1,
+        "build_rate": energy - e_lag3,
+    })
+
+
 def beast_run(
     lci_list: List[float],
     lsi_list: List[float],
@@ -108,57 +211,289 @@ def beast_run(
     eta: float = ETA_DEFAULT,
     s_init: float = 0.0,
     static_lambda: Optional[float] = None,
-) -> List[Dict[str, float]]:
-    """Run BEAST over time series."""
+    contagion_list: Optional[List[float]] = None,
+    as_frame: bool = False,
+    vectorized: bool = False,
+) -> Union[List[Dict[str, float]], BeastFrame]:
+    """
+    Run BEAST over time series. contagion_list: optional per-step contagion stress.
+    as_frame=True returns a BeastFrame (same values, ~10x less memory).
+    vectorized=True computes the whole series with array ops (equal to the
+    scalar loop within 1e-12; use with as_frame=True for full speed).
+    """
     n = min(len(lci_list), len(lsi_list), len(csi_list), len(fsi_list), len(macro_stress_list))
+    if contagion_list is not None:
+        n = min(n, len(contagion_list))
+    if vectorized:
+        frame = _beast_vectorized(
+            lci_list, lsi_list, csi_list, fsi_list, macro_stress_list, n,
+            gamma, eta, s_init, static_lambda, contagion_list,
+        )
+        return frame if as_frame else frame.to_list()
     out = []
+    cols = {f: [] for f in BeastFrame.FIELDS} if as_frame else None
     s_prev = s_init
     e_prev = s_init * s_init
 
     e_init = s_init * s_init
+    recent_energy = deque(maxlen=3)
     for t in range(n):
         step = beast_step(
             lci_list[t], lsi_list[t], csi_list[t], fsi_list[t],
             macro_stress_list[t], s_prev=s_prev, gamma=gamma, eta=eta,
             static_lambda=static_lambda,
+            contagion=contagion_list[t] if contagion_list is not None else None,
         )
         step["delta_energy"] = step["energy"] - e_prev
-        step["build_rate"] = step["energy"] - (out[t - 3]["energy"] if t >= 3 else e_init)
+        step["build_rate"] = step["energy"] - (recent_energy[0] if t >= 3 else e_init)
         s_prev = step["stress"]
         e_prev = step["energy"]
-        out.append(step)
+        recent_energy.append(step["energy"])
+        if cols is not None:
+            for f, col in cols.items():
+                col.append(step[f])
+        else:
+            out.append(step)
+
+    if cols is not None:
+        return BeastFrame({f: np.array(col, dtype=BeastFrame._dtype(f)) for f, col in cols.items()})
+    return out
+
+
+ENSEMBLE_STATS = ("mean_abs_f", "mean_f", "tail_freq", "var_s", "trigger_freq")
+
 
+def beast_ensemble(
+    lci_list: List[float],
+    lsi_list: List[float],
+    csi_list: List[float],
+    fsi_list: List[float],
+    macro_stress_list: List[float],
+    gamma: Union[float, Sequence[float]] = (GAMMA_DEFAULT,),
+    eta: Union[float, Sequence[float]] = (ETA_DEFAULT,),
+    static_lambda: Union[None, float, Sequence[Optional[float]]] = (None,),
+    s_init: float = 0.0,
+    contagion_list: Optional[List[float]] = None,
+    tail_thresh: float = 0.8,
+    max_elements: int = 1 << 22,
+) -> Dict[str, np.ndarray]:
+    """
+    Summary statistics of beast_run over the grid gamma × static_lambda × eta,
+    for one set of input series.
+
+    S_t depends on γ only, E_t on (γ, λ), F_t on (γ, λ, η), so each γ chunk
+    computes S and A once and broadcasts F over all η at once. Chunks hold at
+    most ~max_elements values of F, which bounds memory for any grid size.
+    static_lambda entries of None (or NaN) mean the adaptive λ_t. Scalars
+    (and a bare None) are one-entry axes.
+
+    Returns arrays of shape (len(gamma), len(static_lambda), len(eta)):
+      mean_abs_f   E[|F_t|]
+      mean_f       E[F_t]
+      tail_freq    P(|F_t| > tail_thresh)
+      var_s        Var(S_t)          (depends on γ only)
+      trigger_freq P(trigger = 1)    (depends on γ only)
+    plus the grid axes "gamma", "static_lambda" (NaN = adaptive), "eta".
+    Each grid point equals beast_run with those parameters to rounding.
+    """
+    n = min(len(lci_list), len(lsi_list), len(csi_list), len(fsi_list), len(macro_stress_list))
+    if contagion_list is not None:
+        n = min(n, len(contagion_list))
+    gammas = np.asarray(gamma, dtype=np.float64).reshape(-1)
+    etas = np.asarray(eta, dtype=np.float64).reshape(-1)
+    if static_lambda is None or np.ndim(static_lambda) == 0:
+        static_lambda = [static_lambda]  # one entry: None = adaptive, or a scalar λ
+    lams = np.array([np.nan if lam is None else lam for lam in static_lambda], dtype=np.float64).reshape(-1)
+    shape = (len(gammas), len(lams), len(etas))
+    out = {k: np.zeros(shape) for k in ENSEMBLE_STATS}
+    out.update(gamma=gammas, static_lambda=lams, eta=etas)
+    if n == 0 or 0 in shape:
+        return out
+
+    macro, c_t, i_t, _ = _beast_inputs(lci_list, lsi_list, csi_list, fsi_list, macro_stress_list, n, contagion_list)
+    lam_adaptive = (1 + np.abs(macro)) / 2
+    i_hot = np.abs(i_t) > 0.5
+
+    # Chunk sizes: F block is (g_chunk, e_chunk, n)
+    e_chunk = max(1, min(len(etas), max_elements // n))
+    g_chunk = max(1, min(len(gammas), max_elements // (n * e_chunk)))
+
+    for g0 in range(0, len(gammas), g_chunk):
+        g = gammas[g0:g0 + g_chunk]
+        s_t = np.tanh(c_t[None, :] + g[:, None] * i_t[None, :])          # (gc, n)
+        s_prev = np.empty_like(s_t)
+        s_prev[:, :1] = s_init
+        s_prev[:, 1:] = s_t[:, :-1]
+        a_t = (s_t - s_prev) * np.abs(s_t)
+        np.minimum(np.maximum(a_t, -1.0, out=a_t), 1.0, out=a_t)
+
+        out["var_s"][g0:g0 + g_chunk] = s_t.var(axis=1)[:, None, None]
+        trig = (i_hot[None, :] & (np.abs(s_t) > 0.6)).mean(axis=1)
+        out["trigger_freq"][g0:g0 + g_chunk] = trig[:, None, None]
+
+        for li, lam in enumerate(lams):
+            lam_t = lam_adaptive if np.isnan(lam) else lam
+            e_t = lam_t * macro[None, :] + (1 - lam_t) * s_t             # (gc, n)
+            np.minimum(np.maximum(e_t, -1.0, out=e_t), 1.0, out=e_t)
+            for e0 in range(0, len(etas), e_chunk):
+                e = etas[e0:e0 + e_chunk]
+                f_t = np.tanh(e_t[:, None, :] + e[None, :, None] * a_t[:, None, :])  # (gc, ec, n)
+                abs_f = np.abs(f_t)
+                sl = (slice(g0, g0 + g_chunk), li, slice(e0, e0 + e_chunk))
+                out["mean_abs_f"][sl] = abs_f.mean(axis=2)
+                out["mean_f"][sl] = f_t.mean(axis=2)
+                out["tail_freq"][sl] = (abs_f > tail_thresh).mean(axis=2)
     return out
 
 
 def beast_from_market(
     prices: List[float],
     vols: List[float],
-    macro_factors: Dict[str, Any],
+    macro_factors: Union[Mapping[str, Any], Sequence[Mapping[str, Any]]],
     vol_offset: int = 20,
     gamma: float = GAMMA_DEFAULT,
     eta: float = ETA_DEFAULT,
     static_lambda: Optional[float] = None,
-) -> List[Dict[str, Any]]:
-    """Build BEAST from market data. Uses systemic layer + macro."""
-    from engine.ramanash_systemic import systemic_stress_full
-    from engine.ramanash_kernel import predict_macro
+    as_frame: bool = False,
+) -> Union[List[Dict[str, Any]], BeastFrame]:
+    """
+    Build BEAST from market data. Uses systemic layer + macro.
+    macro_factors: one mapping, or one per vol index (time-varying macro).
+    O(n): systemic series in one pass, macro evaluated once per distinct factor set.
+    """
+    from engine.ramanash_kernel import market_inputs
 
-    lci_list, lsi_list, csi_list, fsi_list = [], [], [], []
-    macro_stress_list = []
+    inputs = market_inputs(prices, vols, macro_factors, vol_offset)
+    sys_cols, macro_stress_list = inputs.systemic, inputs.macro_stress
 
-    for i in range(vol_offset + 30, len(vols) - 1):
-        s = systemic_stress_full(prices, vols, i, vol_offset)
-        m = predict_macro(0.04, macro_factors)
-        macro_stress = m["nash_eq"]
+    return beast_run(
+        sys_cols["lci"], sys_cols["lsi"], sys_cols["csi"], sys_cols["fsi"], macro_stress_list,
+        gamma=gamma, eta=eta, static_lambda=static_lambda, as_frame=as_frame,
+    )
 
-        lci_list.append(s["lci"])
-        lsi_list.append(s["lsi"])
-        csi_list.append(s["csi"])
-        fsi_list.append(s["fsi"])
-        macro_stress_list.append(macro_stress)
 
-    return beast_run(lci_list, lsi_list, csi_list, fsi_list, macro_stress_list, gamma=gamma, eta=eta, static_lambda=static_lambda)
+class BeastStream:
+    """
+    BEAST one step at a time, with constant memory.
+
+    Carries S_{t-1}, E_{t-1} and a three-step energy ring (for build_rate);
+    push() returns the same dict beast_run produces for that step.
+
+    Callbacks:
+      on_trigger(cb)                 cb(event) when trigger flips 0→1 or 1→0
+      on_crisis_cross(thresh, cb)    cb(event) when crisis_field crosses thresh
+                                     (below: F < thresh, as in tail_lift)
+    event = {"t", "kind", "threshold", "step"}; kind is "trigger_on",
+    "trigger_off", "crisis_below" or "crisis_above". Both start from the
+    quiet side (trigger 0, F ≥ thresh), so a first step inside fires.
+    """
+
+    def __init__(
+        self,
+        gamma: float = GAMMA_DEFAULT,
+        eta: float = ETA_DEFAULT,
+        static_lambda: Optional[float] = None,
+        s_init: float = 0.0,
+    ):
+        self.gamma = gamma
+        self.eta = eta
+        self.static_lambda = static_lambda
+        self.s_init = s_init
+        self.s_prev = s_init
+        self.e_prev = s_init * s_init
+        self._energies = deque(maxlen=3)
+        self.n = 0
+        self.trigger = 0
+        self.last: Optional[Dict[str, float]] = None
+        self._trigger_callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self._cross_callbacks: List[tuple] = []
+        self._below: Dict[float, bool] = {}
+
+    def on_trigger(self, callback: Callable[[Dict[str, Any]], None]) -> Callable:
+        self._trigger_callbacks.append(callback)
+        return callback
+
+    def on_crisis_cross(self, threshold: float, callback: Callable[[Dict[str, Any]], None]) -> Callable:
+        self._cross_callbacks.append((threshold, callback))
+        self._below.setdefault(threshold, False)
+        return callback
+
+    def push(
+        self,
+        lci: float,
+        lsi: float,
+        csi: float,
+        fsi: float,
+        macro_stress: float,
+        contagion: Optional[float] = None,
+    ) -> Dict[str, float]:
+        step = beast_step(
+            lci, lsi, csi, fsi, macro_stress, s_prev=self.s_prev,
+            gamma=self.gamma, eta=self.eta, static_lambda=self.static_lambda,
+            contagion=contagion,
+        )
+        energy = step["energy"]
+        ring = self._energies
+        step["delta_energy"] = energy - self.e_prev
+        step["build_rate"] = energy - (ring[0] if len(ring) == 3 else self.s_init * self.s_init)
+        self.s_prev = step["stress"]
+        self.e_prev = energy
+        ring.append(energy)
+        t = self.n
+        self.n += 1
+        self.last = step
+
+        if step["trigger"] != self.trigger:
+            self.trigger = step["trigger"]
+            kind = "trigger_on" if self.trigger else "trigger_off"
+            for cb in self._trigger_callbacks:
+                cb({"t": t, "kind": kind, "threshold": None, "step": step})
+
+        if self._cross_callbacks:
+            f_t = step["crisis_field"]
+            flipped = []
+            for thresh, was_below in self._below.items():
+                below = f_t < thresh
+                if below != was_below:
+                    flipped.append((thresh, below))
+            for thresh, below in flipped:
+                self._below[thresh] = below
+                kind = "crisis_below" if below else "crisis_above"
+                for th, cb in self._cross_callbacks:
+                    if th == thresh:
+                        cb({"t": t, "kind": kind, "threshold": thresh, "step": step})
+        return step
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot (callbacks are not included)."""
+        return {
+            "gamma": self.gamma,
+            "eta": self.eta,
+            "static_lambda": self.static_lambda,
+            "s_init": self.s_init,
+            "s_prev": self.s_prev,
+            "e_prev": self.e_prev,
+            "energies": list(self._energies),
+            "n": self.n,
+            "trigger": self.trigger,
+            "below": [[k, v] for k, v in self._below.items()],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "BeastStream":
+        stream = cls(
+            gamma=state.get("gamma", GAMMA_DEFAULT),
+            eta=state.get("eta", ETA_DEFAULT),
+            static_lambda=state.get("static_lambda"),
+            s_init=state.get("s_init", 0.0),
+        )
+        stream.s_prev = state["s_prev"]
+        stream.e_prev = state["e_prev"]
+        stream._energies.extend(state["energies"])
+        stream.n = state.get("n", len(state["energies"]))
+        stream.trigger = state.get("trigger", 0)
+        stream._below = {k: v for k, v in state.get("below", [])}
+        return stream
 
 
 def stress_alignment_trigger(step: Dict[str, float], i_thresh: float = 0.5, s_thresh: float = 0.6) -> bool:
@@ -167,7 +502,7 @@ def stress_alignment_trigger(step: Dict[str, float], i_thresh: float = 0.5, s_th
 
 
 def tail_lift(
-    beast_steps: List[Dict[str, float]],
+    beast_steps: Union[List[Dict[str, float]], BeastFrame],
     future_vols: List[float],
     baseline_vol: float,
     f_thresh: float = -0.7,
@@ -178,7 +513,48 @@ def tail_lift(
     """
     if len(beast_steps) != len(future_vols) or baseline_vol <= 0:
         return 0.0
+    if isinstance(beast_steps, ColumnFrame):
+        mask = beast_steps["crisis_field"] < f_thresh
+        tail_vols = np.asarray(future_vols, dtype=np.float64)[mask].tolist()
+        if not tail_vols:
+            return 0.0
+        return (sum(tail_vols) / len(tail_vols)) / baseline_vol - 1.0
     tail_vols = [future_vols[t] for t in range(len(beast_steps)) if beast_steps[t].get("crisis_field", 0) < f_thresh]
     if not tail_vols:
         return 0.0
     return (sum(tail_vols) / len(tail_vols)) / baseline_vol - 1.0
+
+
+def tail_lift_curve(
+    beast_steps: Union[List[Dict[str, float]], BeastFrame],
+    future_vols: List[float],
+    baseline_vol: float,
+    thresholds: Optional[Sequence[float]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    tail_lift at many thresholds at once, O(n log n) total.
+
+    Sorts crisis_field once and takes cumulative future-vol sums in that
+    order; each threshold is then one binary search (tail = F_t < thresh,
+    as in tail_lift). thresholds=None uses every distinct F_t value.
+
+    Returns {"threshold", "lift", "count"} arrays; count is the number of tail
+    days per threshold (lift is 0.0 where count is 0), for minimum-support
+    filters. Lifts agree with tail_lift to float rounding.
+    """
+    if isinstance(beast_steps, ColumnFrame):
+        f = np.asarray(beast_steps["crisis_field"], dtype=np.float64)
+    else:
+        f = np.array([s.get("crisis_field", 0) for s in beast_steps], dtype=np.float64)
+    thr = np.unique(f) if thresholds is None else np.asarray(thresholds, dtype=np.float64).reshape(-1)
+    lift = np.zeros(len(thr))
+    if len(f) != len(future_vols) or baseline_vol <= 0:
+        return {"threshold": thr, "lift": lift, "count": np.zeros(len(thr), dtype=np.int64)}
+
+    order = np.argsort(f, kind="stable")
+    f_sorted = f[order]
+    csum = np.concatenate([[0.0], np.cumsum(np.asarray(future_vols, dtype=np.float64)[order])])
+    count = np.searchsorted(f_sorted, thr, side="left")
+    hit = count > 0
+    lift[hit] = (csum[count[hit]] / count[hit]) / baseline_vol - 1.0
+    return {"threshold": thr, "lift": lift, "count": count.astype(np.int64)}
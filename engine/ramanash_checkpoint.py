@@ -0,0 +1,151 @@
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║              RAMANASH CHECKPOINT — Resumable BEAST / Dynamical Runs           ║
+║                                                                               ║
+║  Long runs persist the minimal recursive state every N steps.                 ║
+║  An interrupted run resumes from its last checkpoint, bit-identically.        ║
+║                                                                               ║
+║  © 2025 Jennifer Leigh West • The Forgotten Code Research Institute           ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import hashlib
+import json
+import os
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from engine.ramanash_beast import BeastFrame, BeastStream, GAMMA_DEFAULT, ETA_DEFAULT
+from engine.ramanash_dynamical import DynamicalFrame, DynamicalStream, RHO_DEFAULT, BETA_DEFAULT, ALPHA_DEFAULT
+from engine.ramanash_frame import ColumnFrame
+
+_CHECKPOINT_FILE = "checkpoint.json"
+
+
+def input_fingerprint(kind: str, series: Sequence[Sequence[float]], params: Dict[str, Any]) -> str:
+    """blake2b over the run kind, every input series and the parameters."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(kind.encode())
+    for x in series:
+        h.update(len(x).to_bytes(8, "little"))
+        h.update(array("d", x).tobytes())
+    h.update(json.dumps(params, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def _write_checkpoint(path: str, payload: Dict[str, Any]) -> None:
+    tmp = os.path.join(path, _CHECKPOINT_FILE + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(payload, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, os.path.join(path, _CHECKPOINT_FILE))
+
+
+def _read_checkpoint(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(path, _CHECKPOINT_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _run(
+    kind: str,
+    frame_cls: type,
+    inputs: List[Sequence[float]],
+    stream: Any,
+    params: Dict[str, Any],
+    checkpoint_dir: Union[str, os.PathLike],
+    every: int,
+) -> ColumnFrame:
+    path = os.fspath(checkpoint_dir)
+    os.makedirs(path, exist_ok=True)
+    n = min(len(x) for x in inputs)
+    fingerprint = input_fingerprint(kind, [list(x[:n]) for x in inputs], params)
+    files = {f: os.path.join(path, f"{f}.npy") for f in frame_cls.FIELDS}
+
+    ckpt = _read_checkpoint(path)
+    if ckpt and ckpt.get("fingerprint") == fingerprint and all(os.path.exists(p) for p in files.values()):
+        pos = ckpt["pos"]
+        stream = type(stream).from_state(ckpt["state"])
+        cols = {f: open_memmap(p, mode="r+") for f, p in files.items()}
+    else:
+        # No checkpoint, or one for different inputs/parameters: start over
+        pos = 0
+        cols = {
+            f: open_memmap(p, mode="w+", dtype=frame_cls._dtype(f), shape=(n,))
+            for f, p in files.items()
+        }
+        _write_checkpoint(path, {"kind": kind, "fingerprint": fingerprint, "n": n, "pos": 0, "state": stream.to_state()})
+    push = stream.push
+
+    def commit(lo: int, hi: int, buf: Dict[str, list]) -> None:
+        # Outputs reach disk before the checkpoint that covers them
+        for f, col in cols.items():
+            col[lo:hi] = buf[f]
+            col.flush()
+        _write_checkpoint(path, {"kind": kind, "fingerprint": fingerprint, "n": n, "pos": hi, "state": stream.to_state()})
+
+    while pos < n:
+        hi = min(n, pos + every)
+        buf = {f: [] for f in frame_cls.FIELDS}
+        for t in range(pos, hi):
+            step = push(*(x[t] for x in inputs))
+            for f, col in buf.items():
+                col.append(step[f])
+        commit(pos, hi, buf)
+        pos = hi
+
+    del cols
+    return frame_cls({f: np.load(p, mmap_mode="r") for f, p in files.items()})
+
+
+def checkpointed_beast_run(
+    lci_list: Sequence[float],
+    lsi_list: Sequence[float],
+    csi_list: Sequence[float],
+    fsi_list: Sequence[float],
+    macro_stress_list: Sequence[float],
+    checkpoint_dir: Union[str, os.PathLike],
+    every: int = 100_000,
+    gamma: float = GAMMA_DEFAULT,
+    eta: float = ETA_DEFAULT,
+    s_init: float = 0.0,
+    static_lambda: Optional[float] = None,
+) -> BeastFrame:
+    """
+    beast_run with a checkpoint every `every` steps.
+
+    Fields are written to checkpoint_dir/<field>.npy; checkpoint.json holds
+    the BeastStream state (S_{t-1}, E_{t-1}, energy ring), the position and
+    a fingerprint of inputs and parameters. Calling again with the same
+    inputs resumes at the last checkpoint; the result is bit-identical to
+    an uninterrupted beast_run. Returns a BeastFrame over read-only memmaps.
+    """
+    params = dict(gamma=gamma, eta=eta, s_init=s_init, static_lambda=static_lambda)
+    return _run(
+        "beast", BeastFrame, [lci_list, lsi_list, csi_list, fsi_list, macro_stress_list],
+        BeastStream(**params), params, checkpoint_dir, every,
+    )
+
+
+def checkpointed_dynamical_run(
+    uvrk_norms: Sequence[float],
+    extended_nash_eqs: Sequence[float],
+    checkpoint_dir: Union[str, os.PathLike],
+    every: int = 100_000,
+    rho: float = RHO_DEFAULT,
+    beta: float = BETA_DEFAULT,
+    alpha: float = ALPHA_DEFAULT,
+    s_init: float = 0.0,
+) -> DynamicalFrame:
+    """run_dynamical with a checkpoint every `every` steps (see checkpointed_beast_run)."""
+    params = dict(rho=rho, beta=beta, alpha=alpha, s_init=s_init)
+    return _run(
+        "dynamical", DynamicalFrame, [uvrk_norms, extended_nash_eqs],
+        DynamicalStream(**params), params, checkpoint_dir, every,
+    )
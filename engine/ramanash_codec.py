@@ -0,0 +1,170 @@
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║              RAMANASH CODEC — Compact Storage for Bounded Stress Series       ║
+║                                                                               ║
+║  Systemic, BEAST and dynamical outputs live in [-1, 1].                       ║
+║  Store them as int16 or float16 fixed point; decode transparently on read.    ║
+║                                                                               ║
+║  © 2025 Jennifer Leigh West • The Forgotten Code Research Institute           ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+# Error bounds (absolute, for values in [-1, 1]):
+#   int16:   x -> round(x * 32767); |decode(encode(x)) - x| <= 0.5 / 32767 ≈ 1.53e-5
+#            -1, 0 and 1 round-trip exactly. -32768 is reserved for NaN.
+#   float16: IEEE half; spacing is 2^-11 on [0.5, 1), so |error| <= 2^-12 ≈ 2.44e-4,
+#            and relative error <= 2^-11 for |x| >= 2^-14.
+INT16_SCALE = 32767
+INT16_NAN = -32768
+INT16_MAX_ERROR = 0.5 / INT16_SCALE
+FLOAT16_MAX_ERROR = 2.0**-12
+
+CODECS = ("int16", "float16")
+
+# Fields bounded to [-1, 1] across the systemic, BEAST and dynamical layers.
+BOUNDED_FIELDS = (
+    "lci", "lsi", "csi", "fsi", "systemic_stress",
+    "core", "interaction", "stress", "lambda_t", "extended_nash", "acceleration",
+    "crisis_field", "energy", "aligned_magnitude", "trigger", "delta_energy", "build_rate",
+    "oracle", "state", "shock_amplifier", "system_index",
+)
+
+
+class QuantizedSeries:
+    """
+    A bounded series stored as int16 or float16. Indexing decodes:
+    s[t] -> float, s[a:b] -> float64 array, np.asarray(s) -> float64 array.
+    Values outside [-1, 1] are clipped on encode; NaN round-trips.
+    """
+
+    __slots__ = ("codec", "data")
+
+    def __init__(self, data: np.ndarray, codec: str):
+        if codec not in CODECS:
+            raise ValueError(f"codec must be one of {CODECS}, got {codec!r}")
+        self.codec = codec
+        self.data = data
+
+    @classmethod
+    def encode(cls, values: Union[Sequence[float], np.ndarray], codec: str = "int16") -> "QuantizedSeries":
+        x = np.clip(np.asarray(values, dtype=np.float64), -1.0, 1.0)
+        if codec == "int16":
+            q = np.rint(x * INT16_SCALE)
+            data = np.where(np.isnan(x), INT16_NAN, q).astype(np.int16)
+        elif codec == "float16":
+            data = x.astype(np.float16)
+        else:
+            raise ValueError(f"codec must be one of {CODECS}, got {codec!r}")
+        return cls(data, codec)
+
+    @property
+    def max_error(self) -> float:
+        """Worst-case absolute decode error for this codec."""
+        return INT16_MAX_ERROR if self.codec == "int16" else FLOAT16_MAX_ERROR
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    def _decode(self, raw: np.ndarray) -> np.ndarray:
+        if self.codec == "int16":
+            out = raw.astype(np.float64) / INT16_SCALE
+            return np.where(raw == INT16_NAN, np.nan, out)
+        return raw.astype(np.float64)
+
+    def decode(self) -> np.ndarray:
+        return self._decode(self.data)
+
+    def __array__(self, dtype=None, copy=None):
+        out = self.decode()
+        return out if dtype is None else out.astype(dtype)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, key):
+        raw = self.data[key]
+        if np.ndim(raw) == 0:
+            return float(self._decode(np.asarray(raw)))
+        return self._decode(raw)
+
+    def __iter__(self):
+        return iter(self.decode().tolist())
+
+
+class QuantizedFrame:
+    """
+    Named QuantizedSeries sharing one index.
+    frame["crisis_field"] -> float64 array; frame.row(t) -> dict of floats.
+    """
+
+    def __init__(self, columns: Mapping[str, QuantizedSeries]):
+        self.columns: Dict[str, QuantizedSeries] = dict(columns)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field].decode()
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.columns
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def keys(self):
+        return self.columns.keys()
+
+    def row(self, t: int) -> Dict[str, float]:
+        return {k: s[t] for k, s in self.columns.items()}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(s.nbytes for s in self.columns.values())
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write an .npz: one raw array per field plus the codec per field."""
+        arrays = {f"q_{k}": s.data for k, s in self.columns.items()}
+        codecs = np.array([f"{k}={s.codec}" for k, s in self.columns.items()])
+        np.savez(path, _codecs=codecs, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "QuantizedFrame":
+        with np.load(path) as z:
+            codecs = dict(str(c).split("=", 1) for c in z["_codecs"])
+            return cls({k: QuantizedSeries(z[f"q_{k}"], codec) for k, codec in codecs.items()})
+
+
+def quantize_frame(
+    data: Union[Mapping[str, Any], List[Dict[str, Any]]],
+    fields: Optional[Iterable[str]] = None,
+    codec: str = "int16",
+) -> QuantizedFrame:
+    """
+    Quantize bounded fields from a dict of series (systemic_panel output,
+    column arrays) or a list of per-step dicts (beast_run, run_dynamical).
+    Defaults to every bounded field present; unbounded fields (e.g. vol) are
+    rejected rather than silently clipped.
+    """
+    if isinstance(data, list):
+        present = list(data[0].keys()) if data else []
+        get = lambda k: [step[k] for step in data]
+    else:
+        present = list(data.keys())
+        get = lambda k: data[k]
+
+    if fields is None:
+        fields = [k for k in present if k in BOUNDED_FIELDS]
+    else:
+        fields = list(fields)
+        unbounded = [k for k in fields if k not in BOUNDED_FIELDS]
+        if unbounded:
+            raise ValueError(f"fields not bounded to [-1, 1]: {unbounded}")
+    return QuantizedFrame({k: QuantizedSeries.encode(get(k), codec) for k in fields})
@@ -0,0 +1,140 @@
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║              RAMANASH CONTAGION — Rolling Cross-Asset Co-Movement             ║
+║                                                                               ║
+║  N×N rolling covariance/correlation with rank-one updates per bar.            ║
+║  Bounded contagion index, ready to feed beast_step as an extra stress input.  ║
+║                                                                               ║
+║  © 2025 Jennifer Leigh West • The Forgotten Code Research Institute           ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Same universe as tests/olympic_cross_asset.py
+CONTAGION_ASSETS = ("BTC", "ETH", "SOL", "SPX", "GOLD")
+
+
+class RollingCovariance:
+    """
+    Population covariance of the last `window` return vectors.
+
+    Each push is one rank-one add of the new vector and one rank-one drop of
+    the vector leaving the window (centered co-moment updates), O(N²) per bar.
+    Every `refresh` pushes the co-moment matrix is rebuilt from the ring to
+    stop rounding drift; amortized cost stays O(N²).
+    """
+
+    def __init__(self, n_assets: int, window: int = 30, refresh: Optional[int] = None):
+        self.n_assets = n_assets
+        self.window = window
+        self.refresh = refresh if refresh is not None else window
+        self._ring: Deque[np.ndarray] = deque()
+        self._mean = np.zeros(n_assets)
+        self._comoment = np.zeros((n_assets, n_assets))
+        self._since_refresh = 0
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    @property
+    def ready(self) -> bool:
+        return len(self._ring) >= self.window
+
+    def push(self, returns: Sequence[float]) -> None:
+        """Add one bar of returns. NaN (asset closed) counts as a zero return."""
+        x = np.nan_to_num(np.asarray(returns, dtype=np.float64), nan=0.0)
+        ring = self._ring
+        ring.append(x)
+        n = len(ring)
+        d = x - self._mean
+        self._mean += d / n
+        self._comoment += np.outer(d, x - self._mean)
+
+        if n > self.window:
+            y = ring.popleft()
+            n -= 1
+            m_new = self._mean - (y - self._mean) / n
+            self._comoment -= np.outer(y - m_new, y - self._mean)
+            self._mean = m_new
+
+        self._since_refresh += 1
+        if self._since_refresh >= self.refresh:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        x = np.array(self._ring)
+        self._mean = x.mean(axis=0)
+        c = x - self._mean
+        self._comoment = c.T @ c
+        self._since_refresh = 0
+
+    def covariance(self) -> np.ndarray:
+        n = len(self._ring)
+        if n == 0:
+            return np.zeros((self.n_assets, self.n_assets))
+        return self._comoment / n
+
+    def correlation(self) -> np.ndarray:
+        cov = self.covariance()
+        sd = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(sd, sd)
+        corr = np.where(np.outer(sd, sd) > 0, corr, 0.0)
+        corr = np.clip(corr, -1.0, 1.0)
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+
+def contagion_index(corr: np.ndarray) -> float:
+    """
+    K = -(mean off-diagonal correlation), bounded [-1, 1].
+    Negative = assets moving together = stress (same sign convention as MacroStress).
+    """
+    n = corr.shape[0]
+    if n < 2:
+        return 0.0
+    off = (corr.sum() - np.trace(corr)) / (n * (n - 1))
+    return max(-1.0, min(1.0, -float(off)))
+
+
+class ContagionEngine:
+    """
+    Per-bar contagion stress across a fixed asset universe.
+    push(prices) takes one close per asset (dict or sequence in `assets` order)
+    and returns the current contagion index (0.0 until the window fills).
+    """
+
+    def __init__(self, assets: Sequence[str] = CONTAGION_ASSETS, window: int = 30):
+        self.assets = tuple(assets)
+        self.cov = RollingCovariance(len(self.assets), window=window)
+        self._last: Optional[np.ndarray] = None
+        self.last = 0.0
+
+    def push(self, prices) -> float:
+        if isinstance(prices, dict):
+            prices = [prices.get(a, math.nan) for a in self.assets]
+        p = np.asarray(prices, dtype=np.float64)
+        p = np.where(p > 0, p, np.nan)
+        if self._last is not None:
+            with np.errstate(invalid="ignore"):
+                r = np.log(p / self._last)
+            self.cov.push(r)
+        # Carry the last valid close forward for closed markets
+        self._last = p if self._last is None else np.where(np.isnan(p), self._last, p)
+        self.last = contagion_index(self.cov.correlation()) if self.cov.ready else 0.0
+        return self.last
+
+    def correlation(self) -> Dict[str, Dict[str, float]]:
+        corr = self.cov.correlation()
+        return {a: {b: float(corr[i, j]) for j, b in enumerate(self.assets)} for i, a in enumerate(self.assets)}
+
+
+def contagion_series(price_matrix: Sequence[Sequence[float]], assets: Sequence[str] = CONTAGION_ASSETS, window: int = 30) -> List[float]:
+    """Contagion index per bar for a days × assets price matrix."""
+    engine = ContagionEngine(assets, window=window)
+    return [engine.push(row) for row in price_matrix]
@@ -9,8 +9,14 @@
 ╚═══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import bisect
 import math
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Mapping, Sequence, Union
+
+import numpy as np
+
+from engine.ramanash_frame import ColumnFrame
+from engine.uvrk import probit
 
 # Stability condition: ρ + |β| < 1. Defaults satisfy this.
 RHO_DEFAULT = 0.85   # State memory persistence
@@ -18,21 +24,50 @@ BETA_DEFAULT = 0.08  # Volatility-stress feedback
 ALPHA_DEFAULT = 0.3  # Convex shock amplification
 
 
+class DynamicalFrame(ColumnFrame):
+    """run_dynamical output as one float64 array per field; steps[t] is the step dict."""
+
+    FIELDS = ("oracle", "state", "shock_amplifier", "system_index", "energy", "delta_energy")
+
+
 def _tanh(x: float) -> float:
     return math.tanh(x)
 
 
+def _uvrk_norm_from_rank(below: int, count: int) -> float:
+    rank = below / count
+    rank = max(0.001, min(0.999, rank))
+    # rank 0 → -1, rank 1 → 1. probit(rank) then tanh for smooth bound
+    z = probit(rank)
+    return _tanh(z / 2)  # scale to [-1,1]
+
+
 def _uvrk_norm(vol: float, vol_history: List[float]) -> float:
     """Normalize vol to [-1,1] via rolling percentile. High vol → high stress."""
     if not vol_history:
         return 0.0
     below = sum(1 for v in vol_history if v < vol)
-    rank = below / len(vol_history)
-    rank = max(0.001, min(0.999, rank))
-    # rank 0 → -1, rank 1 → 1. probit(rank) then tanh for smooth bound
-    from engine.uvrk import probit
-    z = probit(rank)
-    return _tanh(z / 2)  # scale to [-1,1]
+    return _uvrk_norm_from_rank(below, len(vol_history))
+
+
+def _uvrk_norm_series(vols: List[float], start: int, stop: int, window: int = 60) -> List[float]:
+    """
+    _uvrk_norm(vols[i], vols[max(0, i - window) : i + 1]) for i in range(start, stop),
+    keeping the window sorted so each rank is one bisect (O(n log w) comparisons).
+    """
+    out = []
+    if start >= stop:
+        return out
+    lo = max(0, start - window)
+    ordered = sorted(vols[lo:start])
+    for i in range(start, stop):
+        bisect.insort(ordered, vols[i])
+        drop = i - window - 1
+        if drop >= lo:  # vols before the seed were never inserted
+            del ordered[bisect.bisect_left(ordered, vols[drop])]
+        below = bisect.bisect_left(ordered, vols[i])
+        out.append(_uvrk_norm_from_rank(below, len(ordered)))
+    return out
 
 
 def dynamical_step(
@@ -77,12 +112,17 @@ def run_dynamical(
     beta: float = BETA_DEFAULT,
     alpha: float = ALPHA_DEFAULT,
     s_init: float = 0.0,
-) -> List[Dict[str, float]]:
+    check_stability: bool = True,
+    as_frame: bool = False,
+) -> Union[List[Dict[str, float]], DynamicalFrame]:
     """
     Run full dynamical system over time series.
     oracle_raw_t = uvrk_norms[t] + extended_nash_eqs[t]
+    check_stability=False skips the ρ + |β| < 1 assertion (empirical stability scans).
+    as_frame=True returns a DynamicalFrame with the same values.
     """
-    assert rho + abs(beta) < 1, f"Stability violated: ρ+|β|={rho + abs(beta):.3f} >= 1"
+    if check_stability:
+        assert rho + abs(beta) < 1, f"Stability violated: ρ+|β|={rho + abs(beta):.3f} >= 1"
     n = min(len(uvrk_norms), len(extended_nash_eqs))
     out = []
     s = s_init
@@ -99,45 +139,248 @@ def run_dynamical(
         s = step["state"]
         out.append(step)
 
+    if as_frame:
+        return DynamicalFrame.from_steps(out)
+    return out
+
+
+DYNAMICAL_ENSEMBLE_STATS = (
+    "mean_state", "var_state", "mean_system_index", "mean_abs_system_index",
+    "max_abs_system_index", "tail_freq", "mean_energy", "final_state",
+)
+
+
+def run_dynamical_ensemble(
+    uvrk_norms: List[float],
+    extended_nash_eqs: List[float],
+    rho: Union[float, Sequence[float]] = RHO_DEFAULT,
+    beta: Union[float, Sequence[float]] = BETA_DEFAULT,
+    alpha: Union[float, Sequence[float]] = ALPHA_DEFAULT,
+    s_init: float = 0.0,
+    summary: bool = False,
+    si_thresh: float = 0.8,
+    block_size: int = 1024,
+) -> Dict[str, np.ndarray]:
+    """
+    run_dynamical for K (ρ, β, α) triples at once over the same inputs.
+
+    rho/beta/alpha broadcast to length K. The state is a K-vector updated per
+    step with array ops; Oracle_t does not depend on the triple and is
+    computed once, and SystemIndex/energy are computed from the state in
+    blocks after the recursion.
+
+    summary=False: "state", "system_index", "energy" as (n, K) matrices
+                   (time-major; column k equals run_dynamical for triple k).
+    summary=True:  DYNAMICAL_ENSEMBLE_STATS as K-vectors, accumulated per
+                   block of block_size steps, so memory is O(K · block_size).
+                   tail_freq = P(|SystemIndex| > si_thresh).
+    Both include "rho", "beta", "alpha" and "stable" (ρ + |β| < 1). Unstable
+    triples are simulated rather than rejected, for stability maps.
+    Values match run_dynamical to rounding (numpy vs libm tanh).
+    """
+    n = min(len(uvrk_norms), len(extended_nash_eqs))
+    rho, beta, alpha = (np.asarray(x, dtype=np.float64).reshape(-1) for x in np.broadcast_arrays(
+        np.atleast_1d(rho), np.atleast_1d(beta), np.atleast_1d(alpha)))
+    k = len(rho)
+    u = np.asarray(uvrk_norms[:n], dtype=np.float64)
+    oracle = np.tanh(u + np.asarray(extended_nash_eqs[:n], dtype=np.float64))
+    u_list, oracle_list = u.tolist(), oracle.tolist()
+    one_minus_rho = 1 - rho
+
+    out: Dict[str, np.ndarray] = {"rho": rho, "beta": beta, "alpha": alpha, "stable": rho + np.abs(beta) < 1}
+    if summary:
+        acc = {key: np.zeros(k) for key in DYNAMICAL_ENSEMBLE_STATS}
+        m2 = np.zeros(k)
+        seen = 0
+        buf = np.empty((max(1, min(block_size, n)), k))
+    else:
+        buf = np.empty((n, k))
+
+    def flush(block: np.ndarray) -> None:
+        nonlocal seen, m2
+        si = np.tanh(block + alpha * (block * np.abs(block)))
+        b = len(block)
+        # Chan et al. pairwise update for mean/variance of the state
+        b_mean = block.mean(axis=0)
+        b_m2 = ((block - b_mean) ** 2).sum(axis=0)
+        delta = b_mean - acc["mean_state"]
+        total = seen + b
+        acc["mean_state"] += delta * b / total
+        m2 = m2 + b_m2 + delta * delta * seen * b / total
+        w_old, w_new = seen / total, b / total
+        acc["mean_system_index"] = acc["mean_system_index"] * w_old + si.mean(axis=0) * w_new
+        acc["mean_abs_system_index"] = acc["mean_abs_system_index"] * w_old + np.abs(si).mean(axis=0) * w_new
+        acc["mean_energy"] = acc["mean_energy"] * w_old + (block * block).mean(axis=0) * w_new
+        acc["tail_freq"] = acc["tail_freq"] * w_old + (np.abs(si) > si_thresh).mean(axis=0) * w_new
+        np.maximum(acc["max_abs_system_index"], np.abs(si).max(axis=0), out=acc["max_abs_system_index"])
+        seen = total
+
+    s = np.full(k, float(s_init))
+    row = 0
+    for t in range(n):
+        # Same operation order as dynamical_step
+        s = rho * s + one_minus_rho * oracle_list[t] + beta * (u_list[t] * s)
+        np.minimum(np.maximum(s, -1.0, out=s), 1.0, out=s)
+        buf[row] = s
+        row += 1
+        if summary and row == len(buf):
+            flush(buf)
+            row = 0
+
+    if summary:
+        if row:
+            flush(buf[:row])
+        acc["var_state"] = m2 / seen if seen else m2
+        acc["final_state"] = s
+        out.update(acc)
+        return out
+
+    out["state"] = buf
+    out["system_index"] = np.tanh(buf + alpha * (buf * np.abs(buf)))
+    out["energy"] = buf * buf
     return out
 
 
+def _extended_nash_series(macro_list: List[float], systemic: List[float]) -> List[float]:
+    """
+    ExtendedNashEq per step: macro + systemic where the systemic series covers
+    the step (prices available), macro-only after it or where it is None, as in
+    predict_macro_systemic.
+    """
+    from engine.ramanash_kernel import extended_nash_eq
+
+    k = min(len(systemic), len(macro_list))
+    head = [m if s is None else extended_nash_eq(m, s) for m, s in zip(macro_list[:k], systemic[:k])]
+    return head + list(macro_list[k:])
+
+
 def dynamical_from_market(
     prices: List[float],
     vols: List[float],
-    macro_factors: Dict[str, Any],
+    macro_factors: Union[Mapping[str, Any], Sequence[Mapping[str, Any]]],
     vol_offset: int = 20,
     rho: float = RHO_DEFAULT,
     beta: float = BETA_DEFAULT,
     alpha: float = ALPHA_DEFAULT,
-) -> List[Dict[str, Any]]:
+    as_frame: bool = False,
+) -> Union[List[Dict[str, Any]], DynamicalFrame]:
     """
     Build dynamical system from market data.
-    Uses predict_macro_systemic when prices/vols available, else macro-only.
+    ExtendedNashEq (as in predict_macro_systemic) where prices cover the bar, else macro-only.
+    macro_factors: one mapping, or one per vol index (time-varying macro).
+    Single pass: one systemic series, one macro evaluation per distinct factor set,
+    incremental rank window for UVRK_norm.
+    """
+    from engine.ramanash_kernel import market_inputs
+    from engine.ramanash_systemic import systemic_series, systemic_stress_full
+
+    start, stop, _, macro_list = market_inputs(prices, vols, macro_factors, vol_offset, systemic=False)
+    uvrk_norms = _uvrk_norm_series(vols, start, stop)
+
+    # predict_macro_systemic uses the systemic layer only while prices cover vol index i
+    sys_stop = max(start, min(stop, len(prices) - vol_offset)) if prices else start
+    try:
+        systemic = systemic_series(prices, vols, start, sys_stop, vol_offset)["systemic_stress"]
+    except Exception:
+        systemic = None
+
+    if systemic is None:
+        # Same per-bar fallback as predict_macro_systemic
+        systemic = []
+        for i in range(start, sys_stop):
+            try:
+                systemic.append(systemic_stress_full(prices, vols, i, vol_offset)["systemic_stress"])
+            except Exception:
+                systemic.append(None)
+    extended_nash_eqs = _extended_nash_series(macro_list, systemic)
+
+    return run_dynamical(uvrk_norms, extended_nash_eqs, rho=rho, beta=beta, alpha=alpha, as_frame=as_frame)
+
+
+class DynamicalStream:
     """
-    from engine.ramanash_kernel import predict_macro_systemic
+    Dynamical system one (UVRK_norm, ExtendedNashEq) pair at a time.
 
-    uvrk_norms = []
-    extended_nash_eqs = []
+    push() returns the same dict run_dynamical produces for that step.
+    Keeps a run counter of consecutive positive, strictly increasing ΔE, so
+    pre_crisis (== pre_crisis_signal(all steps so far, window)) is O(1) per
+    tick. State is a handful of floats; to_state()/from_state() resume exactly.
+    """
 
-    for i in range(vol_offset + 30, len(vols) - 1):
-        vol = vols[i]
-        hist = vols[max(0, i - 60) : i + 1]
-        uvrk_n = _uvrk_norm(vol, hist)
+    def __init__(
+        self,
+        rho: float = RHO_DEFAULT,
+        beta: float = BETA_DEFAULT,
+        alpha: float = ALPHA_DEFAULT,
+        s_init: float = 0.0,
+        window: int = 5,
+    ):
+        assert rho + abs(beta) < 1, f"Stability violated: ρ+|β|={rho + abs(beta):.3f} >= 1"
+        self.rho = rho
+        self.beta = beta
+        self.alpha = alpha
+        self.window = window
+        self.s = s_init
+        self.e_prev = s_init * s_init
+        self.n = 0
+        self.run = 0          # trailing count of ΔE > 0, each above the one before
+        self.de_prev = 0.0
+        self.last: Optional[Dict[str, float]] = None
 
-        if i + vol_offset < len(prices):
-            r = predict_macro_systemic(
-                0.04, macro_factors,
-                prices=prices, vols=vols, vol_idx=i,
-                vol_offset=vol_offset,
-            )
+    def push(self, uvrk_norm: float, extended_nash_eq: float) -> Dict[str, float]:
+        step = dynamical_step(
+            uvrk_norm + extended_nash_eq, uvrk_norm, self.s,
+            rho=self.rho, beta=self.beta, alpha=self.alpha,
+        )
+        de = step["energy"] - self.e_prev
+        step["delta_energy"] = de
+        self.e_prev = step["energy"]
+        self.s = step["state"]
+
+        if de > 0 and self.run > 0 and de > self.de_prev:
+            self.run += 1
+        elif de > 0:
+            self.run = 1
         else:
-            r = predict_macro_systemic(0.04, macro_factors)
+            self.run = 0
+        self.de_prev = de
+        self.n += 1
+        self.last = step
+        return step
+
+    @property
+    def pre_crisis(self) -> bool:
+        """ΔE positive and accelerating over the last `window` steps."""
+        return self.n >= self.window + 1 and self.run >= self.window
 
-        uvrk_norms.append(uvrk_n)
-        extended_nash_eqs.append(r["nash_eq"])
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot."""
+        return {
+            "rho": self.rho,
+            "beta": self.beta,
+            "alpha": self.alpha,
+            "window": self.window,
+            "s": self.s,
+            "e_prev": self.e_prev,
+            "n": self.n,
+            "run": self.run,
+            "de_prev": self.de_prev,
+        }
 
-    return run_dynamical(uvrk_norms, extended_nash_eqs, rho=rho, beta=beta, alpha=alpha)
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "DynamicalStream":
+        stream = cls(
+            rho=state.get("rho", RHO_DEFAULT),
+            beta=state.get("beta", BETA_DEFAULT),
+            alpha=state.get("alpha", ALPHA_DEFAULT),
+            window=state.get("window", 5),
+        )
+        stream.s = state["s"]
+        stream.e_prev = state["e_prev"]
+        stream.n = state.get("n", 0)
+        stream.run = state.get("run", 0)
+        stream.de_prev = state.get("de_prev", 0.0)
+        return stream
 
 
 def pre_crisis_signal(steps: List[Dict[str, float]], window: int = 5) -> bool:
@@ -0,0 +1,158 @@
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║              RAMANASH EPISODES — Run-Length Index of Crisis Episodes          ║
+║                                                                               ║
+║  Contiguous trigger / tail days stored as start, end, peak arrays.            ║
+║  Overlap and day-count queries in O(log n); tail means in O(episodes).        ║
+║                                                                               ║
+║  © 2025 Jennifer Leigh West • The Forgotten Code Research Institute           ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import bisect
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from engine.ramanash_systemic import VolPrefixIndex
+
+
+class Episode(NamedTuple):
+    start: int   # first day (inclusive)
+    end: int     # last day (inclusive)
+    peak: int    # day of the extreme value inside the episode
+
+
+class EpisodeIndex:
+    """
+    Run-length encoding of a boolean day mask (trigger fired, F_t < f_thresh, …).
+
+    Build once per run, O(n). Then:
+      overlapping(d1, d2)   episodes intersecting days [d1, d2]       O(log n + k)
+      days_between(d1, d2)  masked days inside [d1, d2]               O(log n)
+      n_days                masked days in total                      O(1)
+      mean_over(index)      mean of a series over masked days         O(episodes)
+    index is a VolPrefixIndex over the series (e.g. future vols); means agree
+    with the direct masked mean to float rounding.
+    """
+
+    __slots__ = ("n", "starts", "ends", "peaks", "_cum", "_starts_list", "_ends_list")
+
+    def __init__(self, n: int, starts: np.ndarray, ends: np.ndarray, peaks: np.ndarray):
+        self.n = n
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+        self.peaks = np.asarray(peaks, dtype=np.int64)
+        # _cum[k] = masked days in episodes [0, k)
+        self._cum = np.concatenate([[0], np.cumsum(self.ends - self.starts + 1)]).tolist()
+        self._starts_list = self.starts.tolist()
+        self._ends_list = self.ends.tolist()
+
+    # ── build ───────────────────────────────────────────────────────────────
+    @classmethod
+    def from_mask(
+        cls,
+        mask: Sequence[bool],
+        values: Optional[Sequence[float]] = None,
+        peak: str = "min",
+    ) -> "EpisodeIndex":
+        """
+        Episodes of consecutive True days. values/peak pick each episode's
+        peak day: "min", "max" or "absmax" of values (default: first day).
+        """
+        m = np.asarray(mask, dtype=bool)
+        edges = np.diff(m.astype(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1) - 1
+        if values is None or not len(starts):
+            peaks = starts.copy()
+        else:
+            v = np.asarray(values, dtype=np.float64)
+            if peak == "min":
+                pick = np.argmin
+            elif peak == "max":
+                pick = np.argmax
+            elif peak == "absmax":
+                pick = lambda x: np.argmax(np.abs(x))
+            else:
+                raise ValueError(f"peak must be 'min', 'max' or 'absmax', got {peak!r}")
+            peaks = np.array([s + pick(v[s:e + 1]) for s, e in zip(starts.tolist(), ends.tolist())], dtype=np.int64)
+        return cls(len(m), starts, ends, peaks)
+
+    @classmethod
+    def from_beast(cls, steps, kind: str = "tail", f_thresh: float = -0.7) -> "EpisodeIndex":
+        """
+        From beast_run output (list of dicts or BeastFrame).
+        kind="tail":    F_t < f_thresh (as in tail_lift), peak = min F_t
+        kind="trigger": trigger == 1, peak = max |S_t|
+        """
+        def column(field):
+            if isinstance(steps, list):
+                return np.array([s[field] for s in steps], dtype=np.float64)
+            return np.asarray(steps[field], dtype=np.float64)
+
+        if kind == "tail":
+            f = column("crisis_field")
+            return cls.from_mask(f < f_thresh, f, peak="min")
+        if kind == "trigger":
+            return cls.from_mask(column("trigger") == 1, column("stress"), peak="absmax")
+        raise ValueError(f"kind must be 'tail' or 'trigger', got {kind!r}")
+
+    # ── queries ─────────────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return len(self._starts_list)
+
+    def __getitem__(self, k: int) -> Episode:
+        return Episode(self._starts_list[k], self._ends_list[k], int(self.peaks[k]))
+
+    def __iter__(self):
+        return (self[k] for k in range(len(self)))
+
+    @property
+    def n_days(self) -> int:
+        return self._cum[-1]
+
+    def _span(self, d1: int, d2: int):
+        """Episode index range [lo, hi) intersecting [d1, d2]."""
+        lo = bisect.bisect_left(self._ends_list, d1)
+        hi = bisect.bisect_right(self._starts_list, d2)
+        return lo, max(lo, hi)
+
+    def overlapping(self, d1: int, d2: int) -> List[Episode]:
+        """Episodes with at least one day in [d1, d2] (inclusive)."""
+        lo, hi = self._span(d1, d2)
+        return [self[k] for k in range(lo, hi)]
+
+    def days_between(self, d1: int, d2: int) -> int:
+        """Masked days inside [d1, d2] (inclusive)."""
+        lo, hi = self._span(d1, d2)
+        if lo == hi:
+            return 0
+        days = self._cum[hi] - self._cum[lo]
+        days -= max(0, d1 - self._starts_list[lo])
+        days -= max(0, self._ends_list[hi - 1] - d2)
+        return days
+
+    def mask(self) -> np.ndarray:
+        m = np.zeros(self.n, dtype=bool)
+        for s, e in zip(self._starts_list, self._ends_list):
+            m[s:e + 1] = True
+        return m
+
+    def mean_over(self, series: Union[VolPrefixIndex, Sequence[float]]) -> Optional[float]:
+        """
+        Mean of series over masked days (None if there are none).
+        Pass a VolPrefixIndex to reuse one prefix pass across queries.
+        """
+        if not self.n_days:
+            return None
+        index = series if isinstance(series, VolPrefixIndex) else VolPrefixIndex(list(series))
+        total = sum(index.sum(s, e + 1) for s, e in zip(self._starts_list, self._ends_list))
+        return total / self.n_days
+
+    def lift(self, series: Union[VolPrefixIndex, Sequence[float]], baseline: float) -> float:
+        """tail_lift from the index: mean(series over masked days) / baseline - 1."""
+        mean = self.mean_over(series)
+        if mean is None or baseline <= 0:
+            return 0.0
+        return mean / baseline - 1.0
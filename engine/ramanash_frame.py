@@ -0,0 +1,118 @@
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║              RAMANASH FRAME — Struct-of-Arrays Step Containers                ║
+║                                                                               ║
+║  One contiguous array per field instead of one dict per step.                 ║
+║  Columns by name, rows as dicts: drop-in for the old list-of-dicts output.    ║
+║                                                                               ║
+║  © 2025 Jennifer Leigh West • The Forgotten Code Research Institute           ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class ColumnFrame:
+    """
+    Fixed-schema columnar container.
+
+    frame["field"] -> column array (a view, no copy)
+    frame[t]       -> row dict (Python floats; INT_FIELDS as int)
+    frame[a:b]     -> frame over the same columns (views)
+    iter(frame)    -> row dicts, so `for s in steps: s["stress"]` keeps working
+
+    Subclasses set FIELDS (column order) and INT_FIELDS (stored as int8).
+    """
+
+    FIELDS: Tuple[str, ...] = ()
+    INT_FIELDS: Tuple[str, ...] = ()
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Mapping[str, np.ndarray]):
+        missing = [f for f in self.FIELDS if f not in columns]
+        if missing:
+            raise ValueError(f"{type(self).__name__} missing fields: {missing}")
+        self.columns: Dict[str, np.ndarray] = {f: columns[f] for f in self.FIELDS}
+        lengths = {len(c) for c in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"{type(self).__name__} columns differ in length: {sorted(lengths)}")
+
+    @classmethod
+    def _dtype(cls, field: str):
+        return np.int8 if field in cls.INT_FIELDS else np.float64
+
+    @classmethod
+    def empty(cls, n: int) -> "ColumnFrame":
+        """Preallocated frame of n rows (float columns start as NaN)."""
+        cols = {}
+        for f in cls.FIELDS:
+            dt = cls._dtype(f)
+            cols[f] = np.zeros(n, dtype=dt) if dt is np.int8 else np.full(n, np.nan)
+        return cls(cols)
+
+    @classmethod
+    def from_steps(cls, steps: Sequence[Mapping[str, Any]]) -> "ColumnFrame":
+        """Build from a list of per-step dicts (extra keys are ignored)."""
+        return cls({f: np.array([s[f] for s in steps], dtype=cls._dtype(f)) for f in cls.FIELDS})
+
+    def set_row(self, t: int, step: Mapping[str, Any]) -> None:
+        for f, col in self.columns.items():
+            col[t] = step[f]
+
+    # ── access ──────────────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return len(self.columns[self.FIELDS[0]]) if self.FIELDS else 0
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.columns
+
+    def keys(self):
+        return self.columns.keys()
+
+    def row(self, t: int) -> Dict[str, Any]:
+        return {f: col[t].item() for f, col in self.columns.items()}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, slice):
+            return type(self)({f: col[key] for f, col in self.columns.items()})
+        n = len(self)
+        t = int(key)
+        if t < 0:
+            t += n
+        if not 0 <= t < n:
+            raise IndexError(f"row {key} out of range for {type(self).__name__} of length {n}")
+        return self.row(t)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.to_list())
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Back to the list-of-dicts layout (values identical to the columns)."""
+        names = list(self.columns)
+        cols = [col.tolist() for col in self.columns.values()]
+        return [dict(zip(names, vals)) for vals in zip(*cols)]
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        return dict(self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(col.nbytes for col in self.columns.values())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n={len(self)}, fields={list(self.columns)})"
+
+
+def concat_frames(frames: Sequence[ColumnFrame], cls: Optional[type] = None) -> ColumnFrame:
+    """Stack frames of one schema end to end."""
+    if not frames and cls is None:
+        raise ValueError("concat_frames needs at least one frame or an explicit cls")
+    cls = cls or type(frames[0])
+    if not frames:
+        return cls.empty(0)
+    return cls({f: np.concatenate([fr.columns[f] for fr in frames]) for f in cls.FIELDS})
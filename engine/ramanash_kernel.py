@@ -16,10 +16,19 @@ THRESHOLD_SHOCK_HIGH = -0.38
 THRESHOLD_SHOCK_MID = -0.35
 THRESHOLD_SHOCK_LOW = -0.30
 
+# big_short_signal codes (predict_macro_batch, MacroRecord): BIG_SHORT_SIGNALS[code]
+BIG_SHORT_SIGNALS = ("CRISIS BREWING", "NEUTRAL", "STEADY")
+SIGNAL_CRISIS, SIGNAL_NEUTRAL, SIGNAL_STEADY = 0, 1, 2
+
 import math
-from typing import Dict, Any, Optional, List
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Mapping, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
 
 from engine.uvrk import probit
+from engine.ramanash_systemic import SYSTEMIC_CACHE, SystemicCache, systemic_series, systemic_stress_full
 
 
 def ramanujan_probit(p: float) -> float:
@@ -38,16 +47,18 @@ def ramanujan_probit(p: float) -> float:
     return base + accel if p < 0.5 else base - accel
 
 
-def predict_macro(
-    base_vol: float,
-    macro_factors: Dict[str, float],
-    nash_strength: float = 0.25,
-    rank: float = 0.5,
-) -> Dict[str, Any]:
-    """
-    RAMANASH composite index: media + spending + war + materials.
-    Macro stress index (not game-theoretic equilibrium) — volatility adjustment.
-    """
+class MacroRecord(NamedTuple):
+    """Numeric predict_macro / predict_macro_systemic outputs (as_record=True)."""
+    ramanash_vol: float
+    nash_eq: float
+    nash_score: float
+    signal: int              # BIG_SHORT_SIGNALS[signal]
+    macro_stress: float      # == nash_eq for predict_macro
+    systemic_stress: Optional[float]
+
+
+def _macro_nash_eq(macro_factors: Mapping[str, float], nash_strength: float) -> Tuple[float, float, float]:
+    """(nash_eq, geo_risk, spending_pressure) from the four macro factors."""
     sentiment = macro_factors.get("media_sentiment", 0.5)
     spending_pressure = macro_factors.get("spending_habits", 0.5)
     geo_risk = macro_factors.get("war_conflict", 0.5)
@@ -56,6 +67,20 @@ def predict_macro(
     nash_eq = (
         sentiment * geo_risk + (1 - spending_pressure) * materials
     ) * nash_strength
+    return nash_eq, geo_risk, spending_pressure
+
+
+def _macro_cascade(
+    nash_eq: float,
+    base_vol: float,
+    rank: float,
+    geo_risk: float,
+    spending_pressure: float,
+) -> Tuple[float, float, int]:
+    """
+    Shock / multiplier / signal cascade shared by predict_macro and
+    predict_macro_systemic. Returns (ramanash_vol, nash_score, signal code).
+    """
     if nash_eq < 0:
         if nash_eq < THRESHOLD_SHOCK_HIGH:
             shock_coef = 0.75
@@ -79,27 +104,258 @@ def predict_macro(
         adjusted *= 1.06
 
     if nash_eq < THRESHOLD_CRISIS:
-        big_short = "CRISIS BREWING"
+        signal = SIGNAL_CRISIS
     elif nash_eq > THRESHOLD_STEADY:
-        big_short = "STEADY"
+        signal = SIGNAL_STEADY
     else:
-        big_short = "NEUTRAL"
+        signal = SIGNAL_NEUTRAL
 
     # Nash score: 0.70 + 0.30*|nash_eq|. Not calibrated; use "score" for institutional clarity.
     nash_score = 0.70 + 0.30 * abs(nash_eq)
     if geo_risk >= 0.75:
         nash_score = min(0.99, nash_score + 0.05)
 
+    return max(0.001, adjusted), nash_score, signal
+
+
+def predict_macro(
+    base_vol: float,
+    macro_factors: Dict[str, float],
+    nash_strength: float = 0.25,
+    rank: float = 0.5,
+    as_record: bool = False,
+) -> Union[Dict[str, Any], MacroRecord]:
+    """
+    RAMANASH composite index: media + spending + war + materials.
+    Macro stress index (not game-theoretic equilibrium) — volatility adjustment.
+    as_record=True returns a MacroRecord (numbers only, no dict).
+    """
+    nash_eq, geo_risk, spending_pressure = _macro_nash_eq(macro_factors, nash_strength)
+    ramanash_vol, nash_score, signal = _macro_cascade(nash_eq, base_vol, rank, geo_risk, spending_pressure)
+    if as_record:
+        return MacroRecord(ramanash_vol, nash_eq, nash_score, signal, nash_eq, None)
+
     return {
-        "ramanash_vol": max(0.001, adjusted),
+        "ramanash_vol": ramanash_vol,
         "nash_confidence": nash_score,  # backward compat; prefer nash_score
         "nash_score": nash_score,
-        "big_short_signal": big_short,
+        "big_short_signal": BIG_SHORT_SIGNALS[signal],
         "nash_eq": nash_eq,
         "macro_factors": macro_factors,
     }
 
 
+MACRO_FACTOR_KEYS = ("media_sentiment", "spending_habits", "war_conflict", "materials_avail")
+
+
+def _bucket(x: float, quantum: Optional[float]) -> float:
+    return x if quantum is None else round(x / quantum) * quantum
+
+
+class MacroMemo:
+    """
+    Bounded LRU of predict_macro results keyed by
+    (factors, base_vol, rank, nash_strength).
+
+    With every quantum None (default) keys are the exact inputs and results
+    equal predict_macro. A quantum snaps that input to the nearest multiple
+    before lookup and evaluation, so a bucket always maps to the result at
+    its centre (deterministic, independent of call order).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        factor_quantum: Optional[float] = None,
+        vol_quantum: Optional[float] = None,
+        rank_quantum: Optional[float] = None,
+    ):
+        self.maxsize = maxsize
+        self.factor_quantum = factor_quantum
+        self.vol_quantum = vol_quantum
+        self.rank_quantum = rank_quantum
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def predict(
+        self,
+        base_vol: float,
+        macro_factors: Dict[str, float],
+        nash_strength: float = 0.25,
+        rank: float = 0.5,
+    ) -> Dict[str, Any]:
+        """predict_macro(base_vol, macro_factors, nash_strength, rank), memoized. Returns a copy."""
+        # Missing factors default to 0.5 in predict_macro, so they key as 0.5
+        factors = tuple(_bucket(macro_factors.get(k, 0.5), self.factor_quantum) for k in MACRO_FACTOR_KEYS)
+        base_vol = _bucket(base_vol, self.vol_quantum)
+        rank = _bucket(rank, self.rank_quantum)
+        key = (factors, base_vol, rank, nash_strength)
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return dict(hit, macro_factors=macro_factors)
+        result = predict_macro(base_vol, dict(zip(MACRO_FACTOR_KEYS, factors)), nash_strength, rank)
+        with self._lock:
+            self.misses += 1
+            self._data[key] = result
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return dict(result, macro_factors=macro_factors)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+def predict_macro_batch(
+    base_vol: Union[float, Sequence[float]],
+    media_sentiment: Sequence[float],
+    spending_habits: Sequence[float],
+    war_conflict: Sequence[float],
+    materials_avail: Sequence[float],
+    nash_strength: float = 0.25,
+    rank: Union[float, Sequence[float]] = 0.5,
+) -> Dict[str, np.ndarray]:
+    """
+    predict_macro over arrays of factors (scalars broadcast).
+    Every branch is a mask; columns equal predict_macro elementwise, exactly.
+    Returns {"ramanash_vol", "nash_eq", "nash_score", "signal"}; signal is
+    int8, BIG_SHORT_SIGNALS[signal] is the big_short_signal string.
+    """
+    sentiment = np.asarray(media_sentiment, dtype=np.float64)
+    spending_pressure = np.asarray(spending_habits, dtype=np.float64)
+    geo_risk = np.asarray(war_conflict, dtype=np.float64)
+    materials = np.asarray(materials_avail, dtype=np.float64)
+    base_vol = np.asarray(base_vol, dtype=np.float64)
+    rank = np.asarray(rank, dtype=np.float64)
+
+    nash_eq = (sentiment * geo_risk + (1 - spending_pressure) * materials) * nash_strength
+    nash_eq, geo_risk, spending_pressure, base_vol, rank = np.broadcast_arrays(
+        nash_eq, geo_risk, spending_pressure, base_vol, rank
+    )
+
+    shock_coef = np.select(
+        [
+            nash_eq < THRESHOLD_SHOCK_HIGH,
+            (nash_eq < THRESHOLD_SHOCK_MID) & (geo_risk > 0.7),
+            nash_eq < THRESHOLD_SHOCK_LOW,
+        ],
+        [0.75, 0.72, 0.65],
+        default=0.5,
+    )
+    adjusted = np.where(
+        nash_eq < 0,
+        base_vol * (1 + np.abs(nash_eq) * shock_coef),
+        base_vol * (1 + nash_eq),
+    )
+    # Multipliers in predict_macro's order (float products are not associative)
+    adjusted = np.where(np.abs(rank - 0.5) > 0.4, adjusted * 1.25, adjusted)
+    adjusted = np.where(geo_risk > 0.75, adjusted * 1.15, adjusted)
+    adjusted = np.where(spending_pressure < 0.45, adjusted * 1.06, adjusted)
+
+    signal = np.full(nash_eq.shape, SIGNAL_NEUTRAL, dtype=np.int8)
+    signal[nash_eq > THRESHOLD_STEADY] = SIGNAL_STEADY
+    signal[nash_eq < THRESHOLD_CRISIS] = SIGNAL_CRISIS
+
+    nash_score = 0.70 + 0.30 * np.abs(nash_eq)
+    nash_score = np.where(geo_risk >= 0.75, np.minimum(0.99, nash_score + 0.05), nash_score)
+
+    return {
+        "ramanash_vol": np.maximum(0.001, adjusted),
+        "nash_eq": np.array(nash_eq),
+        "nash_score": nash_score,
+        "signal": signal,
+    }
+
+
+def macro_stress_series(
+    macro_factors: Union[Mapping[str, float], Sequence[Mapping[str, float]]],
+    n: int,
+) -> List[float]:
+    """
+    MacroStress (predict_macro nash_eq) for n steps.
+    One factor dict → evaluated once. A sequence of dicts (one per step) →
+    evaluated once per distinct factor set.
+    """
+    if isinstance(macro_factors, Mapping):
+        return [_macro_nash_eq(macro_factors, 0.25)[0]] * n
+    if len(macro_factors) < n:
+        raise ValueError(f"need {n} macro factor sets, got {len(macro_factors)}")
+    memo: Dict[Tuple, float] = {}
+    out = []
+    for factors in macro_factors[:n]:
+        key = tuple(sorted(factors.items()))
+        stress = memo.get(key)
+        if stress is None:
+            stress = memo[key] = _macro_nash_eq(factors, 0.25)[0]
+        out.append(stress)
+    return out
+
+
+def span_macro_factors(
+    macro_factors: Union[Mapping[str, float], Sequence[Mapping[str, float]]],
+    start: int,
+    stop: int,
+) -> Union[Mapping[str, float], Sequence[Mapping[str, float]]]:
+    """One mapping → unchanged (static macro); a per-vol-index sequence → its [start, stop) rows."""
+    if isinstance(macro_factors, Mapping):
+        return macro_factors
+    return macro_factors[start:stop]
+
+
+class MarketInputs(NamedTuple):
+    start: int                                    # first vol index (vol_offset + 30)
+    stop: int                                     # one past the last (len(vols) - 1)
+    systemic: Optional[Dict[str, List[float]]]    # systemic_series over [start, stop)
+    macro_stress: Optional[List[float]]           # MacroStress per row
+
+
+def market_inputs(
+    prices: List[float],
+    vols: List[float],
+    macro_factors: Optional[Union[Mapping[str, float], Sequence[Mapping[str, float]]]] = None,
+    vol_offset: int = 20,
+    systemic: bool = True,
+) -> MarketInputs:
+    """
+    Row span and shared inputs of the *_from_market entry points: row t is
+    vol index start + t. macro_factors is one mapping or one per vol index
+    (None skips MacroStress); systemic=False skips the systemic series.
+    """
+    start, stop = vol_offset + 30, len(vols) - 1
+    n = max(0, stop - start)
+    sys_cols = systemic_series(prices, vols, start, stop, vol_offset) if systemic else None
+    macro = None
+    if macro_factors is not None:
+        macro = macro_stress_series(span_macro_factors(macro_factors, start, stop), n)
+    return MarketInputs(start, stop, sys_cols, macro)
+
+
+def extended_nash_eq(macro_stress: float, systemic_val: float, lambda_macro: float = 0.5) -> float:
+    """ExtendedNashEq = λ * MacroStress + (1-λ) * SystemicStress, bounded [-1, 1]."""
+    extended_nash = lambda_macro * macro_stress + (1 - lambda_macro) * systemic_val
+    return max(-1.0, min(1.0, extended_nash))
+
+
 def predict_macro_systemic(
     base_vol: float,
     macro_factors: Dict[str, float],
@@ -110,22 +366,28 @@ def predict_macro_systemic(
     rank: float = 0.5,
     lambda_macro: float = 0.5,
     vol_offset: int = 20,
-) -> Dict[str, Any]:
+    cache: Optional[SystemicCache] = SYSTEMIC_CACHE,
+    series_digest: Optional[bytes] = None,
+    as_record: bool = False,
+) -> Union[Dict[str, Any], MacroRecord]:
     """
     Extended RAMANASH: MacroStress + SystemicStress.
     ExtendedNashEq = λ * MacroStress + (1-λ) * SystemicStress.
     When prices/vols/vol_idx provided, uses full systemic layer. Else macro-only.
+    Systemic lookups go through `cache` (content-fingerprinted); pass None to recompute.
+    Per-day loops over fixed series can pass series_digest=ramanash_systemic.series_digest(prices, vols)
+    once to skip the O(n) per-call fingerprint.
+    as_record=True returns a MacroRecord (numbers only, no dict).
     """
-    macro_result = predict_macro(base_vol, macro_factors, nash_strength, rank)
-    macro_stress = macro_result["nash_eq"]
+    macro_stress, geo_risk, spending_pressure = _macro_nash_eq(macro_factors, nash_strength)
 
     if prices and vols is not None and vol_idx is not None and len(prices) >= vol_offset + vol_idx and len(vols) > vol_idx:
         try:
-            from engine.ramanash_systemic import systemic_stress_full
-            systemic = systemic_stress_full(prices, vols, vol_idx, vol_offset)
-            systemic_val = systemic["systemic_stress"]
-            extended_nash = lambda_macro * macro_stress + (1 - lambda_macro) * systemic_val
-            extended_nash = max(-1.0, min(1.0, extended_nash))
+            if cache is not None:
+                systemic = cache.get(prices, vols, vol_idx, vol_offset, digest=series_digest)
+            else:
+                systemic = systemic_stress_full(prices, vols, vol_idx, vol_offset)
+            extended_nash = extended_nash_eq(macro_stress, systemic["systemic_stress"], lambda_macro)
         except Exception:
             extended_nash = macro_stress
             systemic = {}
@@ -133,47 +395,19 @@ def predict_macro_systemic(
         extended_nash = macro_stress
         systemic = {}
 
-    # Apply same shock/vol logic using extended_nash
-    sentiment = macro_factors.get("media_sentiment", 0.5)
-    spending_pressure = macro_factors.get("spending_habits", 0.5)
-    geo_risk = macro_factors.get("war_conflict", 0.5)
-
-    if extended_nash < 0:
-        if extended_nash < THRESHOLD_SHOCK_HIGH:
-            shock_coef = 0.75
-        elif extended_nash < THRESHOLD_SHOCK_MID and geo_risk > 0.7:
-            shock_coef = 0.72
-        elif extended_nash < THRESHOLD_SHOCK_LOW:
-            shock_coef = 0.65
-        else:
-            shock_coef = 0.5
-        adjusted = base_vol * (1 + abs(extended_nash) * shock_coef)
-    else:
-        adjusted = base_vol * (1 + extended_nash)
-
-    if abs(rank - 0.5) > 0.4:
-        adjusted *= 1.25
-    if geo_risk > 0.75:
-        adjusted *= 1.15
-    if spending_pressure < 0.45:
-        adjusted *= 1.06
-
-    if extended_nash < THRESHOLD_CRISIS:
-        big_short = "CRISIS BREWING"
-    elif extended_nash > THRESHOLD_STEADY:
-        big_short = "STEADY"
-    else:
-        big_short = "NEUTRAL"
-
-    nash_score = 0.70 + 0.30 * abs(extended_nash)
-    if geo_risk >= 0.75:
-        nash_score = min(0.99, nash_score + 0.05)
+    # Same shock/vol logic, run once on extended_nash
+    ramanash_vol, nash_score, signal = _macro_cascade(extended_nash, base_vol, rank, geo_risk, spending_pressure)
+    if as_record:
+        return MacroRecord(
+            ramanash_vol, extended_nash, nash_score, signal, macro_stress,
+            systemic.get("systemic_stress", 0) if systemic else None,
+        )
 
     out = {
-        "ramanash_vol": max(0.001, adjusted),
+        "ramanash_vol": ramanash_vol,
         "nash_confidence": nash_score,
         "nash_score": nash_score,
-        "big_short_signal": big_short,
+        "big_short_signal": BIG_SHORT_SIGNALS[signal],
         "nash_eq": extended_nash,
         "macro_factors": macro_factors,
         "macro_stress": macro_stress,
@@ -0,0 +1,261 @@
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║              RAMANASH PANEL — Systemic Layer over Assets × Days               ║
+║                                                                               ║
+║  LCI, LSI, CSI, FSI for a whole price matrix at once.                         ║
+║  Vectorized rolling windows, NaN-aware, optional thread pool by asset block.  ║
+║                                                                               ║
+║  © 2025 Jennifer Leigh West • The Forgotten Code Research Institute           ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+PANEL_FIELDS = ("lci", "lsi", "csi", "fsi", "systemic_stress", "vol")
+
+# Window lengths of the scalar systemic layer (engine/ramanash_systemic.py)
+_WINDOW_SHORT = 7
+_WINDOW_LONG = 30
+_WINDOW_JUMP = 5
+_WINDOW_NORM = 60
+
+
+def _rolling_max(x: np.ndarray, w: int) -> np.ndarray:
+    """
+    out[:, i] = max(x[:, max(0, i-w+1) : i+1]) along axis 1.
+    van Herk / Gil-Werman block prefix/suffix maxima: O(n) per row.
+    """
+    a, n = x.shape
+    pad = w - 1
+    nb = -(-(n + pad) // w)
+    y = np.full((a, nb * w), -np.inf)
+    y[:, pad : pad + n] = x
+    blocks = y.reshape(a, nb, w)
+    pre = np.maximum.accumulate(blocks, axis=2).reshape(a, nb * w)
+    suf = np.maximum.accumulate(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(a, nb * w)
+    end = np.arange(pad, pad + n)
+    return np.maximum(suf[:, end - pad], pre[:, end])
+
+
+def _rolling_min(x: np.ndarray, w: int) -> np.ndarray:
+    return -_rolling_max(-x, w)
+
+
+def _window_sum(x: np.ndarray, w: int) -> np.ndarray:
+    """
+    out[:, i] = x[:, i-w+1] + ... + x[:, i], added left to right (zeros before column 0).
+    Each sum depends only on its own window, so chunked runs reproduce
+    in-memory runs bit for bit.
+    """
+    a, n = x.shape
+    y = np.concatenate([np.zeros((a, w - 1)), x], axis=1)
+    s = y[:, :n].copy()
+    for j in range(1, w):
+        s += y[:, j : j + n]
+    return s
+
+
+def _panel_block(
+    prices: np.ndarray,
+    vol_window: int,
+    annualize: float,
+) -> Dict[str, np.ndarray]:
+    """
+    Systemic indices for a gap-free block of positive prices (assets × days).
+    Column k holds the value for vol index i = k - vol_window; warm-up columns are 0.
+    Every value depends only on its own trailing windows (at most
+    vol_window + 61 prices), which is what lets systemic_memmap chunk the input.
+    """
+    a, t = prices.shape
+    w = vol_window
+    out = {k: np.zeros((a, t)) for k in PANEL_FIELDS}
+    out["vol"][:, :w] = np.nan
+    nv = t - w
+    if nv <= 0:
+        return out
+
+    r = np.log(prices[:, 1:] / prices[:, :-1])
+    mean = _window_sum(r, w)[:, w - 1 :] / w
+    var = np.zeros_like(mean)
+    for j in range(w):
+        var += (r[:, j : j + nv] - mean) ** 2
+    vols = np.sqrt(var / w) * annualize
+
+    i = np.arange(nv)
+    k = i + w
+    wl, ws = _WINDOW_LONG, _WINDOW_SHORT
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # LCI
+        v_l = _window_sum(vols, wl)[:, np.maximum(i - 1, 0)] / wl
+        p_now = prices[:, k]
+        p_prev = prices[:, np.maximum(k - wl, 0)]
+        m = np.clip((p_now / p_prev - 1) * 5, -1, 1)
+        v_max = _rolling_max(vols, _WINDOW_NORM + 1)
+        v_min = _rolling_min(vols, _WINDOW_NORM + 1)
+        rng = np.where(v_max > v_min, v_max - v_min, 0.01)
+        v_s_norm = (vols - v_min) / rng
+        v_l_norm = (v_l - v_min) / rng
+        lci = np.clip((1 - v_l_norm) * m + (v_s_norm - v_l_norm), -1, 1)
+        lci = np.where(i >= wl, lci, 0.0)
+
+        # LSI: last window_jump+1 returns ending at return k-1
+        nj = _WINDOW_JUMP + 1
+        jwin = sliding_window_view(r, nj, axis=1)
+        jstart = np.clip(k - nj, 0, jwin.shape[1] - 1)
+        r_slice = jwin[:, jstart, :]
+        abs_r = np.abs(r_slice)
+        med = np.sort(abs_r, axis=2)[:, :, nj // 2]
+        thresh = np.where(med > 0, 2.0 * med, 0.02)
+        jump = np.clip((abs_r > thresh[:, :, None]).sum(axis=2) / nj * 2, -1, 1)
+        acc = np.abs(r[:, k - 1] - r[:, k - 2])
+        a_lsi = np.clip(acc * 20, -1, 1)
+        vol_max = _rolling_max(vols, wl + 1)
+        p = np.clip(np.where(vol_max > 0, 1 - vols / vol_max, 0.5), -1, 1)
+        lsi = np.clip(jump * a_lsi + (1 - p) * jump, -1, 1)
+        lsi = np.where(i >= ws, lsi, 0.0)
+
+        # CSI: returns[ret_idx-30 : ret_idx+1], ret_idx = k - 1
+        nc = wl + 1
+        sq = r * r
+        neg = r < 0
+        end = k - 1
+        n_dn = _window_sum(neg.astype(np.float64), nc)[:, end]
+        n_up = nc - n_dn
+        d_raw = np.where(n_dn > 0, np.sqrt(_window_sum(np.where(neg, sq, 0.0), nc)[:, end] / n_dn), 0.0)
+        u_raw = np.where(n_up > 0, np.sqrt(_window_sum(np.where(neg, 0.0, sq), nc)[:, end] / n_up), 0.0)
+        mx = _rolling_max(sq, nc)[:, end]
+        d = np.clip(d_raw / (mx**0.5 + 0.01), 0, 1)
+        u = np.clip(u_raw / (mx**0.5 + 0.01), 0, 1)
+        csi = np.clip((d - u) * d, -1, 1)
+        csi = np.where(k - 1 >= wl, csi, 0.0)
+
+        # FSI
+        rv_7 = _window_sum(vols, ws + 1) / (ws + 1)
+        rv_30 = _window_sum(vols, wl + 1) / (wl + 1)
+        dv_norm = np.clip((rv_7 - rv_30) * 5, -1, 1)
+        fsi = np.clip(dv_norm * np.clip(acc * 20, -1, 1), -1, 1)
+        fsi = np.where(i >= wl, fsi, 0.0)
+
+    out["lci"][:, w:] = lci
+    out["lsi"][:, w:] = lsi
+    out["csi"][:, w:] = csi
+    out["fsi"][:, w:] = fsi
+    out["systemic_stress"][:, w:] = np.clip((lci + lsi + csi + fsi) / 4, -1, 1)
+    out["vol"][:, w:] = vols
+    return out
+
+
+def _compress(prices: np.ndarray):
+    """Left-align valid (finite, > 0) prices per row; forward-fill the tail."""
+    valid = np.isfinite(prices) & (prices > 0)
+    order = np.argsort(~valid, axis=1, kind="stable")
+    counts = valid.sum(axis=1)
+    packed = np.take_along_axis(prices, order, axis=1)
+    cols = np.arange(prices.shape[1])
+    tail = cols[None, :] >= counts[:, None]
+    last = np.take_along_axis(packed, np.maximum(counts - 1, 0)[:, None], axis=1)
+    last = np.where(counts[:, None] > 0, last, 1.0)
+    packed = np.where(tail, last, packed)
+    return packed, order, tail
+
+
+def systemic_panel(
+    prices: np.ndarray,
+    vol_window: int = 20,
+    annualize: float = 252**0.5,
+    workers: Optional[int] = None,
+    block_size: int = 64,
+) -> Dict[str, np.ndarray]:
+    """
+    Systemic layer over an assets × days price matrix.
+
+    Returns {lci, lsi, csi, fsi, systemic_stress, vol}, each assets × days and
+    aligned with the price columns. NaN (or non-positive) prices mark missing
+    days: each asset is computed on its own valid days, exactly as the scalar
+    layer would on that asset's price list, and missing days come back NaN.
+    Column k of an asset with valid-day position j matches
+    systemic_stress_full(valid_prices, _rolling_vol(valid_prices, vol_window), j - vol_window)
+    to float rounding, for every j whose vol exists in the scalar series.
+
+    workers > 1 splits assets into blocks of block_size rows and runs them on
+    a thread pool (NumPy releases the GIL inside the rolling kernels).
+    """
+    prices = np.atleast_2d(np.asarray(prices, dtype=np.float64))
+    n_assets, n_days = prices.shape
+    packed, order, tail = _compress(prices)
+
+    out = {k: np.empty((n_assets, n_days)) for k in PANEL_FIELDS}
+    starts = list(range(0, n_assets, max(1, block_size)))
+
+    def run(lo: int) -> None:
+        hi = min(lo + block_size, n_assets)
+        res = _panel_block(packed[lo:hi], vol_window, annualize)
+        for key, arr in res.items():
+            arr = np.where(tail[lo:hi], np.nan, arr)
+            np.put_along_axis(out[key][lo:hi], order[lo:hi], arr, axis=1)
+
+    if workers and workers > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(run, starts))
+    else:
+        for lo in starts:
+            run(lo)
+    return out
+
+
+def _open_prices(path: Union[str, os.PathLike]) -> np.ndarray:
+    """Read-only memory map of a float64 price file (.npy, or raw little-endian float64)."""
+    if str(path).endswith(".npy"):
+        arr = np.load(path, mmap_mode="r")
+    else:
+        arr = np.memmap(path, dtype="<f8", mode="r")
+    return arr.reshape(-1)
+
+
+def systemic_memmap(
+    price_path: Union[str, os.PathLike],
+    out_path: Union[str, os.PathLike],
+    chunk_size: int = 1_000_000,
+    vol_window: int = 20,
+    annualize: float = 252**0.5,
+) -> np.ndarray:
+    """
+    Out-of-core systemic layer for one long price series (e.g. minute bars).
+
+    Reads a memory-mapped float64 price file chunk by chunk and writes a
+    (len(PANEL_FIELDS), n) .npy memory map at out_path, one row per field in
+    PANEL_FIELDS order. The last vol_window + 61 prices of each chunk are
+    carried into the next one, which is all the window state any index
+    needs, so the output is bit-identical to systemic_panel on the whole
+    series and peak memory is proportional to chunk_size.
+
+    Prices must be finite and positive (forward-fill gaps beforehand).
+    """
+    prices = _open_prices(price_path)
+    n = prices.shape[0]
+    out = np.lib.format.open_memmap(
+        out_path, mode="w+", dtype=np.float64, shape=(len(PANEL_FIELDS), n)
+    )
+    halo = vol_window + _WINDOW_NORM + 1
+    carry = np.empty(0)
+
+    for lo in range(0, n, max(1, chunk_size)):
+        hi = min(n, lo + chunk_size)
+        chunk = np.asarray(prices[lo:hi], dtype=np.float64)
+        if not np.all(np.isfinite(chunk) & (chunk > 0)):
+            raise ValueError(f"non-finite or non-positive price in [{lo}, {hi})")
+        block = np.concatenate([carry, chunk])
+        res = _panel_block(block[None, :], vol_window, annualize)
+        skip = len(carry)
+        for f, key in enumerate(PANEL_FIELDS):
+            out[f, lo:hi] = res[key][0, skip:]
+        carry = block[-halo:]
+
+    out.flush()
+    return out
@@ -0,0 +1,114 @@
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║              RAMANASH SCENARIOS — BEAST Under Many Macro Scenarios            ║
+║                                                                               ║
+║  Systemic layer computed once, shared read-only across a process pool.        ║
+║  One columnar BeastFrame per scenario.                                        ║
+║                                                                               ║
+║  © 2025 Jennifer Leigh West • The Forgotten Code Research Institute           ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from engine.ramanash_beast import BeastFrame, beast_run, GAMMA_DEFAULT, ETA_DEFAULT
+from engine.ramanash_kernel import (
+    macro_stress_series,
+    market_inputs,
+    span_macro_factors,
+    MACRO_TARIFF_DAY_2026,
+    MACRO_FEB_23_2026,
+)
+
+MacroFactors = Union[Mapping[str, float], Sequence[Mapping[str, float]]]
+
+DEFAULT_SCENARIOS: Dict[str, Mapping[str, float]] = {
+    "tariff_day_2026": MACRO_TARIFF_DAY_2026,
+    "feb_23_2026": MACRO_FEB_23_2026,
+}
+
+# BEAST inputs kept in shared memory, one row each
+_INPUT_FIELDS = ("lci", "lsi", "csi", "fsi")
+
+# Per-worker view of the shared systemic series (set by _attach)
+_WORKER: Dict[str, Any] = {}
+
+
+def _attach(shm_name: str, n: int) -> None:
+    shm = SharedMemory(name=shm_name)
+    cols = np.ndarray((len(_INPUT_FIELDS), n), dtype=np.float64, buffer=shm.buf)
+    cols.flags.writeable = False
+    # Keep the segment mapped for the worker's lifetime: rows are read in place
+    _WORKER["shm"] = shm
+    _WORKER["inputs"] = list(cols)
+
+
+def _run_scenario(factors: MacroFactors, inputs: Sequence[Sequence[float]], params: Dict[str, Any]) -> BeastFrame:
+    n = len(inputs[0])
+    macro_list = macro_stress_series(factors, n)
+    if not params["vectorized"] and isinstance(inputs[0], np.ndarray):
+        # The scalar loop runs ~1.3x slower on numpy scalars than on Python floats
+        inputs = [x.tolist() for x in inputs]
+    return beast_run(*inputs, macro_list, as_frame=True, **params)
+
+
+def _worker_task(task):
+    name, factors, params = task
+    return name, _run_scenario(factors, _WORKER["inputs"], params).to_dict()
+
+
+def run_scenarios(
+    prices: List[float],
+    vols: List[float],
+    scenarios: Optional[Mapping[str, MacroFactors]] = None,
+    vol_offset: int = 20,
+    gamma: float = GAMMA_DEFAULT,
+    eta: float = ETA_DEFAULT,
+    static_lambda: Optional[float] = None,
+    vectorized: bool = False,
+    workers: Optional[int] = None,
+) -> Dict[str, BeastFrame]:
+    """
+    beast_from_market for every scenario, sharing one systemic pass.
+
+    scenarios: name -> macro factor dict, or one dict per vol index
+    (time-varying), as accepted by beast_from_market. Defaults to
+    DEFAULT_SCENARIOS.
+
+    workers > 1 puts the LCI/LSI/CSI/FSI series in shared memory and fans
+    scenarios out over a process pool; each worker maps the segment once
+    and reads the rows in place as read-only arrays, so only factor sets go
+    out and BeastFrame columns come back. vectorized=True runs on those
+    arrays directly; the scalar loop (vectorized=False) copies them to
+    Python floats per scenario, as it is ~1.3x faster on lists. Otherwise
+    scenarios run in-process. Frames equal beast_from_market(..., as_frame=True)
+    exactly (within 1e-12 with vectorized=True).
+    """
+    scenarios = DEFAULT_SCENARIOS if scenarios is None else scenarios
+    start, stop, sys_cols, _ = market_inputs(prices, vols, None, vol_offset)
+    inputs = [sys_cols[f] for f in _INPUT_FIELDS]
+    n = len(inputs[0])
+    params = dict(gamma=gamma, eta=eta, static_lambda=static_lambda, vectorized=vectorized)
+    # Only each scenario's own rows travel to the workers
+    tasks = [(name, span_macro_factors(factors, start, stop), params) for name, factors in scenarios.items()]
+
+    if not workers or workers <= 1 or len(tasks) <= 1 or n == 0:
+        return {name: _run_scenario(factors, inputs, p) for name, factors, p in tasks}
+
+    shm = SharedMemory(create=True, size=len(_INPUT_FIELDS) * n * 8)
+    try:
+        shared = np.ndarray((len(_INPUT_FIELDS), n), dtype=np.float64, buffer=shm.buf)
+        shared[:] = inputs
+        del shared
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)), initializer=_attach, initargs=(shm.name, n),
+        ) as pool:
+            done = dict(pool.map(_worker_task, tasks))
+    finally:
+        shm.close()
+        shm.unlink()
+    return {name: BeastFrame(done[name]) for name in scenarios}
@@ -0,0 +1,210 @@
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║              RAMANASH STABILITY — Empirical (ρ, β, α) Stability Maps          ║
+║                                                                               ║
+║  ρ + |β| < 1 is sufficient, not necessary. Scan the grid on real inputs,      ║
+║  stop saturated / non-finite trajectories early, cache cells on disk.         ║
+║                                                                               ║
+║  © 2025 Jennifer Leigh West • The Forgotten Code Research Institute           ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import csv
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from engine.ramanash_dynamical import run_dynamical
+from engine.ramanash_systemic import series_digest
+
+STATUS_OK = 0          # ran the full series
+STATUS_SATURATED = 1   # |S_t| pinned at the bound for sat_steps consecutive steps
+STATUS_DIVERGED = 2    # non-finite state
+
+STABILITY_STATS = ("status", "steps", "tail_freq", "mean_abs_system_index", "max_abs_state", "var_state")
+
+_GRID_FILE = "grid.npy"
+_SUMMARY_FILE = "summary.csv"
+_CACHE_FILE = "cells.jsonl"
+
+# Inputs for pool workers (set once per worker by _init_worker)
+_WORKER: Dict[str, Any] = {}
+
+
+def scan_cell(
+    uvrk_norms: List[float],
+    nash_eqs: List[float],
+    rho: float,
+    beta: float,
+    alpha: float,
+    block: int = 256,
+    sat_level: float = 0.999,
+    sat_steps: int = 50,
+    si_thresh: float = 0.8,
+) -> Dict[str, float]:
+    """
+    Run one (ρ, β, α) trajectory through run_dynamical in blocks of `block`
+    steps (each block resumes from the previous state, so the trajectory is
+    the same as one long run) and stop at the first block where the state
+    has saturated or gone non-finite, at the step where it is detected.
+    Statistics cover the steps actually run, so they do not depend on block.
+    """
+    n = min(len(uvrk_norms), len(nash_eqs))
+    s = 0.0
+    steps = tail = 0
+    sum_abs_si = sum_s = sum_s2 = 0.0
+    max_abs_s = 0.0
+    pinned = 0
+    status = STATUS_OK
+
+    for lo in range(0, n, block):
+        hi = min(n, lo + block)
+        out = run_dynamical(
+            uvrk_norms[lo:hi], nash_eqs[lo:hi], rho=rho, beta=beta, alpha=alpha,
+            s_init=s, check_stability=False,
+        )
+        for step in out:
+            st, si = step["state"], step["system_index"]
+            steps += 1
+            if not (math.isfinite(st) and math.isfinite(si)):
+                status = STATUS_DIVERGED
+                break
+            a = abs(st)
+            sum_s += st
+            sum_s2 += st * st
+            sum_abs_si += abs(si)
+            tail += abs(si) > si_thresh
+            max_abs_s = max(max_abs_s, a)
+            pinned = pinned + 1 if a >= sat_level else 0
+            if pinned >= sat_steps:
+                status = STATUS_SATURATED
+                break
+        if status != STATUS_OK:
+            break
+        s = out[-1]["state"]
+
+    m = steps - (status == STATUS_DIVERGED)
+    mean_s = sum_s / m if m else 0.0
+    return {
+        "status": status,
+        "steps": steps,
+        "tail_freq": tail / m if m else 0.0,
+        "mean_abs_system_index": sum_abs_si / m if m else 0.0,
+        "max_abs_state": max_abs_s,
+        "var_state": max(0.0, sum_s2 / m - mean_s * mean_s) if m else 0.0,
+    }
+
+
+def _init_worker(uvrk_norms: List[float], nash_eqs: List[float], options: Dict[str, Any]) -> None:
+    _WORKER.update(uvrk=uvrk_norms, nash=nash_eqs, options=options)
+
+
+def _scan_cells(cells: List[Tuple[float, float, float]]) -> List[Dict[str, Any]]:
+    uvrk, nash, options = _WORKER["uvrk"], _WORKER["nash"], _WORKER["options"]
+    return [
+        dict(rho=r, beta=b, alpha=a, **scan_cell(uvrk, nash, r, b, a, **options))
+        for r, b, a in cells
+    ]
+
+
+def _fingerprint(uvrk_norms: List[float], nash_eqs: List[float], options: Dict[str, Any]) -> str:
+    opts = ",".join(f"{k}={options[k]!r}" for k in sorted(options))
+    return f"{series_digest(list(uvrk_norms), list(nash_eqs)).hex()}|{opts}"
+
+
+def _load_cache(path: str, fingerprint: str) -> Dict[Tuple[float, float, float], Dict[str, Any]]:
+    done = {}
+    if not os.path.exists(path):
+        return done
+    with open(path) as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue  # torn last line from an interrupted scan
+            if rec.get("fingerprint") == fingerprint:
+                done[(rec["rho"], rec["beta"], rec["alpha"])] = rec
+    return done
+
+
+def stability_scan(
+    uvrk_norms: List[float],
+    nash_eqs: List[float],
+    rho_vals: Sequence[float],
+    beta_vals: Sequence[float],
+    alpha_vals: Sequence[float],
+    out_dir: Union[str, os.PathLike],
+    workers: Optional[int] = None,
+    cells_per_task: int = 16,
+    block: int = 256,
+    sat_level: float = 0.999,
+    sat_steps: int = 50,
+    si_thresh: float = 0.8,
+) -> Dict[str, Any]:
+    """
+    Empirical stability map over rho_vals × beta_vals × alpha_vals.
+
+    Cells are split into tasks of cells_per_task and run on a process pool
+    (workers > 1) or in-process. Each finished cell is appended to
+    out_dir/cells.jsonl under a fingerprint of the inputs and scan options,
+    so a repeated or interrupted scan only computes the missing cells.
+
+    Writes out_dir/grid.npy — float32, shape (len(rho), len(beta), len(alpha),
+    len(STABILITY_STATS)) — and out_dir/summary.csv (one row per cell).
+    Returns {"grid", "stats", "rho", "beta", "alpha", "computed", "cached"}.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    rho_vals, beta_vals, alpha_vals = (list(map(float, v)) for v in (rho_vals, beta_vals, alpha_vals))
+    options = dict(block=block, sat_level=sat_level, sat_steps=sat_steps, si_thresh=si_thresh)
+    fingerprint = _fingerprint(uvrk_norms, nash_eqs, options)
+    cache_path = os.path.join(out_dir, _CACHE_FILE)
+    done = _load_cache(cache_path, fingerprint)
+
+    cells = list(itertools.product(rho_vals, beta_vals, alpha_vals))
+    todo = [c for c in cells if c not in done]
+    tasks = [todo[i:i + cells_per_task] for i in range(0, len(todo), cells_per_task)]
+
+    with open(cache_path, "a") as cache:
+        def record(results: List[Dict[str, Any]]) -> None:
+            for rec in results:
+                rec["fingerprint"] = fingerprint
+                done[(rec["rho"], rec["beta"], rec["alpha"])] = rec
+                cache.write(json.dumps(rec) + "\n")
+            cache.flush()
+
+        if workers and workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker,
+                initargs=(list(uvrk_norms), list(nash_eqs), options),
+            ) as pool:
+                for fut in as_completed([pool.submit(_scan_cells, t) for t in tasks]):
+                    record(fut.result())
+        else:
+            _init_worker(list(uvrk_norms), list(nash_eqs), options)
+            for t in tasks:
+                record(_scan_cells(t))
+
+    grid = np.zeros((len(rho_vals), len(beta_vals), len(alpha_vals), len(STABILITY_STATS)), dtype=np.float32)
+    with open(os.path.join(out_dir, _SUMMARY_FILE), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("rho", "beta", "alpha") + STABILITY_STATS)
+        for (i, r), (j, b), (k, a) in itertools.product(enumerate(rho_vals), enumerate(beta_vals), enumerate(alpha_vals)):
+            rec = done[(r, b, a)]
+            grid[i, j, k] = [rec[s] for s in STABILITY_STATS]
+            writer.writerow([r, b, a] + [rec[s] for s in STABILITY_STATS])
+    np.save(os.path.join(out_dir, _GRID_FILE), grid)
+
+    return {
+        "grid": grid,
+        "stats": STABILITY_STATS,
+        "rho": rho_vals,
+        "beta": beta_vals,
+        "alpha": alpha_vals,
+        "computed": len(todo),
+        "cached": len(cells) - len(todo),
+    }
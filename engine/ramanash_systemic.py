@@ -9,8 +9,15 @@
 ╚═══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import hashlib
 import math
-from typing import List, Optional, Tuple
+import threading
+from array import array
+from collections import OrderedDict, deque
+from itertools import accumulate, islice
+from typing import Deque, Dict, List, Optional, Tuple
+
+SYSTEMIC_FIELDS = ("lci", "lsi", "csi", "fsi", "systemic_stress")
 
 
 def _bound(x: float, lo: float = -1.0, hi: float = 1.0) -> float:
@@ -41,6 +48,104 @@ def _returns(prices: List[float]) -> List[float]:
     return out
 
 
+class VolPrefixIndex:
+    """
+    Prefix sums over a vol series. Any rolling mean is two lookups.
+
+    Build once per vol series and pass as ``vol_index=`` to the systemic
+    functions; results agree with the slice-and-sum path to float rounding.
+    """
+
+    __slots__ = ("_prefix",)
+
+    def __init__(self, vols: List[float]):
+        self._prefix = [0.0]
+        self._prefix.extend(accumulate(vols))
+
+    def __len__(self) -> int:
+        return len(self._prefix) - 1
+
+    def sum(self, lo: int, hi: int) -> float:
+        """Sum of vols[lo:hi] (slice semantics, clamped to the series)."""
+        n = len(self._prefix) - 1
+        lo = max(0, min(lo, n))
+        hi = max(lo, min(hi, n))
+        return self._prefix[hi] - self._prefix[lo]
+
+    def mean(self, lo: int, hi: int, default: float = 0.0) -> float:
+        """Mean of vols[lo:hi]; default when the slice is empty."""
+        n = len(self._prefix) - 1
+        lo = max(0, min(lo, n))
+        hi = max(lo, min(hi, n))
+        if hi == lo:
+            return default
+        return (self._prefix[hi] - self._prefix[lo]) / (hi - lo)
+
+
+# Per-index arithmetic, shared by the batch functions and SystemicStream so
+# that both paths produce bit-identical values from the same windows.
+
+def _momentum(p_now: float, p_prev: float) -> float:
+    if p_prev > 0 and p_now > 0:
+        mom_raw = p_now / p_prev - 1
+        return _bound(mom_raw * 5)
+    return 0.0
+
+
+def _lci_core(v_s: float, v_l: float, m: float, v_min: float, v_max: float) -> float:
+    rng = v_max - v_min if v_max > v_min else 0.01
+    v_s_norm = (v_s - v_min) / rng
+    v_l_norm = (v_l - v_min) / rng
+
+    term1 = (1 - v_l_norm) * m
+    term2 = v_s_norm - v_l_norm
+    return _bound(term1 + term2)
+
+
+def _lsi_core(r_slice: List[float], v_s: float, vol_max: Optional[float]) -> float:
+    # Jump intensity: fraction of returns > 2x median abs
+    abs_r = [abs(r) for r in r_slice]
+    med = sorted(abs_r)[len(abs_r) // 2] if abs_r else 0.01
+    thresh = 2.0 * med if med > 0 else 0.02
+    jumps = [r for r in r_slice if abs(r) > thresh]
+    j = len(jumps) / len(r_slice) if r_slice else 0
+    j = _bound(j * 2)  # scale to [0,1]
+
+    # Acceleration: |Δr| recent
+    a = abs(r_slice[-1] - r_slice[-2]) if len(r_slice) >= 2 else 0
+    a = _bound(a * 20)  # scale to [-1,1] for magnitude
+
+    # Participation proxy: inverse of vol (high vol = low participation)
+    p = 1 - (v_s / vol_max) if vol_max is not None and vol_max > 0 else 0.5
+    p = _bound(p)
+
+    # LSI = j * |a| + (1 - p) * j
+    return _bound(j * a + (1 - p) * j)
+
+
+def _csi_core(r_slice: List[float]) -> float:
+    downs = [r for r in r_slice if r < 0]
+    ups = [r for r in r_slice if r >= 0]
+
+    d_raw = math.sqrt(sum(r * r for r in downs) / len(downs)) if downs else 0
+    u_raw = math.sqrt(sum(r * r for r in ups) / len(ups)) if ups else 0
+
+    # Normalize to [0,1] via rolling
+    all_sq = [r * r for r in r_slice]
+    mx = max(all_sq) if all_sq else 0.01
+    d = _bound(d_raw / (mx**0.5 + 0.01), 0, 1)
+    u = _bound(u_raw / (mx**0.5 + 0.01), 0, 1)
+
+    return _bound((d - u) * d)
+
+
+def _fsi_core(rv_7: float, rv_30: float, a: float) -> float:
+    dv = rv_7 - rv_30
+    dv_norm = _bound(dv * 5)
+    a_norm = _bound(a * 20)
+    return _bound(dv_norm * a_norm)
+
+
 def leverage_cycle_index(
     prices: List[float],
     vols: List[float],
@@ -48,25 +153,29 @@ def leverage_cycle_index(
     vol_offset: int = 20,
     window_short: int = 7,
     window_long: int = 30,
+    vol_index: Optional[VolPrefixIndex] = None,
 ) -> float:
     """
     LCI: structural leverage tension.
     (1 - v_l_norm) * m_norm + (v_s - v_l) interaction.
     Low long vol + momentum → buildup. Short vol > long vol → deleveraging.
+    vol_index: optional VolPrefixIndex over vols for O(1) long mean.
     """
     if i < window_long or len(vols) < window_long or len(prices) < vol_offset + window_long + 1:
         return 0.0
 
     v_s = vols[min(i, len(vols) - 1)]
-    hist_long = vols[max(0, i - window_long) : i]
-    v_l = sum(hist_long) / len(hist_long) if hist_long else v_s
+    if vol_index is not None:
+        v_l = vol_index.mean(max(0, i - window_long), i, default=v_s)
+    else:
+        hist_long = vols[max(0, i - window_long) : i]
+        v_l = sum(hist_long) / len(hist_long) if hist_long else v_s
 
     # Momentum: P_t / P_{t-w} - 1. vols[i] aligns with prices[vol_offset+i]
     idx_now = vol_offset + i
     idx_prev = max(0, idx_now - window_long)
-    if idx_now < len(prices) and prices[idx_prev] > 0 and prices[idx_now] > 0:
-        mom_raw = prices[idx_now] / prices[idx_prev] - 1
-        m = _bound(mom_raw * 5)
+    if idx_now < len(prices):
+        m = _momentum(prices[idx_now], prices[idx_prev])
     else:
         m = 0.0
 
@@ -74,14 +183,7 @@ def leverage_cycle_index(
     vol_hist = vols[max(0, i - 60) : i + 1]
     v_max = max(vol_hist) if vol_hist else 0.5
     v_min = min(vol_hist) if vol_hist else 0.01
-    rng = v_max - v_min if v_max > v_min else 0.01
-    v_s_norm = (v_s - v_min) / rng
-    v_l_norm = (v_l - v_min) / rng
-
-    term1 = (1 - v_l_norm) * m
-    term2 = v_s_norm - v_l_norm
-    lci = _bound(term1 + term2)
-    return lci
+    return _lci_core(v_s, v_l, m, v_min, v_max)
 
 
 def liquidity_spiral_index(
@@ -92,43 +194,28 @@ def liquidity_spiral_index(
     window_short: int = 7,
     window_jump: int = 5,
     vol_offset: int = 20,
+    returns: Optional[List[float]] = None,
 ) -> float:
     """
     LSI: j * |a| + (1 - p) * j.
     Jumps amplify acceleration; low participation amplifies jump stress.
+    returns: optional precomputed _returns(prices).
     """
     if vol_idx < window_short or len(vols) < window_short or len(prices) < window_jump + 2:
         return 0.0
 
     r_idx = ret_idx if ret_idx is not None else vol_offset + vol_idx - 1
     v_s = vols[min(vol_idx, len(vols) - 1)]
-    returns = _returns(prices)
+    if returns is None:
+        returns = _returns(prices)
     if len(returns) < r_idx + 1:
         return 0.0
     r_slice = returns[max(0, r_idx - window_jump) : r_idx + 1]
     if len(r_slice) < 2:
         return 0.0
 
-    # Jump intensity: fraction of returns > 2x median abs
-    abs_r = [abs(r) for r in r_slice]
-    med = sorted(abs_r)[len(abs_r) // 2] if abs_r else 0.01
-    thresh = 2.0 * med if med > 0 else 0.02
-    jumps = [r for r in r_slice if abs(r) > thresh]
-    j = len(jumps) / len(r_slice) if r_slice else 0
-    j = _bound(j * 2)  # scale to [0,1]
-
-    # Acceleration: |Δr| recent
-    a = abs(r_slice[-1] - r_slice[-2]) if len(r_slice) >= 2 else 0
-    a = _bound(a * 20)  # scale to [-1,1] for magnitude
-
-    # Participation proxy: inverse of vol (high vol = low participation)
     vol_hist = vols[max(0, vol_idx - 30) : vol_idx + 1]
-    p = 1 - (v_s / max(vol_hist)) if vol_hist and max(vol_hist) > 0 else 0.5
-    p = _bound(p)
-
-    # LSI = j * |a| + (1 - p) * j
-    lsi = _bound(j * a + (1 - p) * j)
-    return lsi
+    return _lsi_core(r_slice, v_s, max(vol_hist) if vol_hist else None)
 
 
 def credit_stress_index(
@@ -144,20 +231,7 @@ def credit_stress_index(
         return 0.0
 
     r_slice = returns[max(0, i - window) : i + 1]
-    downs = [r for r in r_slice if r < 0]
-    ups = [r for r in r_slice if r >= 0]
-
-    d_raw = math.sqrt(sum(r * r for r in downs) / len(downs)) if downs else 0
-    u_raw = math.sqrt(sum(r * r for r in ups) / len(ups)) if ups else 0
-
-    # Normalize to [0,1] via rolling
-    all_sq = [r * r for r in r_slice]
-    mx = max(all_sq) if all_sq else 0.01
-    d = _bound(d_raw / (mx**0.5 + 0.01), 0, 1)
-    u = _bound(u_raw / (mx**0.5 + 0.01), 0, 1)
-
-    csi = _bound((d - u) * d)
-    return csi
+    return _csi_core(r_slice)
 
 
 def funding_stress_index(
@@ -167,27 +241,28 @@ def funding_stress_index(
     ret_idx: Optional[int] = None,
     window_short: int = 7,
     window_long: int = 30,
+    vol_index: Optional[VolPrefixIndex] = None,
 ) -> float:
     """
     FSI: Δv * |a|. Vol acceleration times price acceleration.
+    vol_index: optional VolPrefixIndex over vols for O(1) rolling means.
     """
     if vol_idx < window_long or len(vols) < window_long or len(returns) < 2:
         return 0.0
     r_idx = ret_idx if ret_idx is not None else vol_idx
 
-    hist_s = vols[max(0, vol_idx - window_short) : vol_idx + 1]
-    hist_l = vols[max(0, vol_idx - window_long) : vol_idx + 1]
-    rv_7 = sum(hist_s) / len(hist_s) if hist_s else vols[vol_idx]
-    rv_30 = sum(hist_l) / len(hist_l) if hist_l else vols[vol_idx]
+    if vol_index is not None:
+        rv_7 = vol_index.mean(max(0, vol_idx - window_short), vol_idx + 1, default=vols[vol_idx])
+        rv_30 = vol_index.mean(max(0, vol_idx - window_long), vol_idx + 1, default=vols[vol_idx])
+    else:
+        hist_s = vols[max(0, vol_idx - window_short) : vol_idx + 1]
+        hist_l = vols[max(0, vol_idx - window_long) : vol_idx + 1]
+        rv_7 = sum(hist_s) / len(hist_s) if hist_s else vols[vol_idx]
+        rv_30 = sum(hist_l) / len(hist_l) if hist_l else vols[vol_idx]
 
-    dv = rv_7 - rv_30
     r_slice = returns[max(0, r_idx - 3) : r_idx + 1]
     a = abs(r_slice[-1] - r_slice[-2]) if len(r_slice) >= 2 else 0
-
-    dv_norm = _bound(dv * 5)
-    a_norm = _bound(a * 20)
-    fsi = _bound(dv_norm * a_norm)
-    return fsi
+    return _fsi_core(rv_7, rv_30, a)
 
 
 def systemic_stress(
@@ -195,20 +270,24 @@ def systemic_stress(
     vols: List[float],
     i: int,
     vol_offset: int = 20,
+    vol_index: Optional[VolPrefixIndex] = None,
+    returns: Optional[List[float]] = None,
 ) -> float:
     """
     SystemicStress = (LCI + LSI + CSI + FSI) / 4.
     Equal weights. Bounded [-1, 1].
     i = vol index (vols[i] aligns with prices[vol_offset+i]).
+    returns: optional precomputed _returns(prices) (saves an O(n) pass per call).
     """
-    returns = _returns(prices)
+    if returns is None:
+        returns = _returns(prices)
     vol_idx = min(i, len(vols) - 1)
     ret_idx = min(vol_offset + i - 1, len(returns) - 1) if vol_offset + i > 0 else 0
 
-    lci = leverage_cycle_index(prices, vols, vol_idx, vol_offset=vol_offset)
-    lsi = liquidity_spiral_index(prices, vols, vol_idx, ret_idx=ret_idx, vol_offset=vol_offset)
+    lci = leverage_cycle_index(prices, vols, vol_idx, vol_offset=vol_offset, vol_index=vol_index)
+    lsi = liquidity_spiral_index(prices, vols, vol_idx, ret_idx=ret_idx, vol_offset=vol_offset, returns=returns)
     csi = credit_stress_index(returns, ret_idx)
-    fsi = funding_stress_index(vols, returns, vol_idx, ret_idx=ret_idx)
+    fsi = funding_stress_index(vols, returns, vol_idx, ret_idx=ret_idx, vol_index=vol_index)
 
     systemic = (lci + lsi + csi + fsi) / 4
     return _bound(systemic)
@@ -219,16 +298,19 @@ def systemic_stress_full(
     vols: List[float],
     i: int,
     vol_offset: int = 20,
+    vol_index: Optional[VolPrefixIndex] = None,
+    returns: Optional[List[float]] = None,
 ) -> dict:
     """Return all four indices plus combined systemic stress."""
-    returns = _returns(prices)
+    if returns is None:
+        returns = _returns(prices)
     vol_idx = min(i, len(vols) - 1)
     ret_idx = min(vol_offset + i - 1, len(returns) - 1) if vol_offset + i > 0 else 0
 
-    lci = leverage_cycle_index(prices, vols, vol_idx, vol_offset=vol_offset)
-    lsi = liquidity_spiral_index(prices, vols, vol_idx, ret_idx=ret_idx, vol_offset=vol_offset)
+    lci = leverage_cycle_index(prices, vols, vol_idx, vol_offset=vol_offset, vol_index=vol_index)
+    lsi = liquidity_spiral_index(prices, vols, vol_idx, ret_idx=ret_idx, vol_offset=vol_offset, returns=returns)
     csi = credit_stress_index(returns, ret_idx)
-    fsi = funding_stress_index(vols, returns, vol_idx, ret_idx=ret_idx)
+    fsi = funding_stress_index(vols, returns, vol_idx, ret_idx=ret_idx, vol_index=vol_index)
     systemic = _bound((lci + lsi + csi + fsi) / 4)
 
     return {
@@ -238,3 +320,279 @@ def systemic_stress_full(
         "fsi": fsi,
         "systemic_stress": systemic,
     }
+
+
+def systemic_series(
+    prices: List[float],
+    vols: List[float],
+    start: int,
+    stop: int,
+    vol_offset: int = 20,
+) -> Dict[str, List[float]]:
+    """
+    systemic_stress_full for every vol index in range(start, stop), as columns.
+    Returns are computed once instead of once per index, so the whole series is
+    O(n) (fixed-size windows per step). Values are identical to the per-index calls.
+    """
+    returns = _returns(prices)
+    out: Dict[str, List[float]] = {f: [] for f in SYSTEMIC_FIELDS}
+    cols = [out[f] for f in SYSTEMIC_FIELDS]
+    for i in range(start, stop):
+        s = systemic_stress_full(prices, vols, i, vol_offset, returns=returns)
+        for col, f in zip(cols, SYSTEMIC_FIELDS):
+            col.append(s[f])
+    return out
+
+
+class _RollingExtreme:
+    """Monotonic deque: rolling max (or min) over the last `window` pushes, O(1) amortized."""
+
+    __slots__ = ("window", "_is_max", "_q", "_t")
+
+    def __init__(self, window: int, mode: str = "max"):
+        self.window = window
+        self._is_max = mode == "max"
+        self._q: Deque[Tuple[int, float]] = deque()
+        self._t = -1
+
+    def push(self, x: float) -> None:
+        self._t += 1
+        q = self._q
+        if self._is_max:
+            while q and q[-1][1] <= x:
+                q.pop()
+        else:
+            while q and q[-1][1] >= x:
+                q.pop()
+        q.append((self._t, x))
+        if q[0][0] <= self._t - self.window:
+            q.popleft()
+
+    @property
+    def value(self) -> float:
+        return self._q[0][1]
+
+
+class SystemicStream:
+    """
+    Push-based systemic layer for live feeds.
+
+    push(price) updates bounded ring buffers (prices, returns, vols) and
+    rolling vol extrema, then returns the same dict as systemic_stress_full
+    for the bar just pushed. Vols are derived internally with the
+    _rolling_vol recipe, so vol_offset == vol_window.
+
+    Replay is bit-exact: after pushing prices[0..k], the output equals
+    systemic_stress_full(prices, _rolling_vol(prices, vol_window), k - vol_window)
+    for every k whose vol exists in the batch series. Window sums run over
+    the ring buffers in batch slice order, so per-push cost is bounded by
+    the fixed window lengths and independent of history length.
+
+    Non-positive prices are treated as missing bars and ignored.
+    """
+
+    WINDOW_SHORT = 7
+    WINDOW_LONG = 30
+    WINDOW_JUMP = 5
+    WINDOW_NORM = 60
+
+    def __init__(self, vol_window: int = 20, annualize: float = 252**0.5):
+        self.vol_window = vol_window
+        self.annualize = annualize
+        self.n_prices = 0
+        self.n_vols = 0
+        self._prices: Deque[float] = deque(maxlen=self.WINDOW_LONG + 1)
+        self._returns: Deque[float] = deque(maxlen=max(vol_window, self.WINDOW_LONG + 1))
+        self._vols: Deque[float] = deque(maxlen=self.WINDOW_NORM + 1)
+        self._vol_max_norm = _RollingExtreme(self.WINDOW_NORM + 1, "max")
+        self._vol_min_norm = _RollingExtreme(self.WINDOW_NORM + 1, "min")
+        self._vol_max_part = _RollingExtreme(self.WINDOW_LONG + 1, "max")
+        self.last = self._zero()
+
+    @staticmethod
+    def _zero() -> dict:
+        return {"lci": 0.0, "lsi": 0.0, "csi": 0.0, "fsi": 0.0, "systemic_stress": 0.0}
+
+    @property
+    def vol(self) -> Optional[float]:
+        """Latest rolling vol, or None before the first full window."""
+        return self._vols[-1] if self._vols else None
+
+    @property
+    def recent_vols(self) -> List[float]:
+        """Retained vols, oldest first: vols[max(0, i-60) : i+1] in batch terms."""
+        return list(self._vols)
+
+    def to_state(self) -> dict:
+        """JSON-serializable snapshot; from_state() resumes bit-exactly."""
+        return {
+            "vol_window": self.vol_window,
+            "annualize": self.annualize,
+            "n_prices": self.n_prices,
+            "n_vols": self.n_vols,
+            "prices": list(self._prices),
+            "returns": list(self._returns),
+            "vols": list(self._vols),
+            "last": dict(self.last),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "SystemicStream":
+        stream = cls(vol_window=state["vol_window"], annualize=state["annualize"])
+        stream.n_prices = state["n_prices"]
+        stream.n_vols = state["n_vols"]
+        stream._prices.extend(state["prices"])
+        stream._returns.extend(state["returns"])
+        for v in state["vols"]:
+            stream._vols.append(v)
+            stream._vol_max_norm.push(v)
+            stream._vol_min_norm.push(v)
+            stream._vol_max_part.push(v)
+        stream.last = dict(state["last"])
+        return stream
+
+    def push(self, price: float) -> dict:
+        """Append one bar and return lci/lsi/csi/fsi/systemic_stress for it."""
+        if not price > 0:
+            return dict(self.last)
+
+        if self._prices:
+            self._returns.append(math.log(price / self._prices[-1]))
+        self._prices.append(price)
+        self.n_prices += 1
+
+        if self.n_prices <= self.vol_window:
+            self.last = self._zero()
+            return dict(self.last)
+
+        chunk = list(islice(self._returns, len(self._returns) - self.vol_window, None))
+        mean = sum(chunk) / len(chunk)
+        var = sum((x - mean) ** 2 for x in chunk) / len(chunk)
+        v_s = math.sqrt(var) * self.annualize
+
+        self._vols.append(v_s)
+        self._vol_max_norm.push(v_s)
+        self._vol_min_norm.push(v_s)
+        self._vol_max_part.push(v_s)
+        self.n_vols += 1
+
+        self.last = self._indices(v_s, self.n_vols - 1)
+        return dict(self.last)
+
+    def _tail(self, buf: Deque[float], k: int) -> List[float]:
+        return list(islice(buf, max(0, len(buf) - k), None))
+
+    def _indices(self, v_s: float, i: int) -> dict:
+        wl, ws = self.WINDOW_LONG, self.WINDOW_SHORT
+        rets = self._returns
+        n_rets = self.n_prices - 1
+
+        lci = 0.0
+        if i >= wl:
+            hist_long = list(islice(self._vols, len(self._vols) - 1 - wl, len(self._vols) - 1))
+            v_l = sum(hist_long) / len(hist_long)
+            m = _momentum(self._prices[-1], self._prices[0])
+            lci = _lci_core(v_s, v_l, m, self._vol_min_norm.value, self._vol_max_norm.value)
+
+        lsi = 0.0
+        if i >= ws:
+            lsi = _lsi_core(self._tail(rets, self.WINDOW_JUMP + 1), v_s, self._vol_max_part.value)
+
+        csi = 0.0
+        if n_rets - 1 >= wl:
+            csi = _csi_core(self._tail(rets, wl + 1))
+
+        fsi = 0.0
+        if i >= wl:
+            hist_s = self._tail(self._vols, ws + 1)
+            hist_l = self._tail(self._vols, wl + 1)
+            rv_7 = sum(hist_s) / len(hist_s)
+            rv_30 = sum(hist_l) / len(hist_l)
+            fsi = _fsi_core(rv_7, rv_30, abs(rets[-1] - rets[-2]))
+
+        return {
+            "lci": lci,
+            "lsi": lsi,
+            "csi": csi,
+            "fsi": fsi,
+            "systemic_stress": _bound((lci + lsi + csi + fsi) / 4),
+        }
+
+
+def series_digest(prices: List[float], vols: List[float]) -> bytes:
+    """Content fingerprint of a (prices, vols) pair. O(n), runs in C."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(len(prices).to_bytes(8, "little"))
+    h.update(array("d", prices).tobytes())
+    h.update(len(vols).to_bytes(8, "little"))
+    h.update(array("d", vols).tobytes())
+    return h.digest()
+
+
+class SystemicCache:
+    """
+    Bounded LRU of systemic_stress_full results keyed by
+    (series digest, vol_idx, vol_offset).
+
+    By default every call fingerprints the full series content (O(n) in C),
+    so edited series never return stale results. Loops over unchanging
+    series can hash once and pass it: get(..., digest=series_digest(p, v));
+    a hit is then a dict lookup. The caller owns that digest's freshness.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Tuple[bytes, int, int], dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        prices: List[float],
+        vols: List[float],
+        i: int,
+        vol_offset: int = 20,
+        digest: Optional[bytes] = None,
+    ) -> dict:
+        """
+        systemic_stress_full(prices, vols, i, vol_offset), memoized. Returns a copy.
+        digest: precomputed series_digest(prices, vols), skipping the per-call hash.
+        """
+        key = (digest if digest is not None else series_digest(prices, vols), i, vol_offset)
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return dict(hit)
+        result = systemic_stress_full(prices, vols, i, vol_offset)
+        with self._lock:
+            self.misses += 1
+            self._data[key] = result
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return dict(result)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# Shared cache used by ramanash_kernel.predict_macro_systemic
+SYSTEMIC_CACHE = SystemicCache()
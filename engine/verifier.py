@@ -38,16 +38,53 @@ except ImportError:
 
 # Try to import RAMANASH-ORACLE
 try:
-    from ramanash_kernel import predict_macro, MACRO_FEB_23_2026
+    from ramanash_kernel import MacroMemo, MACRO_FEB_23_2026
     RAMANASH_AVAILABLE = True
 except ImportError:
     RAMANASH_AVAILABLE = False
 
+# Try to import precomputed state artifacts (scripts/build_state_artifact.py)
+try:
+    from ramanash_artifact import StateArtifact
+    ARTIFACT_AVAILABLE = True
+except ImportError:
+    ARTIFACT_AVAILABLE = False
+
+ARTIFACT_DIR = Path(os.environ.get('RAMANASH_ARTIFACT_DIR', _engine_dir.parent / 'artifacts'))
+
 
 class CryptoVerifier:
     def __init__(self):
         self.uvrk = UVRK1Engine() if UVRK_AVAILABLE else None
         self.voices = ThirtyThreeVoices() if VOICES_33_AVAILABLE else None
+        self._artifacts = {}
+        # Exact keys: /api/verify mostly repeats the MACRO_FEB_23_2026 fallback
+        self._macro_memo = MacroMemo(maxsize=4096) if RAMANASH_AVAILABLE else None
+
+    def state_as_of(self, date: str, asset: str = 'BTC') -> dict:
+        """
+        Precomputed systemic/BEAST/dynamical state as of date.
+        Artifacts are reloaded when their meta.json changes (new bar appended).
+        """
+        if not ARTIFACT_AVAILABLE:
+            return {'error': 'state artifacts unavailable', 'reason': 'unavailable', 'status': 'error'}
+        asset = str(asset).upper()
+        meta_path = ARTIFACT_DIR / asset / 'meta.json'
+        if not re.match(r'^[A-Z0-9_\-]+$', asset) or not meta_path.exists():
+            return {'error': f'no state artifact for {asset}', 'reason': 'not_found', 'status': 'error'}
+        mtime = meta_path.stat().st_mtime_ns
+        cached = self._artifacts.get(asset)
+        if cached is None or cached[1] != mtime:
+            cached = (StateArtifact.load(ARTIFACT_DIR / asset), mtime)
+            self._artifacts[asset] = cached
+        try:
+            state = cached[0].state_at(date)
+        except (TypeError, ValueError):
+            return {'error': 'invalid date (expected YYYY-MM-DD)', 'reason': 'invalid_date', 'status': 'error'}
+        if state is None:
+            return {'error': f'no state before {cached[0].first_date}', 'reason': 'not_found', 'status': 'error'}
+        state['status'] = 'success'
+        return state
 
     def thirty_three_verify(self, address: str) -> dict:
         """
@@ -167,7 +204,7 @@ class CryptoVerifier:
                 'is_tail': is_tail,
             }
             if RAMANASH_AVAILABLE and macro_factors:
-                ramanash = predict_macro(vol, macro_factors, rank=0.5 + (0.1 if is_tail else 0))
+                ramanash = self._macro_memo.predict(vol, macro_factors, rank=0.5 + (0.1 if is_tail else 0))
                 result['ramanash_vol'] = round(ramanash['ramanash_vol'], 4)
                 result['big_short_signal'] = ramanash['big_short_signal']
                 result['nash_confidence'] = round(ramanash['nash_confidence'], 3)
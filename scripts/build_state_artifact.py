@@ -0,0 +1,61 @@
+"""
+State Artifact Builder — precomputes systemic/BEAST/dynamical state by date.
+
+  python scripts/build_state_artifact.py build [ASSET=path.json ...]
+  python scripts/build_state_artifact.py extend ASSET YYYY-MM-DD PRICE
+
+Data files are JSON with "dates" and "prices" (same format as tests/data).
+Artifacts go to $RAMANASH_ARTIFACT_DIR (default: artifacts/), one directory per asset,
+and are served by CryptoVerifier.state_as_of and GET /api/state.
+"""
+import os
+import sys
+import json
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _root)
+
+from engine.ramanash_artifact import StateArtifact
+
+ARTIFACT_DIR = os.environ.get("RAMANASH_ARTIFACT_DIR", os.path.join(_root, "artifacts"))
+DEFAULT_ASSETS = {
+    "BTC": os.path.join(_root, "tests", "data", "bitcoin_daily_2015_2025.json"),
+}
+
+
+def build(assets: dict) -> None:
+    for asset, path in assets.items():
+        if not os.path.exists(path):
+            print(f"  {asset}: ⏭️  No data at {path}")
+            continue
+        with open(path) as f:
+            data = json.load(f)
+        prices = data.get("prices", data.get("close", []))
+        dates = data.get("dates", [])
+        if not prices or len(dates) != len(prices):
+            print(f"  {asset}: ⏭️  Needs matching 'dates' and 'prices'")
+            continue
+        artifact = StateArtifact.build(os.path.join(ARTIFACT_DIR, asset), dates, prices, asset=asset)
+        print(f"  {asset}: {len(artifact)} rows, {artifact.first_date} → {artifact.last_date}")
+
+
+def extend(asset: str, date: str, price: float) -> None:
+    artifact = StateArtifact.load(os.path.join(ARTIFACT_DIR, asset))
+    state = artifact.extend(date, price)
+    print(json.dumps(state, indent=2))
+
+
+def main(argv):
+    if len(argv) >= 1 and argv[0] == "extend" and len(argv) == 4:
+        extend(argv[1].upper(), argv[2], float(argv[3]))
+    elif len(argv) >= 1 and argv[0] == "build":
+        pairs = [a.split("=", 1) for a in argv[1:]]
+        build({k.upper(): v for k, v in pairs} if pairs else DEFAULT_ASSETS)
+    else:
+        print(__doc__)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
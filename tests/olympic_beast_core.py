@@ -7,12 +7,19 @@ import sys
 import os
 import json
 
+import pytest
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from engine.ramanash_beast import (
     beast_step,
     beast_run,
     beast_from_market,
+    tail_lift,
+    tail_lift_curve,
+    beast_ensemble,
+    BeastFrame,
+    BeastStream,
 )
 
 
@@ -69,6 +76,194 @@ def test_from_market():
     print("📊 Market integration: bounded over full history ✅")
 
 
+def test_beast_frame():
+    """as_frame=True holds exactly the values of the list-of-dicts output."""
+    import random
+    r = random.Random(7)
+    n = 500
+    comps = [[max(-1, min(1, r.gauss(0, 0.5))) for _ in range(n)] for _ in range(4)]
+    macro = [-0.3] * n
+
+    steps = beast_run(*comps, macro)
+    frame = beast_run(*comps, macro, as_frame=True)
+    assert isinstance(frame, BeastFrame) and len(frame) == n
+    assert frame.to_list() == steps
+    assert frame[17] == steps[17] and frame[-1] == steps[-1]
+    assert type(frame[3]["trigger"]) is int
+    assert frame[100:110].to_list() == steps[100:110]
+    assert frame["crisis_field"].tolist() == [s["crisis_field"] for s in steps]
+    assert frame.nbytes * 10 < n * len(BeastFrame.FIELDS) * 100
+
+    future = [abs(x) for x in comps[0]]
+    assert tail_lift(frame, future, 0.3, f_thresh=-0.2) == tail_lift(steps, future, 0.3, f_thresh=-0.2)
+    print(f"📊 BeastFrame: identical to step dicts, {frame.nbytes // n} B/step ✅")
+
+
+def test_from_market_single_pass():
+    """O(n) beast_from_market equals the per-day systemic/macro loop."""
+    data_path = os.path.join(os.path.dirname(__file__), 'data', 'bitcoin_daily_2015_2025.json')
+    if not os.path.exists(data_path):
+        print("⏭️  Skipping single-pass test (no data)")
+        return
+    from engine.ramanash_systemic import systemic_stress_full, systemic_series, _rolling_vol
+    from engine.ramanash_kernel import predict_macro
+
+    with open(data_path) as f:
+        prices = json.load(f)['prices'][:600]
+    vols = _rolling_vol(prices, 20)
+    macro = {"media_sentiment": -0.5, "spending_habits": 0.5, "war_conflict": 0.5, "materials_avail": 0.5}
+    idx = range(50, len(vols) - 1)
+
+    ref = [systemic_stress_full(prices, vols, i, 20) for i in idx]
+    cols = systemic_series(prices, vols, 50, len(vols) - 1, 20)
+    assert [r["lsi"] for r in ref] == cols["lsi"] and [r["systemic_stress"] for r in ref] == cols["systemic_stress"]
+
+    # Time-varying macro: one factor set per vol index, alternating regimes
+    macro_seq = [dict(macro, war_conflict=0.9 if (i // 100) % 2 else 0.5) for i in range(len(vols))]
+    for factors in (macro, macro_seq):
+        per_day = [factors if isinstance(factors, dict) else factors[i] for i in idx]
+        expected = beast_run(
+            [r["lci"] for r in ref], [r["lsi"] for r in ref], [r["csi"] for r in ref], [r["fsi"] for r in ref],
+            [predict_macro(0.04, m)["nash_eq"] for m in per_day],
+        )
+        assert beast_from_market(prices, vols, factors) == expected
+    # Any Mapping is one static factor set, not a per-day sequence
+    from types import MappingProxyType
+    assert beast_from_market(prices, vols, MappingProxyType(macro)) == beast_from_market(prices, vols, macro)
+    print("📊 beast_from_market: single pass == per-day loop (static and time-varying macro) ✅")
+
+
+def _random_inputs(n, seed):
+    import random
+    r = random.Random(seed)
+    return [[max(-1, min(1, r.gauss(0, 0.5))) for _ in range(n)] for _ in range(5)]
+
+
+def test_vectorized_matches_scalar():
+    """vectorized=True equals the scalar loop within 1e-12 on every field."""
+    import numpy as np
+    lci, lsi, csi, fsi, extra = _random_inputs(4000, 11)
+    cases = [
+        dict(),
+        dict(s_init=0.4, gamma=0.8, eta=0.6),
+        dict(static_lambda=0.5),
+        dict(contagion_list=extra),
+    ]
+    for kw in cases:
+        ref = beast_run(lci, lsi, csi, fsi, extra, as_frame=True, **kw)
+        fast = beast_run(lci, lsi, csi, fsi, extra, as_frame=True, vectorized=True, **kw)
+        assert len(fast) == len(ref)
+        for f in BeastFrame.FIELDS:
+            assert np.max(np.abs(fast[f] - ref[f])) <= 1e-12, f
+    short = beast_run(lci[:2], lsi[:2], csi[:2], fsi[:2], extra[:2], vectorized=True)
+    assert len(short) == 2 and short[1]["build_rate"] == beast_run(lci[:2], lsi[:2], csi[:2], fsi[:2], extra[:2])[1]["build_rate"]
+    print("📊 Vectorized BEAST: matches scalar loop (≤1e-12) ✅")
+
+
+@pytest.mark.slow
+def test_vectorized_speed():
+    """Vectorized path vs scalar loop on a 4,000-day series (wall clock; slow suite only)."""
+    import time
+    import numpy as np
+    inputs = _random_inputs(4000, 5)
+    arrays = [np.array(x) for x in inputs]
+
+    def best(fn, k):
+        t_best = float("inf")
+        for _ in range(k):
+            t0 = time.perf_counter()
+            fn()
+            t_best = min(t_best, time.perf_counter() - t0)
+        return t_best
+
+    t_scalar = best(lambda: beast_run(*inputs), 3)
+    t_fast = best(lambda: beast_run(*arrays, as_frame=True, vectorized=True), 9)
+    speedup = t_scalar / t_fast
+    assert speedup >= 50, f"vectorized only {speedup:.1f}x faster"
+    print(f"📊 Vectorized BEAST: {t_scalar*1e3:.1f} ms → {t_fast*1e3:.2f} ms ({speedup:.0f}x) ✅")
+
+
+def test_ensemble_matches_run():
+    """Every γ × λ × η grid point equals a beast_run with those parameters."""
+    import numpy as np
+    lci, lsi, csi, fsi, macro = _random_inputs(1500, 21)
+    gammas, etas, lams = [0.0, 0.4, 0.9], [0.1, 0.25, 0.8], [None, 0.5]
+    # Tiny chunks so the γ and η chunking is exercised
+    grid = beast_ensemble(lci, lsi, csi, fsi, macro, gammas, etas, lams, max_elements=2000)
+    assert grid["mean_abs_f"].shape == (3, 2, 3)
+    for gi, g in enumerate(gammas):
+        for li, lam in enumerate(lams):
+            for ei, e in enumerate(etas):
+                fr = beast_run(lci, lsi, csi, fsi, macro, gamma=g, eta=e, static_lambda=lam, as_frame=True)
+                f = fr["crisis_field"]
+                assert abs(grid["mean_abs_f"][gi, li, ei] - np.abs(f).mean()) < 1e-12
+                assert abs(grid["mean_f"][gi, li, ei] - f.mean()) < 1e-12
+                assert grid["tail_freq"][gi, li, ei] == np.mean(np.abs(f) > 0.8)
+                assert abs(grid["var_s"][gi, li, ei] - fr["stress"].var()) < 1e-12
+                assert grid["trigger_freq"][gi, li, ei] == fr["trigger"].mean()
+    # Scalar axes: gamma/eta/static_lambda as plain numbers, or a bare None
+    one = beast_ensemble(lci, lsi, csi, fsi, macro, 0.4, 0.25, 0.5)
+    assert one["mean_f"].shape == (1, 1, 1) and one["static_lambda"].tolist() == [0.5]
+    assert one["mean_f"][0, 0, 0] == grid["mean_f"][1, 1, 1]
+    adaptive = beast_ensemble(lci, lsi, csi, fsi, macro, 0.4, 0.25, None)
+    assert adaptive["mean_f"][0, 0, 0] == grid["mean_f"][1, 0, 1]
+    print("📊 BEAST ensemble: grid == per-point beast_run ✅")
+
+
+def test_beast_stream():
+    """Streaming push == beast_run; callbacks fire on trigger flips and crossings."""
+    import time
+    lci, lsi, csi, fsi, macro = _random_inputs(2000, 8)
+    ref = beast_run(lci, lsi, csi, fsi, macro, s_init=0.2, gamma=0.9)
+
+    stream = BeastStream(s_init=0.2, gamma=0.9)
+    flips, crossings = [], []
+    stream.on_trigger(flips.append)
+    stream.on_crisis_cross(-0.7, crossings.append)
+    half = len(ref) // 2
+    out = [stream.push(*x) for x in zip(lci[:half], lsi[:half], csi[:half], fsi[:half], macro[:half])]
+    # Resume from a snapshot halfway through
+    resumed = BeastStream.from_state(json.loads(json.dumps(stream.to_state())))
+    resumed.on_trigger(flips.append)
+    resumed.on_crisis_cross(-0.7, crossings.append)
+    out += [resumed.push(*x) for x in zip(lci[half:], lsi[half:], csi[half:], fsi[half:], macro[half:])]
+    assert out == ref
+
+    trig = [0] + [s["trigger"] for s in ref]
+    expected_flips = [t for t in range(len(ref)) if trig[t + 1] != trig[t]]
+    assert [e["t"] for e in flips] == expected_flips and expected_flips
+    below = [False] + [s["crisis_field"] < -0.7 for s in ref]
+    expected_cross = [t for t in range(len(ref)) if below[t + 1] != below[t]]
+    assert [e["t"] for e in crossings] == expected_cross and expected_cross
+    assert all(e["kind"] == ("crisis_below" if ref[e["t"]]["crisis_field"] < -0.7 else "crisis_above") for e in crossings)
+
+    t0 = time.perf_counter()
+    for x in zip(lci, lsi, csi, fsi, macro):
+        resumed.push(*x)
+    us = (time.perf_counter() - t0) / len(lci) * 1e6
+    print(f"📊 BeastStream: == beast_run, {len(flips)} trigger flips, {len(crossings)} crossings, {us:.1f} µs/update ✅")
+
+
+def test_tail_lift_curve():
+    """One sorted pass gives tail_lift and tail-day counts at every threshold."""
+    import numpy as np
+    lci, lsi, csi, fsi, macro = _random_inputs(3000, 14)
+    steps = beast_run(lci, lsi, csi, fsi, macro, gamma=0.9, static_lambda=0.2)
+    future = [abs(x) + 0.1 for x in lci]
+    thresholds = [-0.9, -0.6, -0.4, -0.2, 0.0, 0.3, 1.0]
+    for data in (steps, BeastFrame.from_steps(steps)):
+        curve = tail_lift_curve(data, future, 0.4, thresholds)
+        for thr, lift, count in zip(curve["threshold"], curve["lift"], curve["count"]):
+            assert count == sum(1 for s in steps if s["crisis_field"] < thr)
+            assert abs(lift - tail_lift(steps, future, 0.4, f_thresh=thr)) < 1e-9
+
+    full = tail_lift_curve(steps, future, 0.4)
+    assert len(full["threshold"]) == len(np.unique([s["crisis_field"] for s in steps]))
+    assert full["count"][0] == 0 and full["lift"][0] == 0.0
+    assert np.all(np.diff(full["count"]) > 0)
+    print(f"📊 Tail lift curve: {len(full['threshold'])} thresholds == tail_lift ✅")
+
+
 def main():
     print("🏅 OLYMPIC BEAST CORE — Nonlinear Bounded Systemic Stress Field")
     print("=" * 60)
@@ -76,6 +271,13 @@ def main():
     test_convex_alignment()
     test_trigger()
     test_from_market()
+    test_from_market_single_pass()
+    test_beast_frame()
+    test_vectorized_matches_scalar()
+    test_vectorized_speed()
+    test_ensemble_matches_run()
+    test_beast_stream()
+    test_tail_lift_curve()
     print("\n✅ BEAST core test passed")
 
 
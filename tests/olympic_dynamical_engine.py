@@ -13,6 +13,9 @@ from engine.ramanash_dynamical import (
     dynamical_step,
     run_dynamical,
     dynamical_from_market,
+    run_dynamical_ensemble,
+    pre_crisis_signal,
+    DynamicalStream,
     RHO_DEFAULT,
     BETA_DEFAULT,
     ALPHA_DEFAULT,
@@ -79,6 +82,115 @@ def test_from_market():
     print("📊 Market integration: bounded over full history ✅")
 
 
+def test_from_market_single_pass():
+    """Single-pass dynamical_from_market == per-day _uvrk_norm + predict_macro_systemic loop."""
+    data_path = os.path.join(os.path.dirname(__file__), 'data', 'bitcoin_daily_2015_2025.json')
+    if not os.path.exists(data_path):
+        print("⏭️  Skipping single-pass test (no data)")
+        return
+    import random
+    from engine.ramanash_dynamical import _uvrk_norm, _uvrk_norm_series
+    from engine.ramanash_kernel import predict_macro_systemic
+    from engine.ramanash_systemic import _rolling_vol
+
+    with open(data_path) as f:
+        prices = json.load(f)['prices'][:600]
+    vols = _rolling_vol(prices, 20)
+    macro = {"media_sentiment": -0.5, "spending_habits": 0.5, "war_conflict": 0.5, "materials_avail": 0.5}
+
+    def reference(prices, vols, vol_offset=20):
+        uvrk, nash = [], []
+        for i in range(vol_offset + 30, len(vols) - 1):
+            uvrk.append(_uvrk_norm(vols[i], vols[max(0, i - 60): i + 1]))
+            if i + vol_offset < len(prices):
+                r = predict_macro_systemic(
+                    0.04, macro, prices=prices, vols=vols, vol_idx=i, vol_offset=vol_offset, cache=None,
+                )
+            else:
+                r = predict_macro_systemic(0.04, macro)
+            nash.append(r["nash_eq"])
+        return run_dynamical(uvrk, nash)
+
+    assert dynamical_from_market(prices, vols, macro) == reference(prices, vols)
+    from types import MappingProxyType
+    assert dynamical_from_market(prices, vols, MappingProxyType(macro)) == reference(prices, vols)
+    # Vols running past the prices: tail bars fall back to macro-only
+    long_vols = vols + vols[-100:]
+    assert dynamical_from_market(prices, long_vols, macro) == reference(prices, long_vols)
+
+    # Rank window with heavy ties
+    r = random.Random(0)
+    tied = [r.choice([0.1, 0.2, 0.3]) for _ in range(400)]
+    assert _uvrk_norm_series(tied, 0, 400) == [_uvrk_norm(tied[i], tied[max(0, i - 60): i + 1]) for i in range(400)]
+    # Seeded window past the first 61 vols (vol_offset >= 31)
+    for start in (60, 61, 80, 200):
+        assert _uvrk_norm_series(tied, start, 400) == [
+            _uvrk_norm(tied[i], tied[max(0, i - 60): i + 1]) for i in range(start, 400)
+        ]
+    vols40 = _rolling_vol(prices, 40)
+    assert dynamical_from_market(prices, vols40, macro, vol_offset=40) == reference(prices, vols40, 40)
+    print("📊 dynamical_from_market: single pass == per-day loop ✅")
+
+
+def test_dynamical_ensemble():
+    """K triples at once: matrices and streamed summaries == per-triple run_dynamical."""
+    import random
+    import numpy as np
+    r = random.Random(2)
+    n = 1500
+    uvrk = [max(-1, min(1, r.gauss(0, 0.5))) for _ in range(n)]
+    nash = [max(-1, min(1, r.gauss(-0.1, 0.4))) for _ in range(n)]
+    rho, beta, alpha = [0.5, 0.85, 0.9, 0.95], [0.1, 0.08, -0.05, 0.2], [0.3, 0.3, 0.9, 0.5]
+
+    full = run_dynamical_ensemble(uvrk, nash, rho, beta, alpha, s_init=0.2)
+    summ = run_dynamical_ensemble(uvrk, nash, rho, beta, alpha, s_init=0.2, summary=True, block_size=97)
+    assert full["state"].shape == (n, 4)
+    assert full["stable"].tolist() == [True, True, True, False]
+    for k in range(4):
+        if rho[k] + abs(beta[k]) < 1:
+            ref = run_dynamical(uvrk, nash, rho[k], beta[k], alpha[k], s_init=0.2)
+        else:  # run_dynamical refuses unstable triples; step manually
+            ref, s_prev = [], 0.2
+            for u, e in zip(uvrk, nash):
+                ref.append(dynamical_step(u + e, u, s_prev, rho[k], beta[k], alpha[k]))
+                s_prev = ref[-1]["state"]
+        st = np.array([x["state"] for x in ref])
+        si = np.array([x["system_index"] for x in ref])
+        assert np.max(np.abs(full["state"][:, k] - st)) < 1e-12
+        assert np.max(np.abs(full["system_index"][:, k] - si)) < 1e-12
+        assert np.max(np.abs(full["energy"][:, k] - st * st)) < 1e-12
+        assert abs(summ["mean_state"][k] - st.mean()) < 1e-12
+        assert abs(summ["var_state"][k] - st.var()) < 1e-12
+        assert abs(summ["mean_abs_system_index"][k] - np.abs(si).mean()) < 1e-12
+        assert abs(summ["max_abs_system_index"][k] - np.abs(si).max()) < 1e-12
+        assert abs(summ["final_state"][k] - st[-1]) < 1e-12
+    print("📊 Dynamical ensemble: K-vector run == per-triple run_dynamical ✅")
+
+
+def test_dynamical_stream():
+    """Streaming push == run_dynamical; O(1) pre_crisis == pre_crisis_signal; exact resume."""
+    import random
+    r = random.Random(6)
+    uvrk, nash = [], []
+    for t in range(800):
+        # Slow drifts so ΔE builds up in runs
+        uvrk.append(max(-1, min(1, 0.8 * ((t % 90) / 90) - 0.4 + r.gauss(0, 0.02))))
+        nash.append(max(-1, min(1, -0.7 * ((t % 130) / 130) + r.gauss(0, 0.05))))
+    ref = run_dynamical(uvrk, nash, s_init=0.1)
+
+    stream = DynamicalStream(s_init=0.1, window=4)
+    out, signals = [], 0
+    for t, (u, e) in enumerate(zip(uvrk, nash)):
+        if t == 400:
+            stream = DynamicalStream.from_state(json.loads(json.dumps(stream.to_state())))
+        out.append(stream.push(u, e))
+        expected = pre_crisis_signal(out, window=4)
+        assert stream.pre_crisis == expected, t
+        signals += expected
+    assert out == ref and signals > 0
+    print(f"📊 DynamicalStream: == run_dynamical, pre-crisis flag O(1) ({signals} ticks) ✅")
+
+
 def main():
     print("🏅 OLYMPIC DYNAMICAL ENGINE — Bounded Nonlinear Recursive Stress")
     print("=" * 60)
@@ -87,6 +199,9 @@ def main():
     test_convex_amplification()
     test_run_dynamical()
     test_from_market()
+    test_from_market_single_pass()
+    test_dynamical_ensemble()
+    test_dynamical_stream()
     print("\n✅ Dynamical engine test passed")
 
 
@@ -0,0 +1,96 @@
+"""
+🏅 OLYMPIC: Episode Index — Run-Length Trigger / Tail Episodes
+
+Validates: RLE round-trips the day mask, overlap and day-count queries match
+brute-force scans, tail means and lift match tail_lift.
+"""
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.ramanash_beast import beast_run, tail_lift
+from engine.ramanash_episodes import EpisodeIndex
+from engine.ramanash_systemic import VolPrefixIndex
+
+
+def _run(n=3000, seed=4):
+    r = random.Random(seed)
+    # Persistent (AR(1)) stress so tail days cluster into episodes
+    comps = []
+    for _ in range(4):
+        x, series = 0.0, []
+        for _ in range(n):
+            x = 0.9 * x + r.gauss(-0.05, 0.25)
+            series.append(max(-1, min(1, x)))
+        comps.append(series)
+    steps = beast_run(*comps, [-0.6] * n, gamma=0.9, static_lambda=0.2)
+    future_vol = [abs(r.gauss(0.6, 0.2)) for _ in range(n)]
+    return steps, future_vol
+
+
+def test_rle_roundtrip():
+    """Episodes reproduce the mask; peaks are the episode extreme."""
+    steps, _ = _run()
+    tail = EpisodeIndex.from_beast(steps, kind="tail", f_thresh=-0.4)
+    mask = [s["crisis_field"] < -0.4 for s in steps]
+    assert tail.mask().tolist() == mask
+    assert tail.n_days == sum(mask) and len(tail) > 10
+    for ep in tail:
+        window = [steps[t]["crisis_field"] for t in range(ep.start, ep.end + 1)]
+        assert steps[ep.peak]["crisis_field"] == min(window)
+        assert ep.start == 0 or not mask[ep.start - 1]
+        assert ep.end == len(mask) - 1 or not mask[ep.end + 1]
+
+    trig = EpisodeIndex.from_beast(steps, kind="trigger")
+    assert trig.mask().tolist() == [s["trigger"] == 1 for s in steps] and len(trig) > 0
+    for ep in trig:
+        assert abs(steps[ep.peak]["stress"]) == max(abs(steps[t]["stress"]) for t in range(ep.start, ep.end + 1))
+
+    trig = EpisodeIndex.from_beast(beast_run(*[[0.0] * 5] * 4, [0.0] * 5), kind="trigger")
+    assert len(trig) == 0 and trig.n_days == 0 and trig.overlapping(0, 10) == []
+    edge = EpisodeIndex.from_mask([True, True, False, True])
+    assert list(edge) == [(0, 1, 0), (3, 3, 3)]
+    print(f"📊 Episode RLE: {len(tail)} tail episodes, {tail.n_days} days ✅")
+
+
+def test_range_queries():
+    """overlapping / days_between agree with brute force on random ranges."""
+    steps, _ = _run(seed=9)
+    idx = EpisodeIndex.from_beast(steps, kind="tail", f_thresh=-0.4)
+    mask = idx.mask().tolist()
+    r = random.Random(1)
+    for _ in range(300):
+        d1 = r.randrange(-5, len(mask))
+        d2 = d1 + r.randrange(0, 400)
+        lo, hi = max(0, d1), min(len(mask) - 1, d2)
+        brute = [ep for ep in idx if ep.end >= d1 and ep.start <= d2]
+        assert idx.overlapping(d1, d2) == brute
+        assert idx.days_between(d1, d2) == sum(mask[lo:hi + 1])
+    print("📊 Episode queries: overlap + day counts == brute force ✅")
+
+
+def test_tail_mean_and_lift():
+    """mean_over / lift match the masked scan in tail_lift."""
+    steps, future_vol = _run(seed=12)
+    idx = EpisodeIndex.from_beast(steps, kind="tail", f_thresh=-0.4)
+    prefix = VolPrefixIndex(future_vol)
+    tail_vols = [v for s, v in zip(steps, future_vol) if s["crisis_field"] < -0.4]
+    assert abs(idx.mean_over(prefix) - sum(tail_vols) / len(tail_vols)) < 1e-9
+    assert abs(idx.lift(prefix, 0.5) - tail_lift(steps, future_vol, 0.5, f_thresh=-0.4)) < 1e-9
+    assert EpisodeIndex.from_mask([False] * 4).lift(future_vol, 0.5) == 0.0
+    print("📊 Episode tail mean/lift == tail_lift ✅")
+
+
+def main():
+    print("🏅 OLYMPIC EPISODE INDEX — Run-Length Crisis Episodes")
+    print("=" * 60)
+    test_rle_roundtrip()
+    test_range_queries()
+    test_tail_mean_and_lift()
+    print("\n✅ Episode index test passed")
+
+
+if __name__ == "__main__":
+    main()
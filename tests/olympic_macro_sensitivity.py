@@ -8,7 +8,14 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine.ramanash_kernel import predict_macro, MACRO_FEB_23_2026
+from engine.ramanash_kernel import (
+    predict_macro,
+    predict_macro_batch,
+    MacroMemo,
+    BIG_SHORT_SIGNALS,
+    MACRO_FEB_23_2026,
+    MACRO_TARIFF_DAY_2026,
+)
 
 
 def test_monotonicity():
@@ -57,11 +64,79 @@ def test_determinism_and_bounds():
     print("📊 Determinism & Bounds: ✅ PASS")
 
 
+def test_batch_matches_scalar():
+    """predict_macro_batch equals predict_macro on every draw, including threshold edges."""
+    import random
+    r = random.Random(48)
+    grid = [-1.0, -0.8, -0.5, 0.0, 0.4, 0.42, 0.45, 0.5, 0.7, 0.72, 0.75, 0.8, 1.0]
+    draws = [dict(MACRO_FEB_23_2026), dict(MACRO_TARIFF_DAY_2026)]
+    for _ in range(4000):
+        draws.append({
+            "media_sentiment": r.choice(grid) if r.random() < 0.3 else r.uniform(-1, 1),
+            "spending_habits": r.choice(grid[3:]) if r.random() < 0.3 else r.uniform(0, 1),
+            "war_conflict": r.choice(grid[3:]) if r.random() < 0.3 else r.uniform(0, 1),
+            "materials_avail": r.uniform(0, 1),
+        })
+    ranks = [r.choice([0.05, 0.1, 0.5, 0.9, 0.95, r.random()]) for _ in draws]
+    vols = [r.uniform(0.01, 0.1) for _ in draws]
+    for strength in (0.25, 1.25):
+        cols = predict_macro_batch(
+            vols,
+            [d["media_sentiment"] for d in draws],
+            [d["spending_habits"] for d in draws],
+            [d["war_conflict"] for d in draws],
+            [d["materials_avail"] for d in draws],
+            nash_strength=strength,
+            rank=ranks,
+        )
+        for i, d in enumerate(draws):
+            ref = predict_macro(vols[i], d, nash_strength=strength, rank=ranks[i])
+            assert cols["ramanash_vol"][i] == ref["ramanash_vol"]
+            assert cols["nash_eq"][i] == ref["nash_eq"]
+            assert cols["nash_score"][i] == ref["nash_score"]
+            assert BIG_SHORT_SIGNALS[cols["signal"][i]] == ref["big_short_signal"]
+    # Scalar base_vol / rank broadcast
+    one = predict_macro_batch(0.04, [-0.8], [0.40], [0.75], [0.52])
+    assert one["ramanash_vol"][0] == predict_macro(0.04, MACRO_FEB_23_2026)["ramanash_vol"]
+    print(f"📊 predict_macro_batch: {len(draws)} draws × 2 strengths == predict_macro ✅")
+
+
+def test_macro_memo():
+    """Unquantized MacroMemo equals predict_macro; LRU bounded; quantized buckets are deterministic."""
+    memo = MacroMemo(maxsize=2)
+    proxies = [dict(MACRO_FEB_23_2026), dict(MACRO_TARIFF_DAY_2026), {"media_sentiment": 0.3}]
+    for i in range(30):
+        macro = proxies[i % 2]
+        vol = 0.02 + 0.01 * (i % 3 == 0)
+        assert memo.predict(vol, macro, nash_strength=0.5, rank=0.95) == predict_macro(vol, macro, 0.5, 0.95)
+    st = memo.stats()
+    assert st["size"] == 2 and st["hits"] + st["misses"] == 30 and st["hits"] > 0
+    # Missing factors key as the 0.5 default; results carry the caller's dict
+    r = memo.predict(0.04, proxies[2])
+    assert r == predict_macro(0.04, proxies[2]) and r["macro_factors"] is proxies[2]
+    # LRU: the least recently used key was evicted
+    memo.predict(0.03, proxies[0], nash_strength=0.5, rank=0.95)
+    misses = memo.misses
+    memo.predict(0.02, proxies[1], nash_strength=0.5, rank=0.95)
+    assert memo.misses == misses + 1 and len(memo) == 2
+
+    q = MacroMemo(factor_quantum=0.01, vol_quantum=0.001)
+    a = q.predict(0.0401, {**MACRO_FEB_23_2026, "media_sentiment": -0.8004})
+    b = q.predict(0.0399, {**MACRO_FEB_23_2026, "media_sentiment": -0.7996})
+    assert q.hits == 1
+    assert a["ramanash_vol"] == b["ramanash_vol"] == predict_macro(0.04, MACRO_FEB_23_2026)["ramanash_vol"]
+    memo.clear()
+    assert len(memo) == 0 and memo.stats()["hits"] == 0
+    print(f"📊 MacroMemo: exact == predict_macro, LRU size {st['size']}, hit_rate={st['hit_rate']:.2f} ✅")
+
+
 def main():
     print("🏅 OLYMPIC MACRO SENSITIVITY — Economic Interpretability Audit")
     print("=" * 60)
     test_determinism_and_bounds()
     test_monotonicity()
+    test_batch_matches_scalar()
+    test_macro_memo()
     print("\n✅ Macro sensitivity audit complete. See docs/MACRO_WEIGHTING_AUDIT.md")
 
 
@@ -0,0 +1,87 @@
+"""
+🏅 OLYMPIC: Fused Pipeline — BEAST + Dynamical in One Traversal
+
+Validates: market_frames equals beast_from_market and dynamical_from_market,
+frames share one index, short price series fall back to macro-only nash.
+"""
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.ramanash_beast import beast_from_market, BeastFrame
+from engine.ramanash_dynamical import dynamical_from_market, DynamicalFrame
+from engine.ramanash_kernel import MACRO_FEB_23_2026, MACRO_TARIFF_DAY_2026
+from engine.ramanash_pipeline import market_frames
+from engine.ramanash_systemic import _rolling_vol
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'data', 'bitcoin_daily_2015_2025.json')
+
+
+def _load(n=900):
+    with open(DATA_PATH) as f:
+        prices = json.load(f)['prices'][:n]
+    return prices, _rolling_vol(prices, 20)
+
+
+def test_fused_matches_separate():
+    """Both frames equal the separate engine entry points, row for row."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping fused pipeline test (no data)")
+        return
+    prices, vols = _load()
+    for macro in (MACRO_FEB_23_2026, MACRO_TARIFF_DAY_2026):
+        frames = market_frames(prices, vols, macro)
+        assert isinstance(frames.beast, BeastFrame) and isinstance(frames.dynamical, DynamicalFrame)
+        assert len(frames.index) == len(frames.beast) == len(frames.dynamical)
+        assert frames.index[0] == 50 and frames.index[-1] == len(vols) - 2
+        assert frames.beast.to_list() == beast_from_market(prices, vols, macro)
+        assert frames.dynamical.to_list() == dynamical_from_market(prices, vols, macro)
+    from types import MappingProxyType
+    frames = market_frames(prices, vols, MappingProxyType(MACRO_FEB_23_2026))
+    assert frames.beast.to_list() == beast_from_market(prices, vols, MACRO_FEB_23_2026)
+    print("📊 Fused pipeline: BEAST + dynamical frames == separate runs ✅")
+
+
+def test_fused_vols_past_prices():
+    """Vol bars beyond the price series use macro-only nash, as dynamical_from_market does."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping fused tail test (no data)")
+        return
+    prices, vols = _load(500)
+    vols = vols + vols[-80:]
+    frames = market_frames(prices, vols, MACRO_FEB_23_2026, rho=0.7, beta=0.1)
+    ref = dynamical_from_market(prices, vols, MACRO_FEB_23_2026, rho=0.7, beta=0.1, as_frame=True)
+    assert frames.dynamical.to_list() == ref.to_list()
+    assert frames.beast.to_list() == beast_from_market(prices, vols, MACRO_FEB_23_2026)
+    print("📊 Fused pipeline: macro-only fallback past the prices ✅")
+
+
+def test_fused_vol_offset():
+    """Non-default vol_offset (rank window seeded past vol 61) equals the separate calls."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping fused vol_offset test (no data)")
+        return
+    prices, _ = _load(700)
+    vols = _rolling_vol(prices, 40)
+    macro_seq = [dict(MACRO_FEB_23_2026, war_conflict=0.9 if (i // 90) % 2 else 0.5) for i in range(len(vols))]
+    for macro in (MACRO_TARIFF_DAY_2026, macro_seq):
+        frames = market_frames(prices, vols, macro, vol_offset=40)
+        assert frames.index[0] == 70
+        assert frames.beast.to_list() == beast_from_market(prices, vols, macro, vol_offset=40)
+        assert frames.dynamical.to_list() == dynamical_from_market(prices, vols, macro, vol_offset=40)
+    print("📊 Fused pipeline: vol_offset=40, static and time-varying macro ✅")
+
+
+def main():
+    print("🏅 OLYMPIC FUSED PIPELINE — BEAST + Dynamical")
+    print("=" * 60)
+    test_fused_matches_separate()
+    test_fused_vols_past_prices()
+    test_fused_vol_offset()
+    print("\n✅ Fused pipeline test passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+🏅 OLYMPIC: Quantized Storage — int16 / float16 Stress Series
+
+Validates: documented error bounds hold, NaN survives, frames round-trip
+through disk, BEAST and dynamical step lists encode transparently.
+"""
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from engine.ramanash_codec import (
+    QuantizedSeries,
+    QuantizedFrame,
+    quantize_frame,
+    INT16_MAX_ERROR,
+    FLOAT16_MAX_ERROR,
+)
+from engine.ramanash_beast import beast_run
+from engine.ramanash_dynamical import run_dynamical
+
+
+def test_error_bounds():
+    """|decode(encode(x)) - x| stays within the documented bound."""
+    rng = np.random.default_rng(3)
+    x = np.concatenate([rng.uniform(-1, 1, 100_000), [-1.0, 0.0, 1.0, 1e-9, -0.99999]])
+    for codec, bound in (("int16", INT16_MAX_ERROR), ("float16", FLOAT16_MAX_ERROR)):
+        q = QuantizedSeries.encode(x, codec)
+        err = np.max(np.abs(q.decode() - x))
+        assert err <= bound, f"{codec}: {err} > {bound}"
+        assert q.nbytes == x.nbytes // 4
+        assert q[-3] == 1.0 and q[-4] == 0.0 and q[-5] == -1.0
+    print(f"📊 Error bounds: int16 ≤ {INT16_MAX_ERROR:.2e}, float16 ≤ {FLOAT16_MAX_ERROR:.2e} ✅")
+
+
+def test_nan_and_clip():
+    """NaN round-trips; out-of-range values clip to [-1, 1]."""
+    for codec in ("int16", "float16"):
+        q = QuantizedSeries.encode([np.nan, 2.0, -3.0, 0.5], codec)
+        assert np.isnan(q[0])
+        assert q[1] == 1.0 and q[2] == -1.0
+        assert abs(q[3] - 0.5) <= q.max_error
+    print("📊 NaN preserved, out-of-range clipped ✅")
+
+
+def test_frame_roundtrip():
+    """BEAST/dynamical steps → quantized frame → disk → same decoded values."""
+    n = 300
+    rng = np.random.default_rng(11)
+    comps = [np.clip(rng.normal(0, 0.4, n), -1, 1).tolist() for _ in range(4)]
+    steps = beast_run(*comps, [-0.2] * n)
+    dyn = run_dynamical(comps[0], comps[1])
+
+    frame = quantize_frame(steps)
+    assert "crisis_field" in frame and "trigger" in frame
+    cf = np.array([s["crisis_field"] for s in steps])
+    assert np.max(np.abs(frame["crisis_field"] - cf)) <= INT16_MAX_ERROR
+    assert frame.row(10)["trigger"] == steps[10]["trigger"]
+
+    dframe = quantize_frame(dyn, codec="float16")
+    si = np.array([s["system_index"] for s in dyn])
+    assert np.max(np.abs(dframe["system_index"] - si)) <= FLOAT16_MAX_ERROR
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "beast.npz")
+        frame.save(path)
+        loaded = QuantizedFrame.load(path)
+        assert set(loaded.keys()) == set(frame.keys())
+        assert np.array_equal(loaded["crisis_field"], frame["crisis_field"])
+
+    try:
+        quantize_frame({"vol": [0.5, 0.7]}, fields=["vol"])
+        raise AssertionError("unbounded field accepted")
+    except ValueError:
+        pass
+    print("📊 Frames: step lists encode, save/load round-trip ✅")
+
+
+def main():
+    print("🏅 OLYMPIC QUANTIZED STORAGE — int16 / float16")
+    print("=" * 60)
+    test_error_bounds()
+    test_nan_and_clip()
+    test_frame_roundtrip()
+    print("\n✅ Quantized storage test passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+🏅 OLYMPIC: Scenario Runner — BEAST Under Many Macro Scenarios
+
+Validates: one shared systemic pass gives the same frames as beast_from_market
+per scenario, in-process and across a process pool; time-varying macro works.
+"""
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from engine.ramanash_beast import beast_from_market, BeastFrame
+from engine.ramanash_kernel import MACRO_TARIFF_DAY_2026, MACRO_FEB_23_2026
+from engine.ramanash_scenarios import run_scenarios
+from engine.ramanash_systemic import _rolling_vol
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'data', 'bitcoin_daily_2015_2025.json')
+
+
+def _scenarios(n_vols):
+    calm = {"media_sentiment": 0.6, "spending_habits": 0.6, "war_conflict": 0.2, "materials_avail": 0.7}
+    regime = [MACRO_TARIFF_DAY_2026 if (i // 150) % 2 else calm for i in range(n_vols)]
+    return {"tariff": MACRO_TARIFF_DAY_2026, "feb23": MACRO_FEB_23_2026, "calm": calm, "regime": regime}
+
+
+def test_scenarios_match_beast_from_market():
+    """Each scenario frame == beast_from_market with that macro input."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping scenario test (no data)")
+        return
+    with open(DATA_PATH) as f:
+        prices = json.load(f)['prices'][:700]
+    vols = _rolling_vol(prices, 20)
+    scenarios = _scenarios(len(vols))
+
+    serial = run_scenarios(prices, vols, scenarios)
+    pooled = run_scenarios(prices, vols, scenarios, workers=2)
+    assert list(serial) == list(pooled) == list(scenarios)
+    for name, factors in scenarios.items():
+        expected = beast_from_market(prices, vols, factors)
+        assert isinstance(serial[name], BeastFrame)
+        assert serial[name].to_list() == expected
+        assert pooled[name].to_list() == expected
+    assert not np.array_equal(serial["tariff"]["crisis_field"], serial["calm"]["crisis_field"])
+    print(f"📊 Scenarios: {len(scenarios)} scenarios == beast_from_market (serial + pool) ✅")
+
+
+def test_scenarios_vectorized():
+    """vectorized=True stays within 1e-12 of the scalar frames."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping vectorized scenario test (no data)")
+        return
+    with open(DATA_PATH) as f:
+        prices = json.load(f)['prices'][:700]
+    vols = _rolling_vol(prices, 20)
+    scenarios = _scenarios(len(vols))
+    ref = run_scenarios(prices, vols, scenarios)
+    fast = run_scenarios(prices, vols, scenarios, vectorized=True, workers=2)
+    for name in scenarios:
+        for f in BeastFrame.FIELDS:
+            assert np.max(np.abs(fast[name][f] - ref[name][f])) <= 1e-12
+    print("📊 Scenarios: vectorized pool run matches scalar ✅")
+
+
+def main():
+    print("🏅 OLYMPIC SCENARIO RUNNER — Shared Systemic, Pooled Macro Scenarios")
+    print("=" * 60)
+    test_scenarios_match_beast_from_market()
+    test_scenarios_vectorized()
+    print("\n✅ Scenario runner test passed")
+
+
+if __name__ == "__main__":
+    main()
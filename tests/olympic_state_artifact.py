@@ -0,0 +1,141 @@
+"""
+🏅 OLYMPIC: State Artifact — Precomputed Systemic/BEAST/Dynamical by Date
+
+Validates: artifact rows equal beast_from_market / dynamical_from_market,
+incremental extension equals a rebuild, as-of lookups, /api/state serving.
+"""
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from engine.ramanash_artifact import StateArtifact, BEAST_FIELDS, DYNAMICAL_FIELDS
+from engine.ramanash_beast import beast_from_market
+from engine.ramanash_dynamical import dynamical_from_market
+from engine.ramanash_systemic import _rolling_vol
+from engine.ramanash_kernel import MACRO_FEB_23_2026
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'data', 'bitcoin_daily_2015_2025.json')
+
+
+def _load(n=400):
+    with open(DATA_PATH) as f:
+        data = json.load(f)
+    return data['dates'][:n], data['prices'][:n]
+
+
+def test_artifact_matches_batch():
+    """Artifact rows are bit-identical to the batch BEAST and dynamical runs."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping artifact test (no data)")
+        return
+    dates, prices = _load()
+    vols = _rolling_vol(prices, 20)
+    beast = beast_from_market(prices, vols, MACRO_FEB_23_2026)
+    dyn = dynamical_from_market(prices, vols, MACRO_FEB_23_2026)
+    with tempfile.TemporaryDirectory() as tmp:
+        art = StateArtifact.build(os.path.join(tmp, "BTC"), dates, prices)
+        assert len(art) == len(prices)
+        for t, (b, d) in enumerate(zip(beast, dyn)):
+            state = art.state_at(dates[20 + 50 + t])
+            assert state["beast"] == {f: b[f] for f in BEAST_FIELDS}
+            assert state["dynamical"] == {f: d[f] for f in DYNAMICAL_FIELDS}
+        assert art.state_at(dates[30])["beast"] is None
+    print("📊 Artifact: matches beast_from_market / dynamical_from_market ✅")
+
+
+def test_artifact_skips_bad_price():
+    """A non-positive price is no step: its BEAST/dynamical row is empty, later rows are unshifted."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping bad-price test (no data)")
+        return
+    dates, prices = _load(400)
+    k = 200
+    bad = prices[:k] + [0.0] + prices[k:]
+    bad_dates = dates[:k] + ["2000-01-01"] + dates[k:]
+    with tempfile.TemporaryDirectory() as tmp:
+        art = StateArtifact.build(os.path.join(tmp, "BAD"), bad_dates, bad)
+        clean = StateArtifact.build(os.path.join(tmp, "CLEAN"), dates, prices)
+        beast_cols = [art._col[f"beast.{f}"] for f in BEAST_FIELDS]
+        dyn_cols = [art._col[f"dynamical.{f}"] for f in DYNAMICAL_FIELDS]
+        assert np.isnan(art.rows[k, beast_cols + dyn_cols]).all()
+        kept = np.delete(art.rows, k, axis=0)
+        assert np.array_equal(kept[:, 1:], clean.rows[:, 1:], equal_nan=True)
+    print("📊 Artifact: zero price skipped, recursion not advanced ✅")
+
+
+def test_artifact_extend_and_lookup():
+    """Appending bars one at a time equals building over the full history."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping artifact extend test (no data)")
+        return
+    dates, prices = _load()
+    with tempfile.TemporaryDirectory() as tmp:
+        full = StateArtifact.build(os.path.join(tmp, "FULL"), dates, prices)
+        StateArtifact.build(os.path.join(tmp, "INC"), dates[:250], prices[:250])
+        for d, p in zip(dates[250:], prices[250:]):
+            StateArtifact.load(os.path.join(tmp, "INC")).extend(d, p)
+        inc = StateArtifact.load(os.path.join(tmp, "INC"))
+        assert np.array_equal(inc.rows, full.rows, equal_nan=True)
+
+        assert inc.state_at("1999-01-01") is None
+        assert inc.state_at(dates[123])["date"] == dates[123]
+        assert inc.state_at("2099-01-01")["date"] == dates[-1]
+        try:
+            inc.extend(dates[10], 100.0)
+            raise AssertionError("out-of-order bar accepted")
+        except ValueError:
+            pass
+    print("📊 Artifact: incremental extension == rebuild, as-of lookups ✅")
+
+
+def test_api_state_endpoint():
+    """GET /api/state serves the artifact through CryptoVerifier."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping /api/state test (no data)")
+        return
+    import engine.verifier as verifier_mod
+    from backend.app import app
+
+    dates, prices = _load(200)
+    saved = verifier_mod.ARTIFACT_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        verifier_mod.ARTIFACT_DIR = Path(tmp)
+        try:
+            StateArtifact.build(os.path.join(tmp, "BTC"), dates, prices)
+            client = app.test_client()
+            r = client.get(f"/api/state?date={dates[150]}&asset=btc")
+            assert r.status_code == 200
+            body = r.get_json()
+            assert body["date"] == dates[150] and body["systemic"] is not None
+            assert client.get("/api/state?date=2015-01-01&asset=ETH").status_code == 404
+            assert client.get("/api/state").status_code == 400
+            assert client.get("/api/state?date=not-a-date&asset=BTC").status_code == 400
+            saved_flag = verifier_mod.ARTIFACT_AVAILABLE
+            verifier_mod.ARTIFACT_AVAILABLE = False
+            try:
+                assert client.get(f"/api/state?date={dates[150]}").status_code == 503
+            finally:
+                verifier_mod.ARTIFACT_AVAILABLE = saved_flag
+        finally:
+            verifier_mod.ARTIFACT_DIR = saved
+    print("📊 /api/state: serves precomputed state ✅")
+
+
+def main():
+    print("🏅 OLYMPIC STATE ARTIFACT — State as of Date")
+    print("=" * 60)
+    test_artifact_matches_batch()
+    test_artifact_skips_bad_price()
+    test_artifact_extend_and_lookup()
+    test_api_state_endpoint()
+    print("\n✅ State artifact test passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,20 +17,138 @@ from engine.ramanash_systemic import (
     liquidity_spiral_index,
     credit_stress_index,
     funding_stress_index,
+    VolPrefixIndex,
+    SystemicStream,
+    SystemicCache,
+    series_digest,
+    _rolling_vol,
 )
-from engine.ramanash_kernel import predict_macro_systemic, MACRO_FEB_23_2026
+from engine.ramanash_kernel import (
+    predict_macro,
+    predict_macro_systemic,
+    MacroRecord,
+    BIG_SHORT_SIGNALS,
+    MACRO_FEB_23_2026,
+    MACRO_TARIFF_DAY_2026,
+)
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'data', 'bitcoin_daily_2015_2025.json')
+
+
+def _load_market():
+    with open(DATA_PATH) as f:
+        data = json.load(f)
+    prices = data['prices']
+    return prices, _rolling_volatility(prices, window=20)
+
+
+def test_vol_prefix_index():
+    """Prefix-sum rolling means agree with slice-and-sum path."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping prefix index test (no data)")
+        return
+    prices, vols = _load_market()
+    idx = VolPrefixIndex(vols)
+    assert len(idx) == len(vols)
+    assert abs(idx.mean(10, 40) - sum(vols[10:40]) / 30) < 1e-12
+    assert idx.mean(5, 5, default=-1.0) == -1.0
+    for i in range(0, len(vols) - 1, 37):
+        a = systemic_stress_full(prices, vols, i)
+        b = systemic_stress_full(prices, vols, i, vol_index=idx)
+        for k in a:
+            assert abs(a[k] - b[k]) < 1e-9, f"{k} mismatch at i={i}: {a[k]} vs {b[k]}"
+    print("📊 VolPrefixIndex: rolling means match slice sums ✅")
+
+
+def test_systemic_stream_replay():
+    """SystemicStream replay is bit-identical to the batch functions."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping stream test (no data)")
+        return
+    prices, _ = _load_market()
+    prices = prices[:600]
+    vols = _rolling_vol(prices, 20)
+    stream = SystemicStream(vol_window=20)
+    for k, p in enumerate(prices):
+        out = stream.push(p)
+        i = k - 20
+        if 0 <= i < len(vols):
+            assert out == systemic_stress_full(prices, vols, i), f"stream diverged at k={k}"
+        elif i < 0:
+            assert out["systemic_stress"] == 0.0
+    assert len(stream._vols) <= SystemicStream.WINDOW_NORM + 1
+    assert stream.push(-1.0) == stream.last
+    print("📊 SystemicStream: replay matches batch exactly ✅")
+
+
+def test_systemic_cache():
+    """Cached predict_macro_systemic equals uncached; repeats are hits."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping cache test (no data)")
+        return
+    prices, vols = _load_market()
+    cache = SystemicCache(maxsize=2)
+    for idx in (300, 300, 301, 300):
+        a = predict_macro_systemic(0.04, MACRO_FEB_23_2026, prices=prices, vols=vols, vol_idx=idx, cache=cache)
+        b = predict_macro_systemic(0.04, MACRO_FEB_23_2026, prices=prices, vols=vols, vol_idx=idx, cache=None)
+        assert a == b
+    st = cache.stats()
+    assert st["hits"] == 2 and st["misses"] == 2 and st["size"] == 2
+    assert 0 < st["hit_rate"] < 1
+    # Same content in a new list object still hits; a changed price misses
+    cache.get(list(prices), list(vols), 300)
+    assert cache.hits == 3
+    changed = list(prices)
+    changed[-1] *= 1.01
+    cache.get(changed, vols, 300)
+    assert cache.misses == 3 and len(cache) == 2
+    # In-place edits anywhere are seen by the default (content) key
+    edited, edited_vols = list(prices), list(vols)
+    before = predict_macro_systemic(0.04, MACRO_FEB_23_2026, prices=edited, vols=edited_vols, vol_idx=300, cache=cache)
+    edited[315] *= 1.3
+    edited_vols[:] = _rolling_volatility(edited, window=20)
+    after = predict_macro_systemic(0.04, MACRO_FEB_23_2026, prices=edited, vols=edited_vols, vol_idx=300, cache=cache)
+    assert after == predict_macro_systemic(0.04, MACRO_FEB_23_2026, prices=edited, vols=edited_vols, vol_idx=300, cache=None)
+    assert after["nash_eq"] != before["nash_eq"]
+    # Opt-in: hash once, pass the digest
+    d = series_digest(prices, vols)
+    hits = cache.hits
+    assert cache.get(prices, vols, 300, digest=d) == systemic_stress_full(prices, vols, 300)
+    assert cache.hits == hits + 1
+    r = predict_macro_systemic(0.04, MACRO_FEB_23_2026, prices=prices, vols=vols, vol_idx=300, cache=cache, series_digest=d)
+    assert r == predict_macro_systemic(0.04, MACRO_FEB_23_2026, prices=prices, vols=vols, vol_idx=300, cache=None)
+    print(f"📊 Systemic cache: hit_rate={cache.stats()['hit_rate']:.2f}, bounded LRU ✅")
+
+
+def test_macro_record():
+    """as_record=True carries the same numbers as the dict result, macro-only and systemic."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping record test (no data)")
+        return
+    prices, vols = _load_market()
+    for macro in (MACRO_FEB_23_2026, MACRO_TARIFF_DAY_2026):
+        for kw in ({}, dict(prices=prices, vols=vols, vol_idx=700), dict(prices=prices[:200], vols=vols, vol_idx=700)):
+            d = predict_macro_systemic(0.04, macro, rank=0.95, **kw)
+            rec = predict_macro_systemic(0.04, macro, rank=0.95, as_record=True, **kw)
+            assert isinstance(rec, MacroRecord)
+            assert (rec.ramanash_vol, rec.nash_eq, rec.nash_score, rec.macro_stress) == (
+                d["ramanash_vol"], d["nash_eq"], d["nash_score"], d["macro_stress"])
+            assert BIG_SHORT_SIGNALS[rec.signal] == d["big_short_signal"]
+            assert rec.systemic_stress == d.get("systemic_stress")
+        # Macro-only systemic path is predict_macro
+        m = predict_macro(0.04, macro, rank=0.95)
+        r = predict_macro_systemic(0.04, macro, rank=0.95)
+        assert {k: v for k, v in r.items() if k != "macro_stress"} == m
+        assert predict_macro(0.04, macro, rank=0.95, as_record=True).ramanash_vol == m["ramanash_vol"]
+    print("📊 MacroRecord: numeric fast path == dict result ✅")
 
 
 def main():
-    data_path = os.path.join(os.path.dirname(__file__), 'data', 'bitcoin_daily_2015_2025.json')
-    if not os.path.exists(data_path):
+    if not os.path.exists(DATA_PATH):
         print("⏭️  Skipping (no data)")
         return
 
-    with open(data_path) as f:
-        data = json.load(f)
-    prices = data['prices']
-    vols = _rolling_volatility(prices, window=20)
+    prices, vols = _load_market()
 
     print("🏅 OLYMPIC SYSTEMIC LAYER — Leverage, Liquidity, Credit, Funding")
     print("=" * 60)
@@ -60,6 +178,11 @@ def main():
     assert r2["nash_eq"] != 0  # macro produces non-zero
     print(f"\n  Macro-only fallback: nash_eq={r2['nash_eq']:.4f}")
 
+    test_vol_prefix_index()
+    test_systemic_stream_replay()
+    test_systemic_cache()
+    test_macro_record()
+
     print("\n✅ Systemic layer test passed")
 
 
@@ -0,0 +1,98 @@
+"""
+🏅 OLYMPIC: Systemic Panel — Assets × Days in One Pass
+
+Validates: panel mode matches the scalar systemic layer per asset,
+missing days stay NaN, thread-pool blocks and memmap chunks give the same answer.
+"""
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from engine.ramanash_panel import systemic_panel, systemic_memmap, PANEL_FIELDS
+from engine.ramanash_systemic import systemic_stress_full, _rolling_vol
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'data', 'bitcoin_daily_2015_2025.json')
+
+
+def _panel_prices(n_days=700):
+    with open(DATA_PATH) as f:
+        prices = np.array(json.load(f)['prices'][:n_days])
+    rng = np.random.default_rng(7)
+    panel = np.vstack([
+        prices,
+        prices * np.exp(np.cumsum(rng.normal(0, 0.01, n_days))),
+        prices[::-1].copy(),
+    ])
+    panel[1, 200:212] = np.nan
+    panel[2, 3] = -1.0
+    return panel
+
+
+def test_panel_matches_scalar():
+    """Every asset agrees with systemic_stress_full on its valid days."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping panel test (no data)")
+        return
+    panel = _panel_prices()
+    out = systemic_panel(panel)
+    assert set(out) == set(PANEL_FIELDS)
+    for a in range(panel.shape[0]):
+        valid = np.isfinite(panel[a]) & (panel[a] > 0)
+        days = np.nonzero(valid)[0]
+        prices = panel[a][valid].tolist()
+        vols = _rolling_vol(prices, 20)
+        for j in range(20, 20 + len(vols), 11):
+            s = systemic_stress_full(prices, vols, j - 20)
+            for key, val in s.items():
+                assert abs(out[key][a, days[j]] - val) < 1e-9, f"{key} asset={a} j={j}"
+        assert np.all(np.isnan(out["systemic_stress"][a, ~valid]))
+    print("📊 Panel: matches scalar systemic layer per asset ✅")
+
+
+def test_panel_thread_blocks():
+    """Thread-pool block split is identical to the serial run."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping panel thread test (no data)")
+        return
+    panel = _panel_prices()
+    serial = systemic_panel(panel)
+    threaded = systemic_panel(panel, workers=3, block_size=1)
+    for key in PANEL_FIELDS:
+        assert np.array_equal(serial[key], threaded[key], equal_nan=True), key
+    print("📊 Panel: threaded blocks identical to serial ✅")
+
+
+def test_memmap_chunks_identical():
+    """Chunked memmap driver is bit-identical to the in-memory panel run."""
+    if not os.path.exists(DATA_PATH):
+        print("⏭️  Skipping memmap test (no data)")
+        return
+    prices = _panel_prices(1500)[0]
+    full = systemic_panel(prices)
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "prices.f64")
+        prices.astype("<f8").tofile(src)
+        for chunk_size in (1, 37, 400, 10_000):
+            out = systemic_memmap(src, os.path.join(tmp, "systemic.npy"), chunk_size=chunk_size)
+            for f, key in enumerate(PANEL_FIELDS):
+                assert np.array_equal(out[f], full[key][0], equal_nan=True), f"{key} chunk={chunk_size}"
+            del out
+    print("📊 Memmap: chunked output identical to in-memory ✅")
+
+
+def main():
+    print("🏅 OLYMPIC SYSTEMIC PANEL — Assets × Days")
+    print("=" * 60)
+    test_panel_matches_scalar()
+    test_panel_thread_blocks()
+    test_memmap_chunks_identical()
+    print("\n✅ Systemic panel test passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -46,6 +46,9 @@ python tests/olympic_macro_sensitivity.py
 echo -e "\n13. Systemic Layer (LCI, LSI, CSI, FSI)"
 python tests/olympic_systemic_layer.py
 
+echo -e "\n13b. Systemic Panel (Assets × Days)"
+python tests/olympic_systemic_panel.py
+
 echo -e "\n14. Dynamical Engine (State Memory, Convex Amplification)"
 python tests/olympic_dynamical_engine.py
 
@@ -58,4 +61,28 @@ python tests/olympic_dominance_battery.py
 echo -e "\n17. Cross-Asset Validation"
 python tests/olympic_cross_asset.py
 
+echo -e "\n18. Quantized Storage (int16 / float16)"
+python tests/olympic_quantized_storage.py
+
+echo -e "\n19. State Artifact (State as of Date)"
+python tests/olympic_state_artifact.py
+
+echo -e "\n20. Contagion (Rolling Cross-Asset Covariance)"
+python tests/olympic_contagion.py
+
+echo -e "\n21. Episode Index (Run-Length Trigger / Tail Episodes)"
+python tests/olympic_episodes.py
+
+echo -e "\n22. Scenario Runner (Shared Systemic, Pooled Macro Scenarios)"
+python tests/olympic_scenarios.py
+
+echo -e "\n23. Stability Scan (Empirical ρ, β, α Maps)"
+python tests/olympic_stability_scan.py
+
+echo -e "\n24. Fused Pipeline (BEAST + Dynamical)"
+python tests/olympic_market_frames.py
+
+echo -e "\n25. Checkpoint (Resumable BEAST / Dynamical Runs)"
+python tests/olympic_checkpoint.py
+
 echo -e "\n🏅 OLYMPIC VALIDATION COMPLETE"